@@ -22,6 +22,14 @@ class VocaMainApp(App):
                 self.store.backup_if_changed()
         except Exception:
             pass
+        try:
+            self.root.tts.flush_cache()
+        except Exception:
+            pass
+        try:
+            self.root.events.close()
+        except Exception:
+            pass
 
 if __name__ == "__main__":
     VocaMainApp().run()
\ No newline at end of file
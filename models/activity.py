@@ -0,0 +1,167 @@
+from __future__ import annotations
+import datetime as _dt
+from collections import Counter
+import numpy as np
+
+def _parse_day(ds) -> int | None:
+    try:
+        return _dt.date.fromisoformat((ds or "").strip()).toordinal()
+    except Exception:
+        return None
+
+class DayCounts:
+    # Zähler pro Kalendertag (Index = date.toordinal() - base). Änderungen sind O(1),
+    # die Präfixsummen werden erst bei der nächsten Abfrage einmal (vektorisiert) neu gebildet.
+    def __init__(self, base: int | None = None, counts=None):
+        self._base = base
+        self._counts = np.asarray(counts if counts is not None else [], dtype=np.int32)
+        self._prefix = None
+        self.listeners = []  # cb(ordinal, neuer Tageswert), z. B. die Heatmap im Dashboard
+
+    def _ensure(self, day: int):
+        if self._base is None or not len(self._counts):
+            self._base = day
+            self._counts = np.zeros(1, dtype=np.int32)
+            return
+        if day < self._base:
+            pad = max(self._base - day, 366)
+            self._counts = np.concatenate([np.zeros(pad, dtype=np.int32), self._counts])
+            self._base -= pad
+        elif day >= self._base + len(self._counts):
+            grow = max(day - self._base - len(self._counts) + 1, 366)
+            self._counts = np.concatenate([self._counts, np.zeros(grow, dtype=np.int32)])
+
+    def add(self, day: _dt.date | int, n: int = 1):
+        d = day if isinstance(day, int) else day.toordinal()
+        self._ensure(d)
+        self._counts[d - self._base] += n
+        self._prefix = None
+        for cb in list(self.listeners):
+            cb(d, int(self._counts[d - self._base]))
+
+    def _prefix_sums(self) -> np.ndarray:
+        if self._prefix is None:
+            self._prefix = np.concatenate([[0], np.cumsum(self._counts, dtype=np.int64)])
+        return self._prefix
+
+    def _clamp(self, d: int) -> int:
+        return min(max(d - self._base, 0), len(self._counts))
+
+    def range_sum(self, start: _dt.date, end: _dt.date) -> int:
+        if self._base is None or end < start:
+            return 0
+        p = self._prefix_sums()
+        return int(p[self._clamp(end.toordinal() + 1)] - p[self._clamp(start.toordinal())])
+
+    def count(self, day: _dt.date) -> int:
+        return self.range_sum(day, day)
+
+    def counts_between(self, start: _dt.date, end: _dt.date) -> np.ndarray:
+        n = max(0, end.toordinal() - start.toordinal() + 1)
+        out = np.zeros(n, dtype=np.int32)
+        if self._base is None or not n:
+            return out
+        s, e = start.toordinal() - self._base, end.toordinal() - self._base + 1
+        lo, hi = max(s, 0), min(e, len(self._counts))
+        if lo < hi:
+            out[lo - s:hi - s] = self._counts[lo:hi]
+        return out
+
+    def first_day(self) -> _dt.date | None:
+        if self._base is None:
+            return None
+        nz = np.nonzero(self._counts)[0]
+        return _dt.date.fromordinal(self._base + int(nz[0])) if len(nz) else None
+
+    def total(self) -> int:
+        return int(self._prefix_sums()[-1]) if self._base is not None else 0
+
+    @classmethod
+    def from_days(cls, days: dict[int, int]) -> DayCounts:
+        # {ordinal: anzahl} -> Zähler in einem Schritt
+        if not days:
+            return cls()
+        base = min(days)
+        counts = np.zeros(max(days) - base + 1, dtype=np.int32)
+        for d, n in days.items():
+            counts[d - base] += n
+        return cls(base, counts)
+
+class LearnedLog(dict):
+    # learned_log (Wort -> ISO-Datum) mit mitgeführten Tageszählern für das Dashboard.
+    # Die Zähler werden beim Laden immer aus dem Log gebildet (nicht gespeichert), damit sie
+    # nie auseinanderlaufen; geparst wird nur jedes verschiedene Datum einmal.
+    # listeners bleibt über clear() und adopt_listeners() (neues Log) hinweg dieselbe Liste;
+    # cb(None, None) heißt: alle Tage haben sich geändert, neu lesen.
+    def __init__(self, data=None):
+        super().__init__(data or {})
+        self.listeners = []
+        days: dict[int, int] = {}
+        for ds, n in Counter(self.values()).items():
+            d = _parse_day(ds)
+            if d is not None:
+                days[d] = days.get(d, 0) + n
+        self.day_counts = DayCounts.from_days(days)
+        self.day_counts.listeners = self.listeners
+
+    def _reset_notify(self):
+        for cb in list(self.listeners):
+            cb(None, None)
+
+    def adopt_listeners(self, old: LearnedLog):
+        # ersetzt dieses Log ein anderes (z. B. nach dem Laden), hängen dessen Beobachter nun hier
+        self.listeners = self.day_counts.listeners = old.listeners
+        self._reset_notify()
+
+    def _dec(self, ds):
+        d = _parse_day(ds)
+        if d is not None:
+            self.day_counts.add(d, -1)
+
+    def __setitem__(self, key, value):
+        if key in self:
+            self._dec(dict.__getitem__(self, key))
+        super().__setitem__(key, value)
+        d = _parse_day(value)
+        if d is not None:
+            self.day_counts.add(d)
+
+    def __delitem__(self, key):
+        self._dec(dict.__getitem__(self, key))
+        super().__delitem__(key)
+
+    _missing = object()
+
+    def pop(self, key, default=_missing):
+        if key in self:
+            value = super().pop(key)
+            self._dec(value)
+            return value
+        if default is LearnedLog._missing:
+            raise KeyError(key)
+        return default
+
+    def popitem(self):
+        key, value = super().popitem()
+        self._dec(value)
+        return key, value
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args, **kwargs):
+        for k, v in dict(*args, **kwargs).items():
+            self[k] = v
+
+    def __ior__(self, other):
+        # log |= {...} geht sonst an den Zählern vorbei
+        self.update(other)
+        return self
+
+    def clear(self):
+        super().clear()
+        self.day_counts = DayCounts()
+        self.day_counts.listeners = self.listeners
+        self._reset_notify()
@@ -0,0 +1,271 @@
+from __future__ import annotations
+import json
+import re
+from array import array
+from pathlib import Path
+
+LEVELS = ("A1", "A2", "B1", "B2", "C1", "C2")
+USER_DECK = "user"
+_LEVEL_RE = re.compile(r"^(a1|a2|b1|b2|c1|c2)(?:_|$)", re.I)
+
+class TrackedSet(set):
+    # set, das Hinzufügen/Entfernen einzelner Elemente meldet (für inkrementelle Zähler)
+    __slots__ = ("_on_add", "_on_remove")
+
+    def __init__(self, items=(), on_add=None, on_remove=None):
+        super().__init__(items)
+        self._on_add = on_add or (lambda x: None)
+        self._on_remove = on_remove or (lambda x: None)
+
+    def add(self, x):
+        if x not in self:
+            super().add(x)
+            self._on_add(x)
+
+    def discard(self, x):
+        if x in self:
+            super().discard(x)
+            self._on_remove(x)
+
+    def remove(self, x):
+        super().remove(x)
+        self._on_remove(x)
+
+    def pop(self):
+        x = super().pop()
+        self._on_remove(x)
+        return x
+
+    def clear(self):
+        items = list(self)
+        super().clear()
+        for x in items:
+            self._on_remove(x)
+
+    def update(self, *others):
+        for it in others:
+            for x in it:
+                self.add(x)
+
+    def difference_update(self, *others):
+        for it in others:
+            for x in list(it):
+                self.discard(x)
+
+    def intersection_update(self, *others):
+        keep = set.intersection(set(self), *others)
+        for x in [x for x in self if x not in keep]:
+            self.discard(x)
+
+    def symmetric_difference_update(self, other):
+        for x in set(other):
+            if x in self:
+                self.discard(x)
+            else:
+                self.add(x)
+
+    def __ior__(self, other):
+        self.update(other); return self
+
+    def __isub__(self, other):
+        self.difference_update(other); return self
+
+    def __iand__(self, other):
+        self.intersection_update(other); return self
+
+    def __ixor__(self, other):
+        self.symmetric_difference_update(other); return self
+
+class Deck:
+    __slots__ = ("id", "name", "kind", "path")
+
+    def __init__(self, deck_id: str, name: str, kind: str, path: Path | None = None):
+        self.id = deck_id
+        self.name = name
+        self.kind = kind    # "level" | "topic" | "user"
+        self.path = path
+
+def read_deck_words(path) -> list[str]:
+    # gleiches Format wie die B1-Liste: {"words": [...]} oder direkt eine Liste
+    with open(path, "r", encoding="utf-8") as f:
+        obj = json.load(f)
+    items = obj.get("words", []) if isinstance(obj, dict) else obj
+    out, seen = [], set()
+    for w in items or []:
+        if not isinstance(w, str):
+            continue
+        lw = w.strip().lower()
+        if len(lw) >= 2 and lw not in seen:
+            seen.add(lw)
+            out.append(lw)
+    return out
+
+class DeckRegistry:
+    # Decks (A1–C2, Themen, eigene Wörter) über einer gemeinsamen Wort-ID-Tabelle.
+    # Mitgliedschaft = array('I') der Wort-IDs, geladen erst bei Aktivierung. Pro Wort wird
+    # gehalten, ob es im Vokabular ist (present) und wie oft es in einer "erledigt"-Menge steht
+    # (marks: gezeigt/bekannt/neu/entfernt); daraus laufen die Restzähler je Deck inkrementell mit.
+    def __init__(self, res_dir, reader=None):
+        res_dir = Path(res_dir)
+        self._reader = reader or read_deck_words
+        self._decks: dict[str, Deck] = {}
+        legacy = res_dir / "b1_word_from_cambridge.json"
+        if legacy.exists():
+            self._decks["b1"] = Deck("b1", "B1", "level", legacy)
+        deck_dir = res_dir / "decks"
+        for p in sorted(deck_dir.glob("*.json")) if deck_dir.is_dir() else ():
+            deck_id = p.stem.lower()
+            m = _LEVEL_RE.match(deck_id)
+            if m and m.group(1).lower() == deck_id and deck_id in self._decks:
+                continue    # eingebaute Liste hat Vorrang
+            if m:
+                name = m.group(1).upper() + (" " + deck_id[3:].replace("_", " ").title() if len(deck_id) > 2 else "")
+                self._decks[deck_id] = Deck(deck_id, name.strip(), "level", p)
+            else:
+                self._decks[deck_id] = Deck(deck_id, deck_id.replace("_", " ").title(), "topic", p)
+        self._decks[USER_DECK] = Deck(USER_DECK, "My words", "user")
+
+        self._ids: dict[str, int] = {}
+        self._words: list[str] = []
+        self._present = bytearray()
+        self._marks = bytearray()
+        self._mask: list[int] = []           # Bit je geladenem Deck
+        self._bits: dict[str, int] = {}
+        self._members: dict[str, array] = {}
+        self._remaining: dict[str | None, int] = {None: 0}
+
+    # ---- Decks ----
+    def decks(self) -> list[Deck]:
+        order = {lvl.lower(): i for i, lvl in enumerate(LEVELS)}
+        kinds = {"level": 0, "topic": 1, "user": 2}
+        return sorted(self._decks.values(), key=lambda d: (kinds[d.kind], order.get(d.id[:2], 99), d.name.lower()))
+
+    def get(self, deck_id: str) -> Deck | None:
+        return self._decks.get(deck_id)
+
+    def is_loaded(self, deck_id: str) -> bool:
+        return deck_id in self._members
+
+    def load(self, deck_id: str) -> list[str]:
+        # Deck einlesen (nur beim ersten Mal) und Wörter für das Vokabular zurückgeben
+        deck = self._decks[deck_id]
+        if deck_id not in self._members:
+            words = self._reader(deck.path) if deck.path is not None else []
+            bit = self._bits[deck_id] = 1 << len(self._bits)
+            ids = array("I", sorted(self._id(w) for w in words))
+            self._members[deck_id] = ids
+            count = 0
+            for i in ids:
+                self._mask[i] |= bit
+                if self._present[i] and not self._marks[i]:
+                    count += 1
+            self._remaining[deck_id] = count
+        return self.words(deck_id)
+
+    def words(self, deck_id: str) -> list[str]:
+        ids = self._members.get(deck_id, ())
+        return [self._words[i] for i in ids]
+
+    def size(self, deck_id: str) -> int:
+        return len(self._members.get(deck_id, ()))
+
+    def remaining(self, deck_id: str | None = None) -> int:
+        # None = alle Wörter des Vokabulars; O(1)
+        return self._remaining.get(deck_id, 0)
+
+    def eligible(self, deck_id: str | None = None) -> list[str]:
+        # noch nicht gezeigte/bearbeitete Wörter des Decks (bzw. des ganzen Vokabulars)
+        present, marks, words = self._present, self._marks, self._words
+        ids = range(len(words)) if deck_id is None else self._members.get(deck_id, ())
+        return [words[i] for i in ids if present[i] and not marks[i]]
+
+    def add_member(self, deck_id: str, word: str):
+        # für das Deck der eigenen Wörter (wächst zur Laufzeit)
+        if deck_id not in self._members:
+            self.load(deck_id)
+        i = self._id(word)
+        bit = self._bits[deck_id]
+        if self._mask[i] & bit:
+            return
+        self._mask[i] |= bit
+        self._members[deck_id].append(i)
+        if self._present[i] and not self._marks[i]:
+            self._remaining[deck_id] += 1
+
+    def reset_members(self, deck_id: str, words):
+        # Mitgliedschaft komplett ersetzen (z. B. eigene Wörter nach dem Laden des Spielstands)
+        if deck_id not in self._members:
+            self.load(deck_id)
+        bit = self._bits[deck_id]
+        for i in self._members[deck_id]:
+            self._mask[i] &= ~bit
+        ids = array("I", sorted({self._id(w) for w in words}))
+        for i in ids:
+            self._mask[i] |= bit
+        self._members[deck_id] = ids
+        present, marks = self._present, self._marks
+        self._remaining[deck_id] = sum(1 for i in ids if present[i] and not marks[i])
+
+    def remove_member(self, deck_id: str, word: str):
+        i = self._ids.get((word or "").lower())
+        bit = self._bits.get(deck_id)
+        if i is None or bit is None or not self._mask[i] & bit:
+            return
+        self._mask[i] &= ~bit
+        ids = self._members[deck_id]
+        del ids[ids.index(i)]
+        if self._present[i] and not self._marks[i]:
+            self._remaining[deck_id] -= 1
+
+    # ---- Wortstatus ----
+    def _id(self, word: str) -> int:
+        w = (word or "").lower()
+        i = self._ids.get(w)
+        if i is None:
+            i = self._ids[w] = len(self._words)
+            self._words.append(w)
+            self._present.append(0)
+            self._marks.append(0)
+            self._mask.append(0)
+        return i
+
+    def _shift(self, i: int, delta: int):
+        # Wort i wird verfügbar (+1) bzw. nicht mehr verfügbar (-1)
+        self._remaining[None] += delta
+        mask = self._mask[i]
+        if mask:
+            for deck_id, bit in self._bits.items():
+                if mask & bit:
+                    self._remaining[deck_id] += delta
+
+    def set_present(self, word: str, present: bool):
+        i = self._id(word)
+        if bool(self._present[i]) == present:
+            return
+        self._present[i] = 1 if present else 0
+        if not self._marks[i]:
+            self._shift(i, 1 if present else -1)
+
+    def mark(self, word: str, delta: int):
+        # delta +1: Wort kam in eine Status-Menge, -1: wurde daraus entfernt
+        i = self._id(word)
+        before = self._marks[i]
+        after = max(0, min(255, before + delta))
+        self._marks[i] = after
+        if self._present[i] and bool(before) != bool(after):
+            self._shift(i, -1 if after else 1)
+
+    def reset(self, vocabulary, status_sets):
+        # kompletter Neuaufbau der Zähler (Start, Laden eines Spielstands)
+        self._present = bytearray(len(self._words))
+        self._marks = bytearray(len(self._words))
+        for w in vocabulary:
+            self._present[self._id(w)] = 1
+        for s in status_sets:
+            for w in s:
+                i = self._id(w)
+                self._marks[i] = min(255, self._marks[i] + 1)
+        present, marks = self._present, self._marks
+        self._remaining = {None: sum(1 for i in range(len(self._words)) if present[i] and not marks[i])}
+        for deck_id, ids in self._members.items():
+            self._remaining[deck_id] = sum(1 for i in ids if present[i] and not marks[i])
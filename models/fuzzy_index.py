@@ -0,0 +1,89 @@
+from __future__ import annotations
+from collections import defaultdict
+
+def edit_distance(a: str, b: str, max_distance: int) -> int:
+    # Damerau-Levenshtein (optimal string alignment) mit Abbruch, sobald max_distance sicher überschritten ist
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    prev2 = None
+    prev = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        cur = [i] + [0] * len(b)
+        row_min = i
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            v = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                v = min(v, prev2[j - 2] + 1)
+            cur[j] = v
+            if v < row_min:
+                row_min = v
+        if row_min > max_distance:
+            return max_distance + 1
+        prev2, prev = prev, cur
+    return prev[-1]
+
+class FuzzyIndex:
+    # SymSpell-artiges Lösch-Wörterbuch: jede Variante des Wortpräfixes mit bis zu max_distance
+    # gelöschten Zeichen zeigt auf die Wörter. Eine Abfrage erzeugt dieselben Varianten und
+    # prüft nur die wenigen Kandidaten mit der echten Editierdistanz.
+    def __init__(self, words=(), max_distance: int = 2, prefix_length: int = 7):
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self._deletes: dict[str, set[str]] = defaultdict(set)
+        self._words: dict[str, str] = {}
+        for w in words:
+            self.add(w)
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    def _variants(self, key: str) -> set[str]:
+        out = {key[:self.prefix_length]}
+        frontier = set(out)
+        for _ in range(self.max_distance):
+            nxt = set()
+            for s in frontier:
+                for i in range(len(s)):
+                    nxt.add(s[:i] + s[i + 1:])
+            nxt -= out
+            out |= nxt
+            frontier = nxt
+        return out
+
+    def add(self, word: str):
+        key = (word or "").strip().lower()
+        if not key or key in self._words:
+            return
+        self._words[key] = word
+        for v in self._variants(key):
+            self._deletes[v].add(key)
+
+    def remove(self, word: str):
+        key = (word or "").strip().lower()
+        if self._words.get(key) != word:
+            return
+        del self._words[key]
+        for v in self._variants(key):
+            s = self._deletes.get(v)
+            if s is not None:
+                s.discard(key)
+                if not s:
+                    del self._deletes[v]
+
+    def lookup(self, term: str, max_distance: int | None = None, limit: int = 5) -> list[tuple[str, int]]:
+        # [(wort, distanz)] nach Distanz, dann alphabetisch; das Wort selbst (Distanz 0) inklusive
+        key = (term or "").strip().lower()
+        if not key:
+            return []
+        d = self.max_distance if max_distance is None else min(max_distance, self.max_distance)
+        cand = set()
+        for v in self._variants(key):
+            cand |= self._deletes.get(v, set())
+        hits = []
+        for c in cand:
+            dist = edit_distance(key, c, d)
+            if dist <= d:
+                hits.append((dist, c))
+        hits.sort()
+        return [(self._words[c], dist) for dist, c in hits[:limit]]
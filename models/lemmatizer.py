@@ -0,0 +1,126 @@
+from __future__ import annotations
+import re
+
+# unregelmäßige Formen -> Grundform (Verben, Plurale, Steigerungen)
+_IRREGULAR = """
+am:be is:be are:be was:be were:be been:be being:be has:have had:have having:have does:do did:do done:do
+went:go gone:go goes:go ate:eat eaten:eat saw:see seen:see took:take taken:take gave:give given:give
+came:come became:become began:begin begun:begin broke:break broken:break brought:bring bought:buy
+built:build caught:catch chose:choose chosen:choose cut:cut drew:draw drawn:draw drank:drink drunk:drink
+drove:drive driven:drive fell:fall fallen:fall felt:feel fought:fight found:find flew:fly flown:fly
+forgot:forget forgotten:forget forgave:forgive forgiven:forgive froze:freeze frozen:freeze got:get gotten:get
+grew:grow grown:grow hung:hang heard:hear hid:hide hidden:hide held:hold hurt:hurt kept:keep knew:know
+known:know laid:lay led:lead left:leave lent:lend lay:lie lain:lie lost:lose made:make meant:mean met:meet
+paid:pay rode:ride ridden:ride rang:ring rung:ring rose:rise risen:rise ran:run said:say sold:sell sent:send
+set:set shook:shake shaken:shake shone:shine shot:shoot shown:show shut:shut sang:sing sung:sing sank:sink
+sunk:sink sat:sit slept:sleep slid:slide spoke:speak spoken:speak spent:spend spread:spread stood:stand
+stole:steal stolen:steal stuck:stick stung:sting struck:strike swore:swear sworn:swear swept:sweep swam:swim
+swum:swim swung:swing taught:teach tore:tear torn:tear told:tell thought:think threw:throw thrown:throw
+understood:understand woke:wake woken:wake wore:wear worn:wear won:win wrote:write written:write
+bit:bite bitten:bite blew:blow blown:blow bled:bleed bred:breed dealt:deal dug:dig fed:feed fled:flee
+knelt:kneel leapt:leap lit:light meant:mean overcame:overcome sought:seek sped:speed spun:spin split:split
+withdrew:withdraw withdrawn:withdraw dying:die lying:lie tying:tie doing:do going:go
+children:child men:man women:woman feet:foot teeth:tooth geese:goose mice:mouse people:person
+lives:life knives:knife wives:wife leaves:leaf halves:half wolves:wolf shelves:shelf thieves:thief
+analyses:analysis crises:crisis phenomena:phenomenon criteria:criterion data:datum media:medium
+better:good best:good worse:bad worst:bad more:much most:much less:little least:little further:far
+farther:far furthest:far farthest:far
+"""
+EXCEPTIONS: dict[str, str] = dict(p.split(":") for p in _IRREGULAR.split())
+# sehen flektiert aus, sind es aber nicht
+NO_STEM = frozenset("""
+news series species means physics mathematics economics politics athletics always perhaps lens
+thus unless during thing nothing something anything everything morning evening ceiling wedding
+""".split())
+
+# Formen, die zugleich eigenständige Wörter sind (saw = Säge, left = links, lives = leben):
+# beim Hinzufügen nie automatisch als Flexion aussortieren
+AMBIGUOUS = frozenset("""
+saw left bit found lives felt lay lit rose fell spoke leaves
+""".split())
+
+_VOWELS = set("aeiou")
+
+def _undouble(base: str) -> str | None:
+    # stopped -> stop, running -> run
+    if len(base) >= 3 and base[-1] == base[-2] and base[-1] not in _VOWELS and base[-1] not in "lsz":
+        return base[:-1]
+    return None
+
+def _short_cvc(base: str) -> bool:
+    # einsilbig, endet auf Konsonant-Vokal-Konsonant (tap, win, star): solche Verben verdoppeln
+    # vor -ed/-ing (tapping), "taping" kommt also nicht von "tap"
+    if len(base) < 3 or base[-1] in _VOWELS or base[-1] in "wxy" or base[-2] not in _VOWELS or base[-3] in _VOWELS:
+        return False
+    return len(re.findall("[aeiou]+", base)) == 1
+
+def _suffix_forms(w: str) -> list[str]:
+    # bewusst konservativ: -er/-est/-ly nur über -ier/-iest/-ily, sonst zu viele Fehltreffer
+    # (number -> numb, forest -> for, early -> ear). Reihenfolge = Priorität: die Form mit "e"
+    # vor der ohne (saves -> save, nicht safe; hating -> hate, nicht hat)
+    out = []
+    n = len(w)
+    if w.endswith("'s"):
+        out.append(w[:-2])
+    if n > 4 and w.endswith("ies"):
+        out.append(w[:-3] + "y")
+    if n > 3 and w.endswith("s") and not w.endswith(("ss", "us", "is")):
+        out.append(w[:-1])
+    if n > 4 and w.endswith("es"):
+        out.append(w[:-2])
+    if n > 4 and w.endswith("ves"):
+        out += [w[:-3] + "f", w[:-3] + "fe"]
+    if n > 4 and w.endswith("ied"):
+        out.append(w[:-3] + "y")
+    elif n > 4 and w.endswith("ed"):
+        base = w[:-2]
+        out += [w[:-1], None if _short_cvc(base) else base, _undouble(base)]
+    if n > 4 and w.endswith("ing"):
+        base = w[:-3]
+        out += [base + "e", None if _short_cvc(base) else base, _undouble(base)]
+    if n > 4 and w.endswith("ier"):
+        out.append(w[:-3] + "y")
+    if n > 5 and w.endswith("iest"):
+        out.append(w[:-4] + "y")
+    if n > 4 and w.endswith("ily"):
+        out.append(w[:-3] + "y")
+    return out
+
+_candidate_cache: dict[str, tuple[str, ...]] = {}
+
+def candidates(word: str) -> tuple[str, ...]:
+    # mögliche Grundformen (ohne das Wort selbst), in Prioritätsreihenfolge; rein regelbasiert
+    w = (word or "").lower()
+    hit = _candidate_cache.get(w)
+    if hit is None:
+        forms = [] if w in NO_STEM else [c for c in _suffix_forms(w) if c and len(c) >= 3]
+        if w in EXCEPTIONS:
+            forms.insert(0, EXCEPTIONS[w])
+        seen = {w}
+        hit = tuple(c for c in forms if not (c in seen or seen.add(c)))
+        if len(_candidate_cache) < 200_000:
+            _candidate_cache[w] = hit
+    return hit
+
+class Lemmatizer:
+    # Bildet Flexionsformen auf ein bekanntes Wort ab (arrived -> arrive, wenn "arrive" bekannt ist).
+    # Das Ergebnis wird pro Token gecacht; clear() bei Änderungen am Vokabular.
+    def __init__(self, is_known):
+        self._is_known = is_known
+        self._cache: dict[str, str] = {}
+
+    def clear(self):
+        self._cache = {}
+
+    def lemma(self, word: str) -> str:
+        w = (word or "").lower()
+        hit = self._cache.get(w)
+        if hit is None:
+            hit = w
+            if not self._is_known(w):
+                for c in candidates(w):
+                    if self._is_known(c):
+                        hit = c
+                        break
+            self._cache[w] = hit
+        return hit
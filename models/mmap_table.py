@@ -0,0 +1,45 @@
+from __future__ import annotations
+import mmap
+import struct
+import sys
+from array import array
+
+class MappedTable:
+    # Read-only-Sicht auf eine Binärtabelle per mmap: Kopf (struct, erstes Feld = Magic), danach
+    # Spalten fester Breite (little-endian), die nacheinander mit column() gelesen werden.
+    # Auf little-endian-Systemen sind die Spalten memoryviews direkt auf die Datei, sonst Kopien.
+    # Fehler (fehlende Datei, falsches Magic, zu kurz) werfen eine Exception; der Aufrufer räumt per close() auf.
+    def __init__(self, path, header: struct.Struct, magic: bytes):
+        self.mm = None
+        self._views: list[memoryview] = []
+        with open(path, "rb") as f:
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.header = header.unpack_from(self.mm, 0)
+        if self.header[0] != magic:
+            raise ValueError(f"bad table header in {path}")
+        self.pos = header.size
+
+    def column(self, typecode: str, count: int):
+        size = array(typecode).itemsize * count
+        off = self.pos
+        if off + size > len(self.mm):
+            raise ValueError("truncated table")
+        if sys.byteorder == "little":
+            col = memoryview(self.mm)[off:off + size].cast(typecode)
+            self._views.append(col)
+        else:
+            col = array(typecode, self.mm[off:off + size])
+            col.byteswap()
+        self.pos = off + size
+        return col
+
+    def close(self):
+        for mv in self._views:
+            mv.release()
+        self._views = []
+        if self.mm is not None:
+            try:
+                self.mm.close()
+            except Exception:
+                pass
+        self.mm = None
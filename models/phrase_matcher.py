@@ -0,0 +1,106 @@
+from __future__ import annotations
+import re
+from collections import deque
+
+# gleiche Tokenisierung wie die Textprüfung: mother-in-law bleibt ein Token
+_WORD_RE = re.compile(r"[A-Za-z]+(?:[-'][A-Za-z]+)*")
+
+def phrase_tokens(phrase: str) -> tuple[str, ...]:
+    return tuple(t.lower() for t in _WORD_RE.findall((phrase or "").replace("’", "'")))
+
+class PhraseMatcher:
+    # Aho-Corasick auf Wortebene über die gespeicherten Ausdrücke: ein linearer Durchlauf
+    # über die Token findet alle Ausdrücke, auch überlappende. Neue Ausdrücke werden direkt
+    # in den Trie eingefügt; die Fehlerlinks werden erst bei der nächsten Suche neu berechnet.
+    def __init__(self, phrases=()):
+        self._goto: list[dict[str, int]] = [{}]
+        self._out: list[str | None] = [None]
+        self._fail: list[int] = [0]
+        self._hits: list[tuple[str, ...]] = [()]
+        self._phrases: dict[tuple[str, ...], str] = {}
+        self._dirty = False
+        for p in phrases:
+            self.add(p)
+
+    def __len__(self) -> int:
+        return len(self._phrases)
+
+    def add(self, phrase: str):
+        toks = phrase_tokens(phrase)
+        if not toks or toks in self._phrases:
+            return
+        self._phrases[toks] = phrase
+        node = 0
+        for t in toks:
+            nxt = self._goto[node].get(t)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][t] = nxt
+                self._goto.append({})
+                self._out.append(None)
+            node = nxt
+        self._out[node] = phrase
+        self._dirty = True
+
+    def remove(self, phrase: str):
+        # Knoten bleiben stehen, nur die Ausgabe fällt weg
+        toks = phrase_tokens(phrase)
+        if self._phrases.pop(toks, None) is None:
+            return
+        node = 0
+        for t in toks:
+            node = self._goto[node][t]
+        self._out[node] = None
+        self._dirty = True
+
+    def compile(self):
+        # Fehlerlinks und gesammelte Ausgaben per BFS, O(Knoten)
+        if not self._dirty:
+            return
+        n = len(self._goto)
+        fail = [0] * n
+        hits: list[tuple[str, ...]] = [()] * n
+        queue = deque()
+        for child in self._goto[0].values():
+            queue.append(child)
+            hits[child] = (self._out[child],) if self._out[child] else ()
+        while queue:
+            node = queue.popleft()
+            for t, child in self._goto[node].items():
+                f = fail[node]
+                while f and t not in self._goto[f]:
+                    f = fail[f]
+                fc = self._goto[f].get(t, 0)
+                fail[child] = fc if fc != child else 0
+                own = (self._out[child],) if self._out[child] else ()
+                hits[child] = own + hits[fail[child]]
+                queue.append(child)
+        self._fail, self._hits = fail, hits
+        self._dirty = False
+
+    def snapshot(self) -> PhraseMatcher:
+        # kompilierte, unabhängige Kopie für Hintergrund-Threads; add()/remove() am Original
+        # ändern sie nicht mehr
+        self.compile()
+        cp = PhraseMatcher.__new__(PhraseMatcher)
+        cp._goto = [dict(d) for d in self._goto]
+        cp._out = list(self._out)
+        cp._fail, cp._hits = self._fail, self._hits
+        cp._phrases = dict(self._phrases)
+        cp._dirty = False
+        return cp
+
+    def find_all(self, tokens):
+        # tokens: beliebiger (auch gestreamter) Iterator klein geschriebener Wörter; liefert Ausdrücke
+        self.compile()
+        goto, fail, hits = self._goto, self._fail, self._hits
+        node = 0
+        for t in tokens:
+            while node and t not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(t, 0)
+            if hits[node]:
+                yield from hits[node]
+
+    def find_in_text(self, text: str):
+        return self.find_all(phrase_tokens(text))
@@ -0,0 +1,52 @@
+from __future__ import annotations
+from bisect import bisect_left, bisect_right
+
+class PrefixIndex:
+    # Sortiertes, case-gefaltetes Array der Wörter; Präfixsuche per bisect in O(log n + k).
+    def __init__(self, words=()):
+        pairs = sorted({(w.casefold(), w) for w in words if w})
+        self._keys = [k for k, _ in pairs]
+        self._words = [w for _, w in pairs]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, word: str) -> bool:
+        # case-insensitiv, O(log n)
+        k = (word or "").casefold()
+        i = bisect_left(self._keys, k)
+        return i < len(self._keys) and self._keys[i] == k
+
+    def add(self, word: str):
+        k = word.casefold()
+        i = bisect_left(self._keys, k)
+        while i < len(self._keys) and self._keys[i] == k:
+            if self._words[i] == word:
+                return
+            i += 1
+        self._keys.insert(i, k)
+        self._words.insert(i, word)
+
+    def remove(self, word: str):
+        k = word.casefold()
+        i = bisect_left(self._keys, k)
+        while i < len(self._keys) and self._keys[i] == k:
+            if self._words[i] == word:
+                del self._keys[i]
+                del self._words[i]
+                return
+            i += 1
+
+    def _bounds(self, prefix: str) -> tuple[int, int]:
+        p = prefix.casefold()
+        return bisect_left(self._keys, p), bisect_right(self._keys, p + "\U0010ffff")
+
+    def count(self, prefix: str) -> int:
+        lo, hi = self._bounds(prefix)
+        return hi - lo
+
+    def iter_prefix(self, prefix: str):
+        # Treffer in sortierter Reihenfolge, erst bei Bedarf
+        lo, hi = self._bounds(prefix)
+        for i in range(lo, hi):
+            yield self._words[i]
@@ -0,0 +1,178 @@
+from __future__ import annotations
+import heapq
+import time
+from array import array
+
+DAY = 86400.0
+RELEARN = 600.0          # "Again": in 10 Minuten erneut
+MIN_EASE = 1.3
+START_EASE = 2.5
+# Knopf -> SM-2-Qualität (0–5)
+GRADES = {"Again": 1, "Hard": 3, "Good": 4, "Easy": 5}
+
+class ReviewSchedule:
+    # SM-2-Zustand pro Karte (Schlüssel = klein geschriebenes Wort/Ausdruck), spaltenweise in
+    # Arrays: Fälligkeit (Unix-Sekunden), Intervall (Tage), Ease, Wiederholungen, Fehler.
+    # Karten ohne Bewertung stehen hier nicht drin, für sie gilt der Standard der DueQueue.
+    def __init__(self):
+        self._ids: dict[str, int] = {}
+        self._keys: list[str | None] = []
+        self._free: list[int] = []
+        self._due = array("d")
+        self._ivl = array("f")
+        self._ease = array("f")
+        self._reps = array("H")
+        self._lapses = array("H")
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._ids
+
+    def _slot(self, key: str) -> int:
+        i = self._ids.get(key)
+        if i is not None:
+            return i
+        if self._free:
+            i = self._free.pop()
+            self._keys[i] = key
+            self._due[i], self._ivl[i], self._ease[i], self._reps[i], self._lapses[i] = 0.0, 0.0, START_EASE, 0, 0
+        else:
+            i = len(self._keys)
+            self._keys.append(key)
+            self._due.append(0.0); self._ivl.append(0.0); self._ease.append(START_EASE)
+            self._reps.append(0); self._lapses.append(0)
+        self._ids[key] = i
+        return i
+
+    def due(self, key: str) -> float | None:
+        i = self._ids.get(key)
+        return self._due[i] if i is not None else None
+
+    def get(self, key: str) -> dict | None:
+        i = self._ids.get(key)
+        if i is None:
+            return None
+        return {"due": self._due[i], "interval": self._ivl[i], "ease": self._ease[i],
+                "reps": self._reps[i], "lapses": self._lapses[i]}
+
+    def grade(self, key: str, quality: int, now: float | None = None) -> float:
+        # SM-2: <3 = vergessen (Wiederholungen zurück, kurz erneut), sonst Intervall 1, 6, dann * Ease
+        now = time.time() if now is None else now
+        q = max(0, min(5, int(quality)))
+        i = self._slot(key)
+        ease = self._ease[i]
+        if q < 3:
+            self._reps[i] = 0
+            self._lapses[i] = min(self._lapses[i] + 1, 65535)
+            self._ivl[i] = 0.0
+            self._due[i] = now + RELEARN
+        else:
+            reps = self._reps[i] = min(self._reps[i] + 1, 65535)
+            if reps == 1:
+                ivl = 1.0
+            elif reps == 2:
+                ivl = 6.0
+            else:
+                ivl = self._ivl[i] * (1.2 if q == 3 else ease) * (1.3 if q == 5 else 1.0)
+            self._ivl[i] = ivl
+            self._due[i] = now + ivl * DAY
+        self._ease[i] = max(MIN_EASE, ease + 0.1 - (5 - q) * (0.08 + (5 - q) * 0.02))
+        return self._due[i]
+
+    def forget(self, key: str):
+        i = self._ids.pop(key, None)
+        if i is not None:
+            self._keys[i] = None
+            self._free.append(i)
+
+    def rename(self, old: str, new: str):
+        # Zustand wandert mit; hat das Ziel schon einen eigenen, bleibt dieser
+        i = self._ids.get(old)
+        if i is None or old == new:
+            return
+        if new in self._ids:
+            self.forget(old)
+            return
+        del self._ids[old]
+        self._ids[new] = i
+        self._keys[i] = new
+
+    # ---- Persistenz (spaltenweise, neben learned_log im Spielstand) ----
+    def to_json(self) -> dict:
+        live = [i for i, k in enumerate(self._keys) if k is not None]
+        if not live:
+            return {}
+        live.sort(key=lambda i: self._keys[i])
+        return {
+            "words": [self._keys[i] for i in live],
+            "due": [int(self._due[i]) for i in live],
+            "interval": [round(self._ivl[i], 2) for i in live],
+            "ease": [int(round(self._ease[i] * 100)) for i in live],
+            "reps": [self._reps[i] for i in live],
+            "lapses": [self._lapses[i] for i in live],
+        }
+
+    @classmethod
+    def from_json(cls, obj) -> ReviewSchedule:
+        # spaltenweise direkt in die Arrays; ungültige/doppelte Schlüssel werden freie Slots
+        s = cls()
+        try:
+            words = [w.strip().lower() if isinstance(w, str) else "" for w in obj["words"]]
+            cols = [obj[k] for k in ("due", "interval", "ease", "reps", "lapses")]
+            if any(len(c) != len(words) for c in cols):
+                raise ValueError("review schedule columns differ in length")
+            due, ivl, ease, reps, lapses = cols
+            s._due = array("d", map(float, due))
+            s._ivl = array("f", (max(0.0, float(v)) for v in ivl))
+            s._ease = array("f", (max(MIN_EASE, int(v) / 100.0) for v in ease))
+            s._reps = array("H", (max(0, min(65535, int(v))) for v in reps))
+            s._lapses = array("H", (max(0, min(65535, int(v))) for v in lapses))
+        except Exception:
+            return cls()
+        ids = s._ids
+        for i, w in enumerate(words):
+            if w and w not in ids:
+                ids[w] = i
+            else:
+                words[i] = None
+                s._free.append(i)
+        s._keys = words
+        return s
+
+class DueQueue:
+    # Min-Heap (fällig, schlüssel) über eine Auswahl von Karten (Filter im Review). peek ist
+    # amortisiert O(log n): nach einer Bewertung wird nur ein neuer Eintrag eingefügt, der alte gilt als
+    # veraltet und wird beim nächsten Zugriff übersprungen. default_due(key) gilt für Karten,
+    # die noch nie bewertet wurden (z. B. Lerndatum -> älteste zuerst).
+    def __init__(self, schedule: ReviewSchedule, keys, default_due=None):
+        self._schedule = schedule
+        self._default = default_due or (lambda key: 0.0)
+        self._keys = set(keys)
+        self._heap = [(self._due(k), k) for k in self._keys]
+        heapq.heapify(self._heap)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _due(self, key: str) -> float:
+        d = self._schedule.due(key)
+        return d if d is not None else self._default(key)
+
+    def peek(self) -> tuple[str, float] | None:
+        heap = self._heap
+        while heap:
+            due, key = heap[0]
+            if key in self._keys and self._due(key) == due:
+                return key, due
+            heapq.heappop(heap)
+        return None
+
+    def update(self, key: str):
+        # nach grade()/forget(): neue Fälligkeit einsortieren
+        if key in self._keys:
+            heapq.heappush(self._heap, (self._due(key), key))
+
+    def discard(self, key: str):
+        self._keys.discard(key)
@@ -0,0 +1,153 @@
+from __future__ import annotations
+import re
+from collections import defaultdict
+
+_TOKEN_RE = re.compile(r"[\w'-]+")
+
+def tokenize(text: str) -> list[str]:
+    return _TOKEN_RE.findall((text or "").lower())
+
+def _trigrams(token: str):
+    return {token[i:i + 3] for i in range(len(token) - 2)}
+
+class SearchIndex:
+    # Invertierter Index über Einträge (Wörter und Ausdrücke):
+    #   head: Token des Stichworts -> Eintrags-IDs, body: Token aus Bedeutungen/Beispielen -> IDs.
+    # Teilstring-Suche läuft über Trigramme der Token (nicht der Einträge), die Kandidaten
+    # werden danach exakt geprüft.
+    def __init__(self):
+        self._ids: dict[str, int] = {}
+        self._keys: list[str | None] = []
+        self._free: list[int] = []
+        self._postings = {"head": defaultdict(set), "body": defaultdict(set)}
+        self._doc_tokens: dict[int, tuple[frozenset, frozenset]] = {}
+        self._token_refs: dict[str, int] = defaultdict(int)
+        self._grams: dict[str, set[str]] = defaultdict(set)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, key: str) -> bool:
+        return (key or "").lower() in self._ids
+
+    # ---- Pflege ----
+    def set_entry(self, key: str, texts=()):
+        # (neu) indizieren; texts = Bedeutungen, Beispiele, …
+        key = (key or "").strip().lower()
+        if not key:
+            return
+        doc = self._ids.get(key)
+        if doc is None:
+            doc = self._free.pop() if self._free else len(self._keys)
+            if doc == len(self._keys):
+                self._keys.append(key)
+            else:
+                self._keys[doc] = key
+            self._ids[key] = doc
+        else:
+            self._drop_tokens(doc)
+        head = frozenset(tokenize(key))
+        body = frozenset(t for text in texts for t in tokenize(text))
+        self._doc_tokens[doc] = (head, body)
+        for field, toks in (("head", head), ("body", body)):
+            postings = self._postings[field]
+            for t in toks:
+                postings[t].add(doc)
+                self._ref(t)
+
+    def remove(self, key: str):
+        key = (key or "").strip().lower()
+        doc = self._ids.pop(key, None)
+        if doc is None:
+            return
+        self._drop_tokens(doc)
+        del self._doc_tokens[doc]
+        self._keys[doc] = None
+        self._free.append(doc)
+
+    def _ref(self, token: str):
+        self._token_refs[token] += 1
+        if self._token_refs[token] == 1:
+            for g in _trigrams(token):
+                self._grams[g].add(token)
+
+    def _unref(self, token: str):
+        self._token_refs[token] -= 1
+        if self._token_refs[token] <= 0:
+            del self._token_refs[token]
+            for g in _trigrams(token):
+                s = self._grams.get(g)
+                if s is not None:
+                    s.discard(token)
+                    if not s:
+                        del self._grams[g]
+
+    def _drop_tokens(self, doc: int):
+        head, body = self._doc_tokens.get(doc, (frozenset(), frozenset()))
+        for field, toks in (("head", head), ("body", body)):
+            postings = self._postings[field]
+            for t in toks:
+                s = postings.get(t)
+                if s is not None:
+                    s.discard(doc)
+                    if not s:
+                        del postings[t]
+                self._unref(t)
+
+    # ---- Suche ----
+    def _matching_tokens(self, part: str):
+        if len(part) >= 3:
+            grams = sorted(_trigrams(part), key=lambda g: len(self._grams.get(g, ())))
+            cand = set(self._grams.get(grams[0], ()))
+            for g in grams[1:]:
+                if not cand:
+                    break
+                cand &= self._grams.get(g, set())
+        else:
+            cand = self._token_refs.keys()
+        return [t for t in cand if part in t]
+
+    def search(self, query: str, fields=("head", "body")) -> dict[str, set[str]]:
+        # jedes Query-Token muss (als Teilstring) in einem Token desselben Feldes vorkommen
+        parts = tokenize(query)
+        out = {f: set() for f in fields}
+        if not parts:
+            return out
+        matches = [self._matching_tokens(p) for p in parts]
+        for field in fields:
+            postings = self._postings[field]
+            docs = None
+            for toks in matches:
+                hit = set()
+                for t in toks:
+                    hit |= postings.get(t, set())
+                docs = hit if docs is None else docs & hit
+                if not docs:
+                    break
+            out[field] = {self._keys[d] for d in (docs or ())}
+        return out
+
+    def filter(self, words, query: str) -> list[str]:
+        # Reihenfolge von words bleibt; Treffer im Stichwort vor Treffern in den Details
+        q = (query or "").strip()
+        if not q:
+            return list(words)
+        hits = self.search(q)
+        head, body = hits["head"], hits["body"]
+        first = [w for w in words if (w or "").lower() in head]
+        rest = [w for w in words if (w or "").lower() in body and (w or "").lower() not in head]
+        return first + rest
+
+def detail_texts(details) -> list[str]:
+    # Texte eines word_details-Eintrags für den Index
+    out = []
+    for item in details or []:
+        m = (item.get("meaning", "") or "").strip()
+        if m:
+            out.append(m)
+        ex_list = item.get("examples")
+        if not isinstance(ex_list, list):
+            ex = (item.get("example", "") or "").strip()
+            ex_list = [ex] if ex else []
+        out.extend(e for e in ex_list if isinstance(e, str))
+    return out
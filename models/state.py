@@ -1,6 +1,8 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Dict, List, Set, Optional, TypedDict
+from models.activity import LearnedLog
+from models.review_schedule import ReviewSchedule
 
 class WordDetail(TypedDict, total=False):
     meaning: str
@@ -22,7 +24,8 @@ class AppState:
     removed_words: set[str] = field(default_factory=set)
 
     learned_session: list[str] = field(default_factory=list)
-    learned_log: dict[str, str] = field(default_factory=dict)
+    learned_log: LearnedLog = field(default_factory=LearnedLog)
+    review_schedule: ReviewSchedule = field(default_factory=ReviewSchedule)
     word_details: dict[str, list[WordDetail]] = field(default_factory=dict)
     word_ipa: dict[str, str] = field(default_factory=dict)
 
@@ -0,0 +1,169 @@
+from __future__ import annotations
+import argparse
+import hashlib
+import json
+import struct
+import sys
+import zlib
+from array import array
+from pathlib import Path
+from models.mmap_table import MappedTable
+
+# Binärformat (little-endian):
+#   Kopf     b"VVC1", Version (u32), SHA-256 der Quelldatei (32 Byte), Anzahl n (u32),
+#            Länge der Schlüssel (u32), Anzahl Hash-Slots (u32, Zweierpotenz)
+#   offsets  n+1 x u32 – Start jedes Schlüssels im Schlüsselblock
+#   slots    u32 je Slot – Index+1 des Worts (0 = leer), CRC32 + lineares Sondieren
+#   keys     UTF-8, klein geschrieben, sortiert, jeweils mit "\n" abgeschlossen
+MAGIC = b"VVC1"
+VERSION = 1
+_HEADER = struct.Struct("<4sI32sIII")
+
+def cache_path(source) -> Path:
+    # Cache liegt neben der Quelle: res/b1_word_from_cambridge.json -> .vcache
+    return Path(source).with_suffix(".vcache")
+
+def parse_words(data: bytes) -> list[str]:
+    # {"words": [...]} oder direkt eine Liste; klein geschrieben, ohne Duplikate, sortiert
+    obj = json.loads(data.decode("utf-8-sig"))
+    items = obj.get("words", []) if isinstance(obj, dict) else obj
+    seen = set()
+    for w in items or []:
+        if not isinstance(w, str):
+            continue
+        s = w.strip().lower()
+        if len(s) >= 2 and "\n" not in s:
+            seen.add(s)
+    return sorted(seen)
+
+def write_cache(words, digest: bytes, path):
+    # words: bereits klein geschrieben, eindeutig und sortiert (siehe parse_words)
+    keys = [w.encode("utf-8") for w in words]
+    offsets = array("I", [0])
+    for k in keys:
+        offsets.append(offsets[-1] + len(k) + 1)
+    size = 1
+    while size < 2 * len(keys):
+        size <<= 1
+    mask = size - 1
+    slots = array("I", bytes(4 * size))
+    for i, k in enumerate(keys):
+        h = zlib.crc32(k) & mask
+        while slots[h]:
+            h = (h + 1) & mask
+        slots[h] = i + 1
+    blob = b"".join(k + b"\n" for k in keys)
+    if sys.byteorder != "little":
+        offsets.byteswap(); slots.byteswap()
+    path = Path(path)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, digest, len(keys), len(blob), size))
+        f.write(offsets.tobytes())
+        f.write(slots.tobytes())
+        f.write(blob)
+    tmp.replace(path)
+    return len(keys)
+
+class VocabCache:
+    # Read-only Sicht auf eine .vcache-Datei per mmap. words() dekodiert den Schlüsselblock
+    # in einem Rutsch; __contains__ prüft über die Hash-Tabelle, ohne Wörter zu laden.
+    # Fehlt die Datei oder passt Format/Version nicht, ist der Cache leer (digest = None).
+    def __init__(self, path):
+        self._table = None
+        self._mm = None
+        self._n = 0
+        self.digest: bytes | None = None
+        try:
+            t = self._table = MappedTable(path, _HEADER, MAGIC)
+            _magic, version, digest, n, keys_len, size = t.header
+            if version != VERSION:
+                raise ValueError("unsupported vocabulary cache version")
+            self._offsets = t.column("I", n + 1)
+            self._slots = t.column("I", size)
+            if t.pos + keys_len > len(t.mm):
+                raise ValueError("truncated vocabulary cache")
+            self._mm = t.mm
+            self._keys_start = t.pos
+            self._keys_len = keys_len
+            self._mask = size - 1
+            self._n = n
+            self.digest = digest
+        except Exception:
+            self.close()
+
+    def __len__(self) -> int:
+        return self._n
+
+    def _key(self, i: int) -> bytes:
+        base = self._keys_start
+        return self._mm[base + self._offsets[i]:base + self._offsets[i + 1] - 1]
+
+    def __contains__(self, word: str) -> bool:
+        if not self._n:
+            return False
+        k = (word or "").strip().lower().encode("utf-8")
+        h = zlib.crc32(k) & self._mask
+        while True:
+            slot = self._slots[h]
+            if not slot:
+                return False
+            if self._key(slot - 1) == k:
+                return True
+            h = (h + 1) & self._mask
+
+    def words(self) -> list[str]:
+        if not self._n:
+            return []
+        base = self._keys_start
+        return self._mm[base:base + self._keys_len - 1].decode("utf-8").split("\n")
+
+    def close(self):
+        if self._table is not None:
+            self._table.close()
+        self._table = None
+        self._mm = None
+        self._n = 0
+
+def load_words(source, cache=None) -> list[str]:
+    # Wörter einer JSON-Liste; aus dem Cache, solange der Hash der Quelle passt, sonst neu bauen
+    source = Path(source)
+    data = source.read_bytes()
+    digest = hashlib.sha256(data).digest()
+    cache = Path(cache) if cache is not None else cache_path(source)
+    vc = VocabCache(cache)
+    try:
+        if vc.digest == digest:
+            return vc.words()
+    finally:
+        vc.close()
+    words = parse_words(data)
+    try:
+        write_cache(words, digest, cache)
+    except OSError:
+        pass    # z. B. schreibgeschütztes res/ – dann eben ohne Cache
+    return words
+
+def main(argv=None) -> int:
+    # Caches vorab bauen (sonst passiert das beim ersten Start)
+    parser = argparse.ArgumentParser(description="Compile vocabulary JSON lists into binary caches.")
+    parser.add_argument("sources", nargs="+", help="word list JSON files ({'words': [...]} or a plain list)")
+    parser.add_argument("--force", action="store_true", help="rebuild even if the cache is up to date")
+    args = parser.parse_args(argv)
+    for src in args.sources:
+        src = Path(src)
+        data = src.read_bytes()
+        digest = hashlib.sha256(data).digest()
+        out = cache_path(src)
+        vc = VocabCache(out)
+        fresh = vc.digest == digest
+        vc.close()
+        if fresh and not args.force:
+            print(f"{src}: up to date")
+            continue
+        n = write_cache(parse_words(data), digest, out)
+        print(f"{src}: {n} words -> {out}")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
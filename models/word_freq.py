@@ -0,0 +1,123 @@
+from __future__ import annotations
+import argparse
+import re
+import struct
+import sys
+from array import array
+from pathlib import Path
+from models.mmap_table import MappedTable
+
+# Binärformat (little-endian):
+#   Kopf     b"VWF1", Anzahl n (u32), Länge der Schlüssel (u32)
+#   offsets  n+1 x u32 – Start jedes Schlüssels im Schlüsselblock
+#   zipf     n x u16   – Zipf-Wert * 100 (log10 der Häufigkeit pro Milliarde Wörter)
+#   keys     UTF-8, bytesortiert aneinandergehängt
+MAGIC = b"VWF1"
+_HEADER = struct.Struct("<4sII")
+_WORD_RE = re.compile(r"^[a-z]+(?:[-'][a-z]+)*$")
+
+def write_table(pairs, path):
+    # pairs: (wort, zipf); doppelte Wörter behalten den höchsten Wert
+    best: dict[bytes, int] = {}
+    for word, zipf in pairs:
+        w = (word or "").strip().lower()
+        if not _WORD_RE.match(w):
+            continue
+        k = w.encode("utf-8")
+        v = max(0, min(65535, int(round(float(zipf) * 100))))
+        if v > best.get(k, -1):
+            best[k] = v
+    keys = sorted(best)
+    offsets = array("I", [0])
+    for k in keys:
+        offsets.append(offsets[-1] + len(k))
+    zipfs = array("H", (best[k] for k in keys))
+    blob = b"".join(keys)
+    if sys.byteorder != "little":
+        offsets.byteswap(); zipfs.byteswap()
+    path = Path(path)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, len(keys), len(blob)))
+        f.write(offsets.tobytes())
+        f.write(zipfs.tobytes())
+        f.write(blob)
+    tmp.replace(path)
+    return len(keys)
+
+class WordFrequency:
+    # Read-only Nachschlagen per mmap + Binärsuche, O(log n); nichts wird in Dicts geladen.
+    # Fehlt die Datei, liefert zipf() überall 0.0.
+    def __init__(self, path):
+        self._table = None
+        self._mm = None
+        self._n = 0
+        try:
+            t = self._table = MappedTable(path, _HEADER, MAGIC)
+            _magic, n, keys_len = t.header
+            self._offsets = t.column("I", n + 1)
+            self._zipf = t.column("H", n)
+            if t.pos + keys_len > len(t.mm):
+                raise ValueError("truncated word frequency table")
+            self._keys_start = t.pos
+            self._mm = t.mm
+            self._n = n
+        except Exception:
+            self.close()
+
+    def __len__(self) -> int:
+        return self._n
+
+    def _key(self, i: int) -> bytes:
+        base = self._keys_start
+        return self._mm[base + self._offsets[i]:base + self._offsets[i + 1]]
+
+    def _find(self, word: str) -> int:
+        if not self._n:
+            return -1
+        k = (word or "").strip().lower().encode("utf-8")
+        lo, hi = 0, self._n
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key(mid) < k:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo if lo < self._n and self._key(lo) == k else -1
+
+    def __contains__(self, word: str) -> bool:
+        return self._find(word) >= 0
+
+    def zipf(self, word: str) -> float:
+        # 0.0 = unbekannt/selten, ~7 = sehr häufig ("the")
+        i = self._find(word)
+        return self._zipf[i] / 100.0 if i >= 0 else 0.0
+
+    def close(self):
+        if self._table is not None:
+            self._table.close()
+        self._table = None
+        self._mm = None
+        self._n = 0
+
+def main(argv=None) -> int:
+    # Tabelle aus einer Textliste "wort<TAB>zipf" (eine Zeile pro Wort) erzeugen
+    parser = argparse.ArgumentParser(description="Build the binary word frequency table.")
+    parser.add_argument("source", help="UTF-8 text file with 'word<TAB>zipf' lines")
+    parser.add_argument("--out", default=str(Path(__file__).resolve().parent.parent / "res" / "word_freq.bin"))
+    args = parser.parse_args(argv)
+    pairs = []
+    with open(args.source, encoding="utf-8") as f:
+        for line in f:
+            parts = line.rstrip("\n").split("\t")
+            if len(parts) >= 2:
+                try:
+                    pairs.append((parts[0], float(parts[1])))
+                except ValueError:
+                    pass
+    n = write_table(pairs, args.out)
+    print(f"{n} words -> {args.out}")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
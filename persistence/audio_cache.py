@@ -0,0 +1,139 @@
+from __future__ import annotations
+from pathlib import Path
+import json
+import os
+import threading
+import zlib
+import numpy as np
+
+class AudioCache:
+    # Alle Einträge liegen als int16-PCM hintereinander in einer Datei (<name>.bin),
+    # der Index (<name>.idx.json) hält pro Schlüssel [offset, nbytes, frames, sr, codec].
+    # Unkomprimierte Einträge werden als memmap-View geliefert (kein Kopieren, kein RAM-Cache).
+    # Die Reihenfolge im Index ist die Nutzung (älteste zuerst). Wird die Datei größer als
+    # max_bytes oder besteht sie zur Hälfte aus überschriebenen Einträgen, werden die ältesten
+    # Einträge verworfen und nur die lebenden in eine neue Datei umkopiert.
+    def __init__(self, path: Path, compress: bool = False, flush_every: int = 20, max_bytes: int = 128 << 20):
+        self.path = Path(path)
+        self.index_path = self.path.with_suffix(".idx.json")
+        self.compress = compress
+        self.max_bytes = max_bytes
+        self._flush_every = flush_every
+        self._index: dict[str, list] = {}
+        self._dirty = 0
+        self._size = 0
+        self._mm = None
+        self._lock = threading.Lock()
+        self._load_index()
+
+    def _load_index(self):
+        size = self._size = self.path.stat().st_size if self.path.exists() else 0
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                raw = json.load(f)
+        except Exception:
+            raw = {}
+        # Einträge verwerfen, deren Daten nach einem Absturz fehlen
+        self._index = {
+            k: v for k, v in (raw.items() if isinstance(raw, dict) else [])
+            if isinstance(v, list) and len(v) == 5 and v[0] + v[1] <= size
+        }
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def _view(self, offset: int, nbytes: int):
+        if self._mm is None or offset + nbytes > len(self._mm):
+            self._mm = np.memmap(self.path, dtype=np.uint8, mode="r")
+        return self._mm[offset:offset + nbytes]
+
+    def get(self, key: str) -> tuple[np.ndarray, int] | None:
+        with self._lock:
+            entry = self._index.get(key)
+            if entry is None:
+                return None
+            offset, nbytes, frames, sr, codec = entry
+            raw = self._view(offset, nbytes)
+            # zuletzt benutzt ans Ende (wird beim nächsten flush mitgeschrieben)
+            del self._index[key]
+            self._index[key] = entry
+        if codec == "zlib":
+            pcm = np.frombuffer(zlib.decompress(raw), dtype=np.int16)
+        else:
+            pcm = raw.view(np.int16)
+        return pcm[:frames], sr
+
+    def put(self, key: str, wav: np.ndarray, sr: int) -> np.ndarray:
+        pcm = (np.clip(np.asarray(wav, dtype=np.float32), -1.0, 1.0) * 32767.0).astype(np.int16)
+        if not len(pcm):
+            return pcm
+        data = pcm.tobytes()
+        codec = "pcm16"
+        if self.compress:
+            data = zlib.compress(data, 6)
+            codec = "zlib"
+        with self._lock:
+            with open(self.path, "ab") as f:
+                offset = f.tell()
+                f.write(data)
+            self._size = offset + len(data)
+            self._index.pop(key, None)     # alter Eintrag wird zu Abfall in der Datei
+            self._index[key] = [offset, len(data), int(len(pcm)), int(sr), codec]
+            self._dirty += 1
+            live = sum(e[1] for e in self._index.values())
+            if self._size > self.max_bytes or (self._size > (8 << 20) and live * 2 < self._size):
+                self._compact_locked()
+            flush = self._dirty >= self._flush_every
+        if flush:
+            self.flush()
+        return pcm
+
+    def _compact_locked(self):
+        # älteste Einträge verwerfen, bis höchstens 3/4 des Budgets übrig sind, dann umkopieren
+        budget = self.max_bytes * 3 // 4
+        live = sum(e[1] for e in self._index.values())
+        for key in list(self._index):
+            if live <= budget:
+                break
+            live -= self._index.pop(key)[1]
+        src = self._mm if self._mm is not None and len(self._mm) >= self._size else np.memmap(self.path, dtype=np.uint8, mode="r")
+        tmp = self.path.with_suffix(".compact")
+        new_index, pos = {}, 0
+        with open(tmp, "wb") as f:
+            for key, (offset, nbytes, frames, sr, codec) in self._index.items():
+                f.write(src[offset:offset + nbytes].tobytes())
+                new_index[key] = [pos, nbytes, frames, sr, codec]
+                pos += nbytes
+        del src
+        self._mm = None
+        try:
+            # Index zuerst weg: ein Absturz dazwischen kostet nur den Cache, nie falsches Audio
+            self.index_path.unlink(missing_ok=True)
+            os.replace(tmp, self.path)
+        except OSError:
+            # z. B. Windows, solange noch eine alte memmap-View abgespielt wird
+            tmp.unlink(missing_ok=True)
+            self._dirty += 1
+            return
+        self._index = new_index
+        self._size = pos
+        self._dirty += 1
+        tmp_idx = self.index_path.with_suffix(".tmp")
+        with open(tmp_idx, "w", encoding="utf-8") as f:
+            json.dump(new_index, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_idx, self.index_path)
+        self._dirty = 0
+
+    def flush(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            snapshot = dict(self._index)
+            self._dirty = 0
+        tmp = self.index_path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp, self.index_path)
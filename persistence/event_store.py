@@ -0,0 +1,133 @@
+from __future__ import annotations
+from pathlib import Path
+import datetime as _dt
+import sqlite3
+import time
+
+EVENT_KINDS = ("learn", "review", "mark_new", "remove", "restore", "stt")
+
+class EventStore:
+    # Append-only Lernhistorie in SQLite: (ts, kind, word_id, value), Index auf ts.
+    # Events werden gepuffert und gesammelt geschrieben; Abfragen aggregieren in SQL,
+    # d. h. es wird nie die ganze Historie geladen.
+    def __init__(self, path: Path, flush_delay: float = 2.0, max_pending: int = 200):
+        self.path = Path(path)
+        self._flush_delay = flush_delay
+        self._max_pending = max_pending
+        self._pending: list[tuple] = []
+        self._flush_scheduled = False
+        self._word_ids: dict[str, int] = {}
+        self._db = sqlite3.connect(str(self.path))
+        self._db.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS words (id INTEGER PRIMARY KEY, word TEXT NOT NULL UNIQUE);
+            CREATE TABLE IF NOT EXISTS events (
+                ts INTEGER NOT NULL, kind INTEGER NOT NULL, word_id INTEGER, value REAL
+            );
+            CREATE INDEX IF NOT EXISTS idx_events_ts ON events (ts);
+            CREATE INDEX IF NOT EXISTS idx_events_kind_ts ON events (kind, ts);
+            """
+        )
+
+    # ---- Schreiben ----
+    def log(self, kind: str, word: str | None = None, value: float | None = None, ts: float | None = None):
+        if kind not in EVENT_KINDS:
+            raise ValueError(f"unknown event kind: {kind}")
+        w = (word or "").strip().lower() or None
+        self._pending.append((int(ts if ts is not None else time.time()), EVENT_KINDS.index(kind), w, value))
+        if len(self._pending) >= self._max_pending:
+            self.flush()
+        else:
+            self._schedule_flush()
+
+    def _schedule_flush(self):
+        if self._flush_scheduled:
+            return
+        try:
+            from kivy.clock import Clock
+        except Exception:
+            return
+        self._flush_scheduled = True
+        Clock.schedule_once(lambda dt: self.flush(), self._flush_delay)
+
+    def _word_id(self, word: str | None) -> int | None:
+        if word is None:
+            return None
+        wid = self._word_ids.get(word)
+        if wid is None:
+            self._db.execute("INSERT OR IGNORE INTO words (word) VALUES (?)", (word,))
+            wid = self._db.execute("SELECT id FROM words WHERE word = ?", (word,)).fetchone()[0]
+            self._word_ids[word] = wid
+        return wid
+
+    def flush(self):
+        self._flush_scheduled = False
+        if not self._pending:
+            return
+        rows, self._pending = self._pending, []
+        with self._db:
+            self._db.executemany(
+                "INSERT INTO events (ts, kind, word_id, value) VALUES (?, ?, ?, ?)",
+                [(ts, k, self._word_id(w), v) for ts, k, w, v in rows],
+            )
+
+    def close(self):
+        self.flush()
+        self._db.close()
+
+    # ---- Abfragen ----
+    @staticmethod
+    def _day_start_ts(d: _dt.date) -> int:
+        return int(time.mktime(d.timetuple()))
+
+    def events(self, start: float, end: float, kind: str | None = None, limit: int | None = None):
+        self.flush()
+        sql = ("SELECT e.ts, e.kind, w.word, e.value FROM events e LEFT JOIN words w ON w.id = e.word_id "
+               "WHERE e.ts >= ? AND e.ts < ?")
+        args: list = [int(start), int(end)]
+        if kind:
+            sql += " AND e.kind = ?"
+            args.append(EVENT_KINDS.index(kind))
+        sql += " ORDER BY e.ts"
+        if limit:
+            sql += f" LIMIT {int(limit)}"
+        for ts, k, w, v in self._db.execute(sql, args):
+            yield ts, EVENT_KINDS[k], w, v
+
+    def downsample(self, kind: str, start: float, end: float, buckets: int, agg: str = "count") -> list[float]:
+        # gleich breite Zeitfenster; agg = count | avg (Mittel von value, z. B. STT-Trefferquote)
+        self.flush()
+        buckets = max(1, int(buckets))
+        width = max(1.0, (end - start) / buckets)
+        expr = "COUNT(*)" if agg == "count" else "AVG(value)"
+        rows = self._db.execute(
+            f"SELECT CAST((ts - ?) / ? AS INTEGER) AS b, {expr} FROM events "
+            "WHERE kind = ? AND ts >= ? AND ts < ? GROUP BY b",
+            (int(start), width, EVENT_KINDS.index(kind), int(start), int(end)),
+        )
+        out = [0.0] * buckets
+        for b, v in rows:
+            if 0 <= b < buckets and v is not None:
+                out[b] = v
+        return out
+
+    def daily_counts(self, kind: str, first: _dt.date, last: _dt.date) -> list[int]:
+        # Tage in lokaler Zeit, wie learned_log
+        self.flush()
+        n = (last - first).days + 1
+        if n <= 0:
+            return []
+        rows = self._db.execute(
+            "SELECT date(ts, 'unixepoch', 'localtime') AS d, COUNT(*) FROM events "
+            "WHERE kind = ? AND ts >= ? AND ts < ? GROUP BY d",
+            (EVENT_KINDS.index(kind), self._day_start_ts(first), self._day_start_ts(last + _dt.timedelta(days=1))),
+        )
+        out = [0] * n
+        for ds, c in rows:
+            try:
+                i = (_dt.date.fromisoformat(ds) - first).days
+            except Exception:
+                continue
+            if 0 <= i < n:
+                out[i] = c
+        return out
@@ -2,7 +2,10 @@ from __future__ import annotations
 from pathlib import Path
 import json
 import datetime as _dt
+import heapq
 import shutil
+from models.activity import LearnedLog
+from models.review_schedule import ReviewSchedule
 
 class ProgressStore:
     def __init__(self, app, path: Path):
@@ -31,6 +34,7 @@ class ProgressStore:
             "removed_words": self._sorted_ci_list(a.removed_words),
             "learned_words": list(a.learned_session),
             "learned_log": {k: a.learned_log[k] for k in self._sorted_ci_keys(a.learned_log)},
+            "review_schedule": a.review_schedule.to_json(),
             "word_details": {k: a.word_details[k] for k in self._sorted_ci_keys(a.word_details)},
             "word_ipa": {k: a.word_ipa[k] for k in self._sorted_ci_keys(a.word_ipa)},
             "learn_order_mode": a.learn_order_mode,
@@ -45,11 +49,13 @@ class ProgressStore:
         user_words_lower = {str(w).strip().lower() for w in raw_user_words if isinstance(w, str) and str(w).strip()}
         a.user_words = set(user_words_lower)
 
-        # Vokabular: (wie in Voca.py) auf lowercase setzen
-        vocab_lower = {(w or "").lower() for w in a.vocabulary}
-        final_vocab = sorted(vocab_lower | user_words_lower)
-        a.vocabulary = final_vocab
+        # Vokabular kommt bereits klein geschrieben und sortiert (Vokabel-Cache/Decks):
+        # nur fehlende eigene Wörter einfügen statt alles neu zu sortieren
         vocab_lower_set = set(a.vocabulary)
+        extra = sorted(user_words_lower - vocab_lower_set)
+        if extra:
+            a.vocabulary = list(heapq.merge(a.vocabulary, extra))
+            vocab_lower_set.update(extra)
 
         a.removed_words = set((w or "").lower() for w in data.get("removed_words", []) if isinstance(w, str))
         loaded_learned = data.get("learned_words", [])
@@ -149,7 +155,9 @@ class ProgressStore:
                     vs = v.strip()
                     if ks and vs:
                         log_cleaned[ks] = vs
-        a.learned_log = log_cleaned
+        a.learned_log = LearnedLog(log_cleaned)
+        # SM-2-Zustand fürs Review (spaltenweise gespeichert)
+        a.review_schedule = ReviewSchedule.from_json(data.get("review_schedule") or {})
 
     def _unique_preserve_order(self, items):
         seen, out = set(), []
@@ -218,7 +226,7 @@ class ProgressStore:
             "user_words", "removed_words",
             "known_words", "new_words",
             "known_sequence", "new_sequence",
-            "learned_words", "learned_log",
+            "learned_words", "learned_log", "review_schedule",
             "word_details", "word_ipa",
             "learn_order_mode", "tongue_twisters",
             "expressions",
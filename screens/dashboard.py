@@ -4,7 +4,7 @@ from kivy.uix.scrollview import ScrollView
 from kivy.uix.popup import Popup
 from kivy.uix.label import Label
 from kivy.uix.widget import Widget
-from ui.widgets import RoundedButton as Button, BarChart
+from ui.widgets import RoundedButton as Button, BarChart, GroupedBarChart, CalendarHeatmap
 import datetime as _dt
 from kivy.graphics import Color, Rectangle
 from kivy.uix.anchorlayout import AnchorLayout
@@ -12,29 +12,16 @@ from kivy.uix.anchorlayout import AnchorLayout
 class DashboardScreen:
     def open_dashboard_popup(self, *_):
         today = _dt.date.today()
-        iso = lambda d: d.isoformat()
-        counts_by_day: dict[str, int] = {}
-        for lw, ds in (self.learned_log or {}).items():
-            try:
-                d = _dt.date.fromisoformat((ds or "").strip())
-            except Exception:
-                continue
-            key = iso(d)
-            counts_by_day[key] = counts_by_day.get(key, 0) + 1
+        # Tageszähler werden beim Loggen mitgeführt – jede Summe sind zwei Präfix-Lookups
+        day_counts = self.learned_log.day_counts
 
         week_start = today - _dt.timedelta(days=today.weekday())
         month_start = today.replace(day=1)
         year_start = today.replace(month=1, day=1)
 
-        def sum_range(start: _dt.date, end: _dt.date) -> int:
-            total = 0
-            cur = start
-            while (cur <= end):
-                total += counts_by_day.get(iso(cur), 0)
-                cur += _dt.timedelta(days=1)
-            return total
+        sum_range = day_counts.range_sum
 
-        learned_today = counts_by_day.get(iso(today), 0)
+        learned_today = day_counts.count(today)
         learned_week = sum_range(week_start, today)
         learned_month = sum_range(month_start, today)
         learned_year = sum_range(year_start, today)
@@ -112,24 +99,45 @@ class DashboardScreen:
         nav10.add_widget(prev10_btn); nav10.add_widget(Widget()); nav10.add_widget(next10_btn)
         days_box.add_widget(nav10); days_box.height += nav10.height + 6
 
+        # Wiederholungen und Sprechversuche aus der Lernhistorie (gleiches 10-Tage-Fenster)
+        events = getattr(self, "events", None)
+        chart_activity = GroupedBarChart(
+            labels=[], series_a=[], series_b=[], max_value=0,
+            color_a=list(self.theme["primary"]), color_b=list(self.theme["accent"]),
+            title_a="Reviews", title_b="Speaking", label_color=list(self.theme["text"]),
+            label_sp=20, legend_sp=18,
+        )
+        if events is not None:
+            add_section("Reviews & Speaking", chart_activity, height=260)
+
+        def _update_activity_chart(first, last, labels):
+            if events is None:
+                return
+            try:
+                reviews = events.daily_counts("review", first, last)
+                spoken = events.daily_counts("stt", first, last)
+            except Exception:
+                return
+            chart_activity.set_data(labels=labels, series_a=reviews, series_b=spoken,
+                                    max_value=max(reviews + spoken + [0]))
+
         def _update_days_chart():
             off = int(day_state["offset"])
             end = today - _dt.timedelta(days=off)
             days = [end - _dt.timedelta(days=i) for i in range(9, -1, -1)]  # 10 Tage
             labels = [d.strftime("%d.%m") for d in days]
-            vals = [counts_by_day.get(iso(d), 0) for d in days]
+            vals = self.learned_log.day_counts.counts_between(days[0], days[-1]).tolist()
             # Farben: rot, wenn weniger als Vortag; sonst grün
             cols = []
             prev = None
             for v in vals:
                 cols.append(good if (prev is None or v >= prev) else bad)
                 prev = v
-            chart_10.labels = labels
-            chart_10.values = vals
-            chart_10.bar_colors = cols
-            chart_10.max_value = max(vals) if any(vals) else 0
+            chart_10.set_data(labels=labels, values=vals, bar_colors=cols,
+                              max_value=max(vals) if any(vals) else 0)
             # ">" nur aktiv, wenn wir nicht im Zukunftsfenster wären
             next10_btn.disabled = (off == 0)
+            _update_activity_chart(days[0], days[-1], labels)
 
         def _go_prev10(*_):
             day_state["offset"] += 10
@@ -177,17 +185,15 @@ class DashboardScreen:
         def _update_month_chart():
             y = year_state["year"]
             months = [month_range(y, m) for m in range(1, 13)]
-            vals = [sum_range(s, e) for (s, e) in months]
+            vals = [self.learned_log.day_counts.range_sum(s, e) for (s, e) in months]
             # Farben pro Monat
             colors = []
             prev = None
             for v in vals:
                 colors.append(good if (prev is None or v >= prev) else bad)
                 prev = v
-            chart_m.labels = [_dt.date(y, m, 1).strftime("%b") for m in range(1, 13)]
-            chart_m.values = vals
-            chart_m.bar_colors = colors
-            chart_m.max_value = max(vals) if any(vals) else 0
+            chart_m.set_data(labels=[_dt.date(y, m, 1).strftime("%b") for m in range(1, 13)],
+                             values=vals, bar_colors=colors, max_value=max(vals) if any(vals) else 0)
             months_title.text = f"Months {y}"
             # „>“ nur erlauben, wenn wir in der Vergangenheit sind (kein zukünftiges Jahr)
             next_btn.disabled = (y >= today.year)
@@ -205,6 +211,26 @@ class DashboardScreen:
         # initiale Füllung
         _update_month_chart()
 
+        # Heatmap über die letzten (höchstens 10) Jahre, direkt aus den Tageszählern
+        first = day_counts.first_day() or today
+        first_year = max(first.year, today.year - 9)
+        heat_start = _dt.date(first_year, 1, 1)
+        heatmap = CalendarHeatmap(color=list(self.theme["primary"]), label_color=list(self.theme["text"]))
+        heatmap.set_counts(heat_start, day_counts.counts_between(heat_start, _dt.date(today.year, 12, 31)))
+        add_section("Activity", heatmap, height=110 * (today.year - first_year + 1))
+
+        def _on_day_changed(ordinal, count):
+            if ordinal is None:
+                # Log ersetzt/geleert: alles neu aus den aktuellen Zählern
+                heatmap.set_counts(heat_start, self.learned_log.day_counts.counts_between(heat_start, _dt.date(today.year, 12, 31)))
+                return
+            day = _dt.date.fromordinal(ordinal)
+            if day >= heat_start:
+                heatmap.set_count(day, count)
+        # am Log registriert, nicht an day_counts – das Objekt wird bei clear()/Laden ersetzt
+        listeners = self.learned_log.listeners
+        listeners.append(_on_day_changed)
+
         # Legende unten mittig anzeigen
         root.add_widget(footer_legend)
 
@@ -214,4 +240,11 @@ class DashboardScreen:
         root.add_widget(bar)
         popup = Popup(title="Dashboard", content=root, size_hint=(0.95, 0.92), auto_dismiss=True)
         close_btn.bind(on_release=lambda *_: popup.dismiss())
+
+        def _detach(*_):
+            try:
+                listeners.remove(_on_day_changed)
+            except ValueError:
+                pass
+        popup.bind(on_dismiss=_detach)
         popup.open()
\ No newline at end of file
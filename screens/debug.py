@@ -0,0 +1,74 @@
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.gridlayout import GridLayout
+from kivy.uix.scrollview import ScrollView
+from kivy.uix.popup import Popup
+from kivy.uix.label import Label
+from ui.widgets import RoundedButton as Button
+from services.speech_metrics import LENGTH_BUCKETS
+import datetime as _dt
+
+TTS_SPANS = ("queue", "model_wait", "cache", "synthesis", "postprocess", "device_start")
+STT_SPANS = ("queue", "model_wait", "recording", "postprocess", "inference")
+
+class DebugScreen:
+    def _on_debug_key(self, window, key, *_):
+        # F12 öffnet das Sprach-Latenz-Panel
+        if key == 293:
+            self.open_speech_debug_popup()
+            return True
+        return False
+
+    def open_speech_debug_popup(self, *_):
+        metrics = self.speech_metrics
+        root = BoxLayout(orientation='vertical', spacing=10, padding=12)
+        sv = ScrollView(size_hint=(1, 0.88))
+        grid = GridLayout(cols=1, spacing=4, size_hint_y=None, padding=(0, 6))
+        grid.bind(minimum_height=grid.setter('height'))
+        sv.add_widget(grid)
+        root.add_widget(sv)
+
+        def _row(text, font_size=18, color=(0.9, 0.95, 1, 1)):
+            lbl = Label(text=text, font_size=font_size, size_hint_y=None, height=font_size + 12, color=color, halign='left', valign='middle')
+            lbl.bind(size=lambda inst, *_: setattr(inst, 'text_size', (inst.width, None)))
+            grid.add_widget(lbl)
+
+        def rebuild():
+            grid.clear_widgets()
+            records = metrics.snapshot()
+            bucket_order = [name for _, name in LENGTH_BUCKETS] + [">20"]
+            for kind, span_names in (("tts", TTS_SPANS), ("stt", STT_SPANS)):
+                _row(f"{kind.upper()} – p50 / p95 total (ms) by text length", 24, (0.95, 0.98, 1, 1))
+                summary = metrics.summary(kind)
+                if not summary:
+                    _row("No data.", color=(0.8, 0.8, 0.8, 1))
+                for bucket in bucket_order:
+                    if bucket in summary:
+                        s = summary[bucket]
+                        _row(f"{bucket} chars: n={s['count']}  p50={s['p50'] * 1000:.0f}  p95={s['p95'] * 1000:.0f}")
+                last = [r for r in records if r["kind"] == kind][-15:]
+                for r in reversed(last):
+                    ts = _dt.datetime.fromtimestamp(r["ts"]).strftime("%H:%M:%S")
+                    parts = "  ".join(f"{n}={r['spans'].get(n, 0.0) * 1000:.0f}" for n in span_names if n in r["spans"])
+                    status = "" if r["ok"] else "  [failed]"
+                    _row(f"{ts}  {r['chars']:>3} chars  total={r['total'] * 1000:.0f}  {parts}{status}", 16, (0.8, 0.9, 1, 1))
+
+        bar = BoxLayout(size_hint=(1, 0.12), spacing=8)
+        refresh_btn = Button(text="Refresh", font_size=22, background_color=(0.25, 0.55, 0.9, 1))
+        export_btn = Button(text="Export JSONL", font_size=22, background_color=(0.2, 0.6, 0.2, 1))
+        close_btn = Button(text="Close", font_size=22, background_color=self.theme["closeButton"])
+        bar.add_widget(refresh_btn); bar.add_widget(export_btn); bar.add_widget(close_btn)
+        root.add_widget(bar)
+        popup = Popup(title="Speech latency", content=root, size_hint=(0.95, 0.92), auto_dismiss=True)
+
+        def _export(*_):
+            try:
+                n = metrics.export_jsonl(self.speech_metrics_file)
+                self.show_error_popup(f"{n} entries appended to {self.speech_metrics_file.name}.", duration=2)
+            except Exception as e:
+                self.show_error_popup(f"Export failed: {e}")
+
+        refresh_btn.bind(on_release=lambda *_: rebuild())
+        export_btn.bind(on_release=_export)
+        close_btn.bind(on_release=lambda *_: popup.dismiss())
+        rebuild()
+        popup.open()
@@ -23,41 +23,15 @@ class DictionaryScreen:
         s = s.strip(" .,:;!?\"'()[]{}")
         return s
 
-    def _adjust_label_height(self, label):
-        label.text_size = (label.width, None)
-        label.height = label.texture_size[1]
-        if not hasattr(label, "_auto_height_bound"):
-            label.bind(width=lambda inst, val: self._adjust_label_height(inst))
-            label._auto_height_bound = True
-
     def _add_wrapped_label(self, parent_grid: GridLayout, text: str, font_size: int,
                            color=(0.95, 0.98, 1, 1), extra_pad: int = 6, indent_left: int = 0, font_name: str | None = None):
-        row = BoxLayout(orientation='horizontal', size_hint_y=None, height=0, spacing=0, padding=(0, 0))
-        if (indent_left > 0):
-            from kivy.uix.widget import Widget
-            row.add_widget(Widget(size_hint=(None, None), width=indent_left, height=1))
-        lbl = Label(text=text, font_size=font_size, size_hint_y=None, color=color, halign='left', valign='top')
-        if font_name:
-            lbl.font_name = font_name
-        def _recalc(*_):
-            try:
-                lbl.text_size = (max(0, parent_grid.width - indent_left), None)
-                lbl.texture_update()
-                lbl.height = lbl.texture_size[1] + extra_pad
-                row.height = lbl.height
-            except Exception:
-                pass
-        parent_grid.bind(width=lambda inst, val: Clock.schedule_once(lambda dt: _recalc(), 0))
-        lbl.bind(texture_size=lambda inst, val: setattr(lbl, 'height', val[1] + extra_pad))
-        lbl.bind(height=lambda inst, val: setattr(row, 'height', val))
-        row.add_widget(lbl)
-        parent_grid.add_widget(row)
-        Clock.schedule_once(lambda dt: _recalc(), 0)
-        return lbl
+        # Zeile aus dem Widget-Pool; Breitenänderungen des Grids passt der Pool gesammelt an
+        return self.widget_pool.wrapped_label(parent_grid, text, font_size, color=color, indent_left=indent_left,
+                                              font_name=font_name, extra_pad=extra_pad)
 
     def _show_word_details_in_grid(self, word: str, word_label: Label, grid: GridLayout):
         word_label.text = word
-        grid.clear_widgets()
+        self.widget_pool.release_children(grid)
         ipa = self.word_ipa.get((word or "").lower(), "").strip()
         if ipa:
             self._add_wrapped_label(
@@ -129,6 +103,7 @@ class DictionaryScreen:
         edit_btn.bind(on_release=lambda *_: self._open_word_meanings_editor(word))
         close_btn.bind(on_release=lambda *_: self.dictionary_popup.dismiss())
         self.dictionary_popup.bind(on_open=(lambda *_: refresh_view()))
+        self.dictionary_popup.bind(on_dismiss=(lambda *_: self.widget_pool.release_children(grid)))
         self.dictionary_popup.open()
 
     # Editor (Bedeutungen/Beispiele) – aus deinem Code übernommen
@@ -164,7 +139,7 @@ class DictionaryScreen:
         rename_row.add_widget(rename_btn)
         root.add_widget(rename_row)
 
-        def _do_rename(*_):
+        def _do_rename(*_, confirmed=False):
             nonlocal word, key
             old = word
             new_raw = (rename_inp.text or "")
@@ -182,6 +157,15 @@ class DictionaryScreen:
                 if wl not in existing_lower_map:
                     existing_lower_map[wl] = w0
 
+            if not confirmed and new_l != old_l and new_l not in existing_lower_map:
+                similar = self._similar_words(new, exclude=(old,))
+                if similar:
+                    def _merge(cand):
+                        rename_inp.text = cand
+                        _do_rename(confirmed=True)
+                    self._confirm_fuzzy_merge(new, similar, _merge, lambda: _do_rename(confirmed=True))
+                    return
+
             if new_l == old_l:
                 self._replace_word_everywhere(old, new)
                 target = new
@@ -438,6 +422,7 @@ class DictionaryScreen:
             else:
                 if not only_if_filled:
                     self.word_ipa.pop(key, None)
+            self._reindex_entry(key)
 
             if tt_toggle.state == 'down':
                 self.tongue_twisters.add(key)
@@ -466,7 +451,7 @@ class DictionaryScreen:
                 saved = collect_and_save(silent=True, only_if_filled=True)
             except Exception:
                 saved = False
-            if saved and getattr(self, "learn_order_mode", "Random") in ("Newest", "Oldest"):
+            if saved and getattr(self, "learn_order_mode", "Random") in ("Newest", "Oldest", "Most useful"):
                 try:
                     self._learn_idx = max(0, int(getattr(self, "_learn_idx", 0)) - 1)
                 except Exception:
@@ -42,31 +42,18 @@ class ExpressionsScreen:
         self.expressions_popup = Popup(
             title="Expressions & Phrases", content=root, size_hint=(0.95, 0.92), auto_dismiss=True
         )
+        pool = self.widget_pool
         def rebuild_list(query: str):
-            grid.clear_widgets()
+            pool.release_children(grid)
             q = (query or "").strip().lower()
-            filtered = [t for t in self.expressions if (not q or q in t.lower())]
+            filtered = self.search_index.filter(self.expressions, q)
             max_items = 400
             show = filtered[:max_items]
             if not show:
                 grid.add_widget(Label(text="No entries.", size_hint_y=None, height=40, font_size=20, color=(0.8,0.8,0.8,1)))
                 return
             for phrase in show:
-                btn = Button(
-                    text=phrase,
-                    size_hint_y=None,
-                    height=56,
-                    font_size=32,
-                    background_normal='',
-                    background_color=(0, 0, 0, 0),
-                    color=(0.95,0.98,1,1),
-                    halign='left',
-                    valign='middle'
-                )
-                btn.text_size = (grid.width, None)
-                grid.bind(width=lambda inst, val, b=btn: setattr(b, 'text_size', (val, None)))
-                btn.bind(on_release=lambda *_x, p=phrase: self._open_word_meanings_editor(p))
-                grid.add_widget(btn)
+                pool.list_button(grid, phrase, lambda *_x, p=phrase: self._open_word_meanings_editor(p))
                 key = (phrase or "").lower()
                 _ipa = (self.word_ipa.get(key, "") or "").strip()
                 if _ipa:
@@ -107,6 +94,7 @@ class ExpressionsScreen:
                 pass
             self._expr_rebuild = None
             self._expr_search_widget = None
+            pool.release_children(grid)
         self.expressions_popup.bind(on_open=(lambda *_: rebuild_list(search_input.text)))
         self.expressions_popup.bind(on_dismiss=(_cleanup_expr_refs))
         self.expressions_popup.open()
@@ -196,6 +184,9 @@ class ExpressionsScreen:
                 # In Liste der Redewendungen aufnehmen (unique, Reihenfolge)
                 if phrase not in self.expressions:
                     self.expressions.append(phrase)
+                    mt = getattr(self, "_phrase_matcher", None)
+                    if mt is not None:
+                        mt.add(phrase)
 
                 # Bedeutung/Beispiele als Eintrag mergen
                 key = phrase.lower()
@@ -203,6 +194,7 @@ class ExpressionsScreen:
                 items = list(self.word_details.get(key, []))
                 items.append(entry)
                 self.word_details[key] = items
+                self._reindex_entry(key)
 
                 # speichern
                 if hasattr(self, "_store"):
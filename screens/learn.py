@@ -16,7 +16,7 @@ class LearnScreen:
         root = BoxLayout(orientation='vertical', spacing=10, padding=12)
 
         # Modus: Reihenfolge
-        modes = ("Random", "Newest", "Oldest")
+        modes = ("Random", "Newest", "Oldest", "Most useful")
         prefs = self._get_prefs()
         saved_mode = "Random"
         try:
@@ -120,15 +120,27 @@ class LearnScreen:
             pass
 
     def _learn_candidates(self) -> list[str]:
-        removed_lower = set(self.removed_words)
+        # gecacht, bis sich neu/entfernt (oder new_sequence) ändert – "Next" sortiert nicht jedes Mal neu
+        mode = self.learn_order_mode
+        key = (getattr(self, "_status_version", 0), id(self.new_words), id(self.removed_words),
+               id(self.new_sequence), len(self.new_sequence), mode)
+        cached = getattr(self, "_learn_candidates_cache", None)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        removed_lower = self.removed_words
         base = [w for w in self.new_sequence if (w in self.new_words and w.lower() not in removed_lower)]
-        rest = [w for w in self.new_words if (w not in base and w.lower() not in removed_lower)]
+        in_base = set(base)
+        rest = [w for w in self.new_words if (w not in in_base and w.lower() not in removed_lower)]
         seq = base + rest
-        if self.learn_order_mode == "Oldest":
-            return seq
-        if self.learn_order_mode == "Newest":
-            return list(reversed(seq))
-        return seq  # Zufällig: Reihenfolge egal, Auswahl erfolgt zufällig
+        if mode == "Newest":
+            seq.reverse()
+        elif mode == "Most useful":
+            # häufigste Wörter zuerst (Frequenztabelle in res/), bei Gleichstand älteste zuerst
+            zipf = self.word_freq.zipf
+            seq.sort(key=lambda w: -zipf(w))
+        # Oldest/Zufällig: Reihenfolge wie gelernt, die Auswahl bei Zufällig erfolgt zufällig
+        self._learn_candidates_cache = (key, seq)
+        return seq
 
     def _learn_next_word(self, *_):
         prev = getattr(self, "learn_current_word", None)
@@ -194,6 +206,7 @@ class LearnScreen:
             self.learned_log[lw] = _dt.date.today().isoformat()
         except Exception:
             pass
+        self._log_event("learn", w)
         (self.schedule_update_lists() if hasattr(self, "schedule_update_lists") else self.update_lists())
         try:
             self._store.save_async()
@@ -221,6 +234,7 @@ class LearnScreen:
             self.new_words.add(w)
         if w not in self.new_sequence:
             self.new_sequence.append(w)
+        self._log_event("mark_new", w)
         (self.schedule_update_lists() if hasattr(self, "schedule_update_lists") else self.update_lists())
         try:
             self._store.save_async()
@@ -246,6 +260,8 @@ class LearnScreen:
             pass
         self.learned_session = [x for x in self.learned_session if x.lower() != lw]
         self.learned_log.pop(lw, None)
+        self.review_schedule.forget(lw)
+        self._log_event("remove", w)
         (self.schedule_update_lists() if hasattr(self, "schedule_update_lists") else self.update_lists())
         self.update_display()
         try:
@@ -1,6 +1,6 @@
-import re
-import json
 import random
+import threading
+import math
 from pathlib import Path
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.gridlayout import GridLayout
@@ -11,6 +11,10 @@ from kivy.uix.textinput import TextInput
 from kivy.uix.spinner import Spinner
 from kivy.uix.togglebutton import ToggleButton
 from kivy.uix.widget import Widget
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleboxlayout import RecycleBoxLayout
+from kivy.uix.progressbar import ProgressBar
+from kivy.uix.filechooser import FileChooserListView
 from kivy.core.window import Window
 from kivy.graphics import Color, Rectangle
 from kivy.core.text import LabelBase
@@ -23,19 +27,44 @@ import os
 from ui.widgets import RoundedButton as Button
 from services.tts import TTSService
 from services.stt import STTService
+from services.audio import create_backend
+from services.speech_metrics import SpeechMetrics
+from services.text_analyzer import TextAnalyzer
+from services.word_importer import WordImporter, clean_entry, merge_sorted
 from persistence.progress_store import ProgressStore
+from persistence.event_store import EventStore
+from ui.pool import WidgetPool
+from ui.learned_view import LearnedEntryView, HEADER_HEIGHT, entry_height
+from persistence.audio_cache import AudioCache
 from .dictionary import DictionaryScreen
 from .expressions import ExpressionsScreen
 from .learn import LearnScreen
 from .review import ReviewScreen
 from screens.dashboard import DashboardScreen
+from .debug import DebugScreen
 from models.state import AppState
-
-class VocabularyApp(DictionaryScreen, ExpressionsScreen, LearnScreen, ReviewScreen, DashboardScreen, BoxLayout):
+from models.activity import LearnedLog
+from models.search_index import SearchIndex, detail_texts
+from models.prefix_index import PrefixIndex
+from models.fuzzy_index import FuzzyIndex
+from models.lemmatizer import Lemmatizer, candidates, AMBIGUOUS
+from models.phrase_matcher import PhraseMatcher
+from models.word_freq import WordFrequency
+from models.vocab_cache import load_words as load_vocab_words
+from models.review_schedule import ReviewSchedule
+from models.decks import DeckRegistry, TrackedSet, USER_DECK
+
+# ab so vielen geänderten Wörtern werden die Indizes neu gebaut statt einzeln aktualisiert
+BULK_INDEX_CHANGE = 2000
+
+class VocabularyApp(DictionaryScreen, ExpressionsScreen, LearnScreen, ReviewScreen, DashboardScreen, DebugScreen, BoxLayout):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         # State MUSS vor Property-Settern existieren
         self.state = AppState()
+        # Deck-Registry zählt über die Status-Mengen mit (siehe _tracked)
+        self.decks = DeckRegistry(Path(__file__).resolve().parent.parent / "res", reader=self.load_vocabulary_from_json)
+        self.focus_deck: str | None = None
 
         self.vocabulary = []
         self.known_words = set()
@@ -101,9 +130,8 @@ class VocabularyApp(DictionaryScreen, ExpressionsScreen, LearnScreen, ReviewScre
             self.rect = Rectangle(size=Window.size, pos=self.pos)
         self.bind(size=self._update_rect, pos=self._update_rect)
 
-        # Daten laden
-        vocab_json = Path(__file__).resolve().parent.parent / "res" / "b1_word_from_cambridge.json"
-        self.vocabulary = self.load_vocabulary_from_json(vocab_json)
+        # Daten laden: nur die aktivierten Decks (Standard: B1)
+        self.vocabulary = self._load_enabled_decks()
         if not self.vocabulary:
             self.show_error_popup("No vocabulary found.")
             return
@@ -122,8 +150,12 @@ class VocabularyApp(DictionaryScreen, ExpressionsScreen, LearnScreen, ReviewScre
         self.auto_mark_known_on_next = True
 
         # Services
-        self.tts = TTSService()
-        self.stt = STTService(model_size="base")
+        self.audio = create_backend()
+        self.speech_metrics = SpeechMetrics()
+        self.tts_cache = AudioCache(Path(__file__).resolve().parent.parent / "res" / "tts_cache.bin")
+        self.word_freq = WordFrequency(Path(__file__).resolve().parent.parent / "res" / "word_freq.bin")
+        self.tts = TTSService(backend=self.audio, metrics=self.speech_metrics, cache=self.tts_cache)
+        self.stt = STTService(**self._stt_options(), backend=self.audio, metrics=self.speech_metrics)
         Clock.schedule_once(lambda dt: self.tts.init_async(), 0)
 
         # Persistenz
@@ -131,6 +163,10 @@ class VocabularyApp(DictionaryScreen, ExpressionsScreen, LearnScreen, ReviewScre
         self.progress_file.parent.mkdir(parents=True, exist_ok=True)
         self._store = ProgressStore(self, self.progress_file)
         self._store.load()
+        self.speech_metrics_file = self.progress_file.with_name("speech_metrics.jsonl")
+        self.events = EventStore(self.progress_file.with_name("voca_events.sqlite3"))
+        self.widget_pool = WidgetPool()
+        Window.bind(on_key_down=self._on_debug_key)
 
         # displayed_words ist nur für die aktuelle Sitzung – nach App-Start leeren
         self.displayed_words = set()
@@ -143,20 +179,62 @@ class VocabularyApp(DictionaryScreen, ExpressionsScreen, LearnScreen, ReviewScre
         self.update_lists()
 
     # Proxy-Properties – bestehende Attribute bleiben nutzbar
+    @property
+    def vocabulary(self): return self.state.vocabulary
+    @vocabulary.setter
+    def vocabulary(self, v):
+        old = self.state.vocabulary
+        self.state.vocabulary = list(v)
+        self._on_vocabulary_changed(old, self.state.vocabulary)
+
     @property
     def new_words(self): return self.state.new_words
     @new_words.setter
-    def new_words(self, v): self.state.new_words = set(v) if not isinstance(v, set) else v
+    def new_words(self, v):
+        self.state.new_words = self._tracked(v)
+        self._deck_reset()
+
+    @property
+    def displayed_words(self): return self.state.displayed_words
+    @displayed_words.setter
+    def displayed_words(self, v):
+        self.state.displayed_words = self._tracked(v)
+        self._deck_reset()
+
+    @property
+    def user_words(self): return self.state.user_words
+    @user_words.setter
+    def user_words(self, v):
+        self.state.user_words = TrackedSet(v, lambda w: self.decks.add_member(USER_DECK, w),
+                                           lambda w: self.decks.remove_member(USER_DECK, w))
+        self.decks.reset_members(USER_DECK, self.state.user_words)
 
     @property
     def known_words(self): return self.state.known_words
     @known_words.setter
-    def known_words(self, v): self.state.known_words = set(v) if not isinstance(v, set) else v
+    def known_words(self, v):
+        self.state.known_words = self._tracked(v)
+        self._deck_reset()
 
     @property
     def removed_words(self): return self.state.removed_words
     @removed_words.setter
-    def removed_words(self, v): self.state.removed_words = set(v) if not isinstance(v, set) else v
+    def removed_words(self, v):
+        self.state.removed_words = self._tracked(v)
+        self._deck_reset()
+
+    def _tracked(self, items) -> TrackedSet:
+        # gezeigt/bekannt/neu/entfernt: jede Änderung passt die Restzähler der Decks an
+        return TrackedSet(items, lambda w: self._status_changed(w, 1), lambda w: self._status_changed(w, -1))
+
+    def _status_changed(self, word: str, delta: int):
+        # _status_version: Zähler für Caches, die von den Status-Mengen abhängen (Lernreihenfolge)
+        self._status_version = getattr(self, "_status_version", 0) + 1
+        self.decks.mark(word, delta)
+
+    def _deck_reset(self):
+        s = self.state
+        self.decks.reset(s.vocabulary, (s.displayed_words, s.known_words, s.new_words, s.removed_words))
 
     @property
     def new_sequence(self): return self.state.new_sequence
@@ -188,6 +266,21 @@ class VocabularyApp(DictionaryScreen, ExpressionsScreen, LearnScreen, ReviewScre
     @expressions.setter
     def expressions(self, v): self.state.expressions = list(v)
 
+    @property
+    def learned_log(self): return self.state.learned_log
+    @learned_log.setter
+    def learned_log(self, v):
+        new = v if isinstance(v, LearnedLog) else LearnedLog(v)
+        old = self.state.learned_log
+        if old is not new and isinstance(old, LearnedLog):
+            new.adopt_listeners(old)
+        self.state.learned_log = new
+
+    @property
+    def review_schedule(self): return self.state.review_schedule
+    @review_schedule.setter
+    def review_schedule(self, v): self.state.review_schedule = v if isinstance(v, ReviewSchedule) else ReviewSchedule.from_json(v)
+
     @property
     def current_word(self): return self.state.current_word
     @current_word.setter
@@ -215,6 +308,9 @@ class VocabularyApp(DictionaryScreen, ExpressionsScreen, LearnScreen, ReviewScre
         self.review_main_btn.bind(on_release=self.open_review_popup)
         self.dashboard_btn = Button(text="Dashboard", font_size=22, size_hint=(None, 1), width=200, background_color=self.theme["success"], color=self.theme["text"])
         self.dashboard_btn.bind(on_release=self.open_dashboard_popup)
+        self.decks_button = Button(text="Decks", font_size=22, size_hint=(None, 1), width=160, background_color=self.theme["surface"])
+        self.decks_button.bind(on_release=self.open_decks_popup)
+        header.add_widget(self.decks_button)
         header.add_widget(self.add_words_button)
         header.add_widget(self.words_button)
         header.add_widget(self.expressions_button)
@@ -354,8 +450,9 @@ class VocabularyApp(DictionaryScreen, ExpressionsScreen, LearnScreen, ReviewScre
             except Exception:
                 pass
 
-        # WIRKLICHE Attributnamen der 7 Header-Buttons
+        # WIRKLICHE Attributnamen der Header-Buttons
         for name in (
+            "decks_button",
             "add_words_button",
             "words_button",          # <- dieser ist "Neue Wörter von Text überprüfen"
             "expressions_button",
@@ -443,6 +540,7 @@ class VocabularyApp(DictionaryScreen, ExpressionsScreen, LearnScreen, ReviewScre
             pass
         if hasattr(self, "new_sequence") and w not in self.new_sequence:
             self.new_sequence.append(w)
+        self._log_event("mark_new", w)
         # 2) UI aktualisieren
         if hasattr(self, "update_display"):
             self.update_display()
@@ -481,54 +579,113 @@ class VocabularyApp(DictionaryScreen, ExpressionsScreen, LearnScreen, ReviewScre
         self.rect.size = instance.size
 
     def load_vocabulary_from_json(self, json_path) -> list[str]:
+        # klein geschrieben + sortiert aus dem Binär-Cache (.vcache), neu gebaut nur bei geänderter Quelle
         p = Path(json_path)
         if not p.exists():
             return []
         try:
-            with open(p, "r", encoding="utf-8") as f:
-                obj = json.load(f)
-            items = obj.get("words", []) if isinstance(obj, dict) else obj
-            out, seen = [], set()
-            for w in items or []:
-                if not isinstance(w, str):
-                    continue
-                s = w.strip()
-                if len(s) < 2:
-                    continue
-                lw = s.lower()
-                if lw not in seen:
-                    seen.add(lw)
-                    out.append(s)
-            return sorted(out, key=str.lower)
+            return load_vocab_words(p)
         except Exception:
             return []
 
     def _rebuild_eligible_pool(self):
-        removed_lower = set(self.removed_words)
-        known_lower = {w.lower() for w in self.known_words}
-        new_lower = {w.lower() for w in self.new_words}
-        shown_lower = {w.lower() for w in self.displayed_words}
-        self._eligible_pool = [
-            w for w in self.vocabulary
-            if (w.lower() not in shown_lower)
-            and (w.lower() not in known_lower)
-            and (w.lower() not in new_lower)
-            and (w.lower() not in removed_lower)
-        ]
+        # nur das gewählte Deck (oder alles); Status kommt aus der Registry, keine Mengen pro Aufruf
+        self._eligible_pool = self.decks.eligible(self.focus_deck)
         self._eligible_dirty = False
 
     def _recompute_remaining(self):
-        removed_lower = set(self.removed_words)
-        known_lower = {w.lower() for w in self.known_words}
-        new_lower = {w.lower() for w in self.new_words}
-        shown_lower = {w.lower() for w in self.displayed_words}
-        self.remaining_count = sum(
-            1 for w in self.vocabulary
-            if (w.lower() not in shown_lower)
-            and (w.lower() not in known_lower)
-            and (w.lower() not in new_lower)
-            and (w.lower() not in removed_lower)
-        )
+        self.remaining_count = self.decks.remaining(self.focus_deck)
+
+    def _progress_text(self) -> str:
+        deck = self.decks.get(self.focus_deck) if self.focus_deck else None
+        return f"{self.remaining_count} Words left" + (f" • {deck.name}" if deck else "")
+
+    # ---- Decks ----
+    def _load_enabled_decks(self) -> list[str]:
+        # aktivierte Decks einlesen (nur diese); Fokus-Deck aus den Einstellungen
+        enabled, focus = ["b1"], None
+        try:
+            prefs = self._get_prefs()
+            if prefs.exists("decks"):
+                enabled = list(prefs.get("decks").get("enabled") or enabled)
+                focus = prefs.get("decks").get("focus") or None
+        except Exception:
+            pass
+        words = set()
+        for deck_id in enabled:
+            if self.decks.get(deck_id) is None or deck_id == USER_DECK:
+                continue
+            try:
+                words.update(self.decks.load(deck_id))
+            except Exception:
+                pass
+        self.decks.load(USER_DECK)
+        self.focus_deck = focus if (focus and self.decks.is_loaded(focus)) else None
+        return sorted(words)
+
+    def _save_deck_prefs(self):
+        try:
+            enabled = [d.id for d in self.decks.decks() if d.id != USER_DECK and self.decks.is_loaded(d.id)]
+            self._get_prefs().put("decks", enabled=enabled, focus=self.focus_deck or "")
+        except Exception:
+            pass
+
+    def activate_deck(self, deck_id: str):
+        # erstes Aktivieren liest das Deck ein; neue Wörter per Merge ins sortierte Vokabular
+        if not self.decks.is_loaded(deck_id):
+            try:
+                words = self.decks.load(deck_id)
+            except Exception as e:
+                self.show_error_popup(f"Could not load deck: {e}")
+                return
+            new = sorted({w for w in words if w not in self.prefix_index}, key=str.lower)
+            if new:
+                self.vocabulary = merge_sorted(self.vocabulary, new)
+            self._save_deck_prefs()
+        self.set_focus_deck(deck_id)
+
+    def set_focus_deck(self, deck_id: str | None):
+        # Wechsel = anderer Zähler + Pool aus den ID-Arrays; das Vokabular bleibt unverändert
+        self.focus_deck = deck_id if (deck_id and self.decks.is_loaded(deck_id)) else None
+        self._save_deck_prefs()
+        self._eligible_dirty = True
+        self._recompute_remaining()
+        self.update_display()
+
+    def open_decks_popup(self, *_):
+        root = BoxLayout(orientation='vertical', spacing=8, padding=12)
+        sv = ScrollView(size_hint=(1, 1))
+        grid = GridLayout(cols=1, spacing=6, size_hint_y=None)
+        grid.bind(minimum_height=grid.setter('height'))
+        sv.add_widget(grid)
+        root.add_widget(sv)
+        close_btn = Button(text="Close", font_size=22, size_hint=(1, None), height=56, background_color=self.theme["closeButton"])
+        root.add_widget(close_btn)
+        popup = Popup(title="Decks", content=root, size_hint=(0.9, 0.85), auto_dismiss=True)
+        close_btn.bind(on_release=lambda *_: popup.dismiss())
+
+        def _row(title, info, action, active, on_press):
+            row = BoxLayout(size_hint_y=None, height=60, spacing=8)
+            row.add_widget(Label(text=title, font_size=26, color=self.theme["text"], size_hint=(0.4, 1)))
+            row.add_widget(Label(text=info, font_size=20, color=self.theme["muted"], size_hint=(0.35, 1)))
+            btn = Button(text=action, font_size=22, size_hint=(0.25, 1),
+                         background_color=self.theme["success"] if active else self.theme["primary"])
+            btn.disabled = active
+            btn.bind(on_release=lambda *_: (popup.dismiss(), on_press()))
+            row.add_widget(btn)
+            grid.add_widget(row)
+
+        _row("All decks", f"{self.decks.remaining(None)} left", "Studying" if self.focus_deck is None else "Study",
+             self.focus_deck is None, lambda: self.set_focus_deck(None))
+        for deck in self.decks.decks():
+            if self.decks.is_loaded(deck.id):
+                info = f"{self.decks.remaining(deck.id)} of {self.decks.size(deck.id)} left"
+                active = self.focus_deck == deck.id
+                _row(deck.name, info, "Studying" if active else "Study", active,
+                     lambda d=deck.id: self.set_focus_deck(d))
+            else:
+                _row(deck.name, deck.kind, "Load", False, lambda d=deck.id: self.activate_deck(d))
+        popup.open()
 
     def schedule_update_lists(self):
         if getattr(self, "_lists_update_scheduled", False):
@@ -573,6 +730,7 @@ class VocabularyApp(DictionaryScreen, ExpressionsScreen, LearnScreen, ReviewScre
         except ValueError:
             pass
         self.learned_session = [x for x in self.learned_session if x.lower() != lw]
+        self._log_event("remove", w)
         self.next_word(None)
 
     def next_word(self, instance):
@@ -591,7 +749,7 @@ class VocabularyApp(DictionaryScreen, ExpressionsScreen, LearnScreen, ReviewScre
             # nichts anzeigen
             if getattr(self, "word_label", None):
                 self.word_label.text = ""
-            self.progress_label.text = f"{self.remaining_count} words remaining"
+            self.progress_label.text = self._progress_text()
             return
         self.displayed_words.add(new_word)
         self.word_history.append(new_word)
@@ -599,8 +757,7 @@ class VocabularyApp(DictionaryScreen, ExpressionsScreen, LearnScreen, ReviewScre
             self.word_history = self.word_history[-self.max_history:]
         self.history_index = len(self.word_history) - 1
         self.current_word = new_word
-        if self.remaining_count > 0:
-            self.remaining_count -= 1
+        self._recompute_remaining()
         self.update_display()
         self.schedule_update_lists()
         self._store.save_async()
@@ -614,7 +771,7 @@ class VocabularyApp(DictionaryScreen, ExpressionsScreen, LearnScreen, ReviewScre
 
     def update_display(self):
         # Fortschritt immer aktualisieren
-        self.progress_label.text = f"{self.remaining_count} Words left"
+        self.progress_label.text = self._progress_text()
         # Hinweis immer anzeigen
         if getattr(self, "hint_label", None):
             self.hint_label.opacity = 1.0
@@ -755,6 +912,7 @@ class VocabularyApp(DictionaryScreen, ExpressionsScreen, LearnScreen, ReviewScre
             self.new_words.add(w)
         if w not in self.new_sequence:
             self.new_sequence.append(w)
+        self._log_event("mark_new", w)
         self.clear_selection()
         self.schedule_update_lists()
         self._store.save_async()
@@ -785,6 +943,8 @@ class VocabularyApp(DictionaryScreen, ExpressionsScreen, LearnScreen, ReviewScre
             pass
         self.learned_session = [x for x in self.learned_session if x.lower() != lw]
         self.learned_log.pop(lw, None)
+        self.review_schedule.forget(lw)
+        self._log_event("remove", w)
         self.clear_selection()
         self.schedule_update_lists()
         self.update_display()
@@ -812,6 +972,8 @@ class VocabularyApp(DictionaryScreen, ExpressionsScreen, LearnScreen, ReviewScre
         try: self.new_sequence.remove(w)
         except ValueError: pass
 
+        self._log_event("restore", w)
+
         # 3) Sofort im Mainscreen anzeigen (wie in Voca.py)
         self.current_word = w
         self.displayed_words.add(w)
@@ -864,32 +1026,52 @@ class VocabularyApp(DictionaryScreen, ExpressionsScreen, LearnScreen, ReviewScre
         grid.bind(minimum_height=grid.setter('height'))
         sv.add_widget(grid)
         root.add_widget(sv)
+        pool = self.widget_pool
+        allowed = {(w or "").lower() for w in words}
+        max_items, chunk = 400, 60
+        stream = {"it": None, "n": 0, "ev": None, "capped": False, "q": ""}
+
+        def _add_chunk(dt=None):
+            # Treffer kommen lazily aus dem Generator, ein Block pro Frame
+            it = stream["it"]
+            if it is None:
+                return
+            for w in it:
+                pool.list_button(grid, w, lambda *_x, word=w: self.open_dictionary_popup(word))
+                stream["n"] += 1
+                if stream["n"] >= max_items:
+                    stream["capped"] = next(it, None) is not None
+                    if stream["capped"]:
+                        grid.add_widget(Label(text="… more – refine the search …", size_hint_y=None, height=32, font_size=18, color=(0.8,0.8,0.8,1)))
+                    stream["it"] = None
+                    break
+                if stream["n"] % chunk == 0:
+                    stream["ev"] = Clock.schedule_once(_add_chunk, 0)
+                    break
+            else:
+                stream["it"] = None
+                if stream["n"] == 0 and stream["q"]:
+                    # nichts gefunden: Tippfehler-Vorschläge aus dem Fuzzy-Index
+                    for w in self._similar_words(stream["q"], limit=12):
+                        if w.lower() in allowed:
+                            pool.list_button(grid, f"Did you mean: {w}?", lambda *_x, word=w: setattr(search_input, 'text', word), color=(0.75, 0.85, 1, 1))
+            only_tw = (tt_filter_btn is not None and tt_filter_btn.state == 'down')
+            more = "+" if (stream["it"] is not None or stream["capped"]) else ""
+            header_lbl.text = f"{title} — {stream['n']}{more}" + (" • TT" if only_tw else "")
+
         def rebuild_list(query_text: str):
-            grid.clear_widgets()
-            q = (query_text or "").strip().lower()
+            if stream["ev"]:
+                stream["ev"].cancel()
+            pool.release_children(grid)
             only_tw = (tt_filter_btn is not None and tt_filter_btn.state == 'down')
-            filtered = [w for w in words if (not q or q in w.lower()) and (not only_tw or (w.lower() in self.tongue_twisters))]
-            header_lbl.text = f"{title} — {len(filtered)}" + (" • TT" if only_tw else "")
-            max_items = 400
-            for w in filtered[:max_items]:
-                btn = Button(
-                    text=w, size_hint_y=None, height=56, font_size=32,
-                    background_normal='', background_color=(0, 0, 0, 0),
-                    color=(0.95,0.98,1,1), halign='left', valign='middle'
-                )
-                btn.text_size = (grid.width, None)
-                grid.bind(width=lambda inst, val, b=btn: setattr(b, 'text_size', (val, None)))
-                btn.bind(on_release=lambda *_x, word=w: self.open_dictionary_popup(word))
-                grid.add_widget(btn)
-            if len(filtered) > max_items:
-                grid.add_widget(Label(text=f"… {len(filtered)-max_items} more …", size_hint_y=None, height=32, font_size=18, color=(0.8,0.8,0.8,1)))
+            results = self._search_words(words, query_text, allowed)
+            stream["it"] = (w for w in results if (not only_tw or (w.lower() in self.tongue_twisters)))
+            stream["n"] = 0
+            stream["capped"] = False
+            stream["q"] = (query_text or "").strip()
+            _add_chunk()
         rebuild_list("")
-        _pending = {"ev": None}
-        def _debounced(*_):
-            if _pending["ev"]:
-                try: _pending["ev"].cancel()
-                except Exception: pass
-            _pending["ev"] = Clock.schedule_once(lambda dt: rebuild_list(search_input.text), 0.12)
+        _debounced = Clock.create_trigger(lambda dt: rebuild_list(search_input.text), 0.05)
         search_input.bind(text=lambda inst, val: _debounced())
         if tt_filter_btn is not None:
             tt_filter_btn.bind(state=lambda inst, val: _debounced())
@@ -899,7 +1081,13 @@ class VocabularyApp(DictionaryScreen, ExpressionsScreen, LearnScreen, ReviewScre
         root.add_widget(bar)
         popup = Popup(title=title, content=root, size_hint=(0.95, 0.92), auto_dismiss=True)
         close_btn.bind(on_release=lambda *_: popup.dismiss())
-        popup.bind(on_dismiss=lambda *_: (_pending["ev"].cancel() if _pending["ev"] else None))
+        def _on_dismiss(*_):
+            _debounced.cancel()
+            if stream["ev"]:
+                stream["ev"].cancel()
+            stream["it"] = None
+            pool.release_children(grid)
+        popup.bind(on_dismiss=_on_dismiss)
         popup.open()
 
     # --- Manuelle Wörter hinzufügen ---
@@ -926,49 +1114,168 @@ class VocabularyApp(DictionaryScreen, ExpressionsScreen, LearnScreen, ReviewScre
         
         bar = BoxLayout(size_hint=(1, 0.18), spacing=10)
         cancel_btn = Button(text="Cancel", font_size=30, background_color=self.theme["closeButton"])
+        import_btn = Button(text="Import file…", font_size=30, background_color=(0.25, 0.55, 0.9, 1))
         add_btn = Button(text="Add (New)", font_size=30, background_color=(0.2, 0.6, 0.2, 1))
-        bar.add_widget(cancel_btn); bar.add_widget(add_btn)
+        bar.add_widget(cancel_btn); bar.add_widget(import_btn); bar.add_widget(add_btn)
         content.add_widget(bar)
         self.add_popup = Popup(title="Add new words", content=content, size_hint=(0.9, 0.9), auto_dismiss=True)
         cancel_btn.bind(on_release=lambda *_: self.add_popup.dismiss())
+        import_btn.bind(on_release=lambda *_: self._open_file_chooser(
+            "Import word list", ["*.csv", "*.tsv", "*.txt"], "Import", self._import_words_file))
         add_btn.bind(on_release=self._commit_added_words)
         self.add_popup.open()
 
     def _commit_added_words(self, *_):
         txt = self.add_words_input.text or ""
-        added = self._add_words_from_text(txt)
+        similar, skipped = [], []
+        added = self._add_words_from_text(txt, similar, skipped)
         try: self.add_popup.dismiss()
         except Exception: pass
         self.update_lists(); self.update_display()
         self._store.save_async()
-        if added:
+        if skipped:
+            self._offer_skipped_forms(skipped, added)
+        if similar:
+            self._offer_merge_suggestions(similar)
+        elif added and not skipped:
             self.show_error_popup(f"{added} new words added.", duration=2)
 
-    def _add_words_from_text(self, text: str) -> int:
+    def _offer_skipped_forms(self, pairs, added: int):
+        # pairs: [(form, grundform)] – beim Hinzufügen als Flexion weggelassen, einzeln nachholbar
+        root = BoxLayout(orientation='vertical', spacing=8, padding=12)
+        root.add_widget(Label(text=f"{added} new words added. Skipped as forms of existing words:", font_size=22,
+                              size_hint=(1, None), height=40, color=(0.9, 0.95, 1, 1)))
+        sv = ScrollView(size_hint=(1, 1))
+        grid = GridLayout(cols=1, spacing=6, size_hint_y=None)
+        grid.bind(minimum_height=grid.setter('height'))
+        sv.add_widget(grid)
+        root.add_widget(sv)
+
+        def _add(btn, form):
+            if self._add_words_from_text(form, keep_forms=True):
+                self.schedule_update_lists(); self.update_display()
+                self._store.save_async()
+            btn.text = f"{form} (added)"
+            btn.disabled = True
+
+        for form, base in pairs:
+            btn = Button(text=f"Add {form} (form of {base})", font_size=22, size_hint=(1, None), height=52,
+                         background_normal='', background_color=(0.25, 0.55, 0.9, 1))
+            btn.bind(on_release=lambda inst, f=form: _add(inst, f))
+            grid.add_widget(btn)
+        close_btn = Button(text="OK", font_size=22, size_hint=(1, None), height=56, background_color=self.theme["closeButton"])
+        root.add_widget(close_btn)
+        popup = Popup(title="Word forms", content=root, size_hint=(0.85, 0.7), auto_dismiss=True)
+        close_btn.bind(on_release=lambda *_: popup.dismiss())
+        popup.open()
+
+    # --- Wortlisten importieren (CSV/TSV/Text) ---
+    def _import_words_file(self, path):
+        try: self.add_popup.dismiss()
+        except Exception: pass
+        # der Worker prüft gegen eingefrorene, case-gefaltete Kopien – das Vokabular darf sich
+        # währenddessen im Hauptthread ändern (_apply_import prüft dann noch einmal)
+        known = frozenset(w.casefold() for w in self.vocabulary)
+        removed = frozenset(self.removed_words)
+        old = getattr(self, "_word_importer", None)
+        if old is not None:
+            old.cancel()
+        importer = self._word_importer = WordImporter(lambda w: w.casefold() in known, lambda w: w in removed,
+                                                      pos_tags=self.pos_tags)
+        root = BoxLayout(orientation='vertical', spacing=10, padding=12)
+        status = Label(text=f"{Path(path).name}: reading…", font_size=24, size_hint=(1, 0.3), color=(0.95, 0.98, 1, 1))
+        bar = ProgressBar(max=100, value=0, size_hint=(1, 0.1))
+        cancel_btn = Button(text="Cancel", font_size=24, size_hint=(1, None), height=56, background_color=self.theme["closeButton"])
+        root.add_widget(status)
+        root.add_widget(bar)
+        root.add_widget(Widget())
+        root.add_widget(cancel_btn)
+        popup = Popup(title="Import word list", content=root, size_hint=(0.8, 0.5), auto_dismiss=False)
+        cancel_btn.bind(on_release=lambda *_: (importer.cancel(), popup.dismiss()))
+
+        def on_progress(done, total, rows):
+            bar.value = 100.0 * done / total if total else 100.0
+            status.text = f"{Path(path).name}: {bar.value:.0f}% • {rows} rows"
+
+        def on_done(result):
+            if result.cancelled:
+                return
+            popup.dismiss()
+            if result.error:
+                self.show_error_popup(f"Import failed: {result.error}")
+                return
+            added, details = self._apply_import(result)
+            self.show_error_popup(
+                f"{result.rows} rows read\n{added} new words • {details} meanings added\n"
+                f"{result.duplicates} already known • {result.invalid} skipped"
+            )
+        popup.open()
+        importer.start(path, on_progress, on_done)
+
+    def _apply_import(self, result) -> tuple[int, int]:
+        # läuft im Hauptthread; neue Wörter per Merge (beide Listen sortiert) statt Neusortierung
+        new = [w for w in result.words if w not in self.prefix_index and w not in self.removed_words]
+        if new:
+            self.user_words.update(new)
+            self.vocabulary = merge_sorted(self.vocabulary, new)
+            seq = set(self.new_sequence)
+            for w in new:
+                self.known_words.discard(w)
+                self.new_words.add(w)
+                if w not in seq:
+                    self.new_sequence.append(w)
+        details = 0
+        for key, items in result.details.items():
+            existing = list(self.word_details.get(key, []))
+            have = {((it.get("meaning") or "").strip().lower(), tuple(it.get("examples") or ())) for it in existing}
+            add = [it for it in items if (it["meaning"].lower(), tuple(it["examples"])) not in have]
+            if add:
+                self.word_details[key] = existing + add
+                self._reindex_entry(key)
+                details += len(add)
+        for key, ipa in result.ipa.items():
+            if not (self.word_ipa.get(key) or "").strip():
+                self.word_ipa[key] = ipa
+        self.schedule_update_lists(); self.update_display()
+        self._store.save_async()
+        return len(new), details
+
+    def _add_words_from_text(self, text: str, similar: list | None = None, skipped: list | None = None,
+                             keep_forms: bool = False) -> int:
+        # similar (optional) sammelt (neues Wort, [ähnliche vorhandene Wörter]) für Merge-Vorschläge,
+        # skipped (optional) die weggelassenen Flexionsformen als (form, grundform)
         lines = text.splitlines()
-        existing_lower = set(w.lower() for w in self.vocabulary) | set(self.removed_words)
+        vocab_lower = set(w.lower() for w in self.vocabulary)
+        existing_lower = vocab_lower | set(self.removed_words)
         to_add = []
         for raw in lines:
-            s = (raw or "").strip()
-            if not s:
-                continue
-            s = re.sub(r'^[\-\*\u2022]+\s*', '', s)
-            s = s.replace("’", "'").replace("‘", "'")
-            s = re.sub(r"[^A-Za-z'\-\s]", "", s)
-            s = re.sub(r"\s*-\s*", "-", s)
-            s = re.sub(r"-{2,}", "-", s)
-            s = re.sub(r"^-+|-+$", "", s)
-            s = re.sub(r"\s+", " ", s).strip()
-            if len(s) < 2:
+            w = clean_entry(raw)
+            if not w:
                 continue
-            w = s.lower()
             if w not in existing_lower:
                 to_add.append(w)
                 existing_lower.add(w)
+        # Flexionsformen weglassen, wenn die Grundform im Vokabular steht oder mit hinzugefügt wird;
+        # mehrdeutige Formen (saw, left, …) bleiben immer
+        if not keep_forms:
+            bases = vocab_lower | set(to_add)
+            kept = []
+            for w in to_add:
+                base = None if (" " in w or w in AMBIGUOUS) else next((c for c in candidates(w) if c in bases), None)
+                if base is None:
+                    kept.append(w)
+                elif skipped is not None:
+                    skipped.append((w, base))
+            to_add = kept
         if not to_add:
             return 0
+        if similar is not None:
+            for w in to_add:
+                cands = self._similar_words(w)
+                if cands:
+                    similar.append((w, cands))
         self.user_words.update(to_add)
-        self.vocabulary = sorted(set(self.vocabulary).union(to_add), key=lambda x: x.lower())
+        self.vocabulary = merge_sorted(self.vocabulary, sorted(to_add, key=str.lower))
         for w in to_add:
             self.known_words.discard(w)
             if w not in self.new_words:
@@ -981,7 +1288,7 @@ class VocabularyApp(DictionaryScreen, ExpressionsScreen, LearnScreen, ReviewScre
     def open_text_check_popup(self, *_):
         content = BoxLayout(orientation='vertical', spacing=10, padding=12)
         info = Label(
-            text="Paste plain text. Words found will be checked\nagainst your vocabulary (case-insensitive, length > 2).",
+            text="Paste plain text or open a text file. Words found will be checked\nagainst your vocabulary (case-insensitive, length > 2).",
             font_size=30, size_hint=(1, 0.14), color=(0.9, 0.95, 1, 1)
         )
         content.add_widget(info)
@@ -1000,38 +1307,130 @@ class VocabularyApp(DictionaryScreen, ExpressionsScreen, LearnScreen, ReviewScre
         content.add_widget(self.text_check_input)
         bar = BoxLayout(size_hint=(1, 0.18), spacing=10)
         cancel_btn = Button(text="Cancel", font_size=30, background_color=self.theme["closeButton"])
+        file_btn = Button(text="Open file…", font_size=30, background_color=(0.25, 0.55, 0.9, 1))
         check_btn = Button(text="Check", font_size=30, background_color=(0.2, 0.6, 0.2, 1))
-        bar.add_widget(cancel_btn); bar.add_widget(check_btn)
+        bar.add_widget(cancel_btn); bar.add_widget(file_btn); bar.add_widget(check_btn)
         content.add_widget(bar)
         self.text_check_popup = Popup(title="Check words", content=content, size_hint=(0.95, 0.92), auto_dismiss=True)
         cancel_btn.bind(on_release=(lambda *_: self.text_check_popup.dismiss()))
+        file_btn.bind(on_release=self._open_text_check_file_chooser)
         check_btn.bind(on_release=self._analyze_text_and_show_results)
+        self.text_check_popup.bind(on_dismiss=lambda *_: self._cancel_text_analysis())
         self.text_check_popup.open()
 
+    def _new_text_analyzer(self) -> TextAnalyzer:
+        # pro Lauf eingefrorene Kopien (Vokabular case-gefaltet, entfernte Wörter, Ausdrücke): der Worker
+        # liest nichts, was der Hauptthread währenddessen ändert (Import, neue Ausdrücke, Index-Neubau)
+        known = frozenset(w.casefold() for w in self.vocabulary)
+        removed = frozenset(self.removed_words)
+        old = getattr(self, "_text_analyzer", None)
+        if old is not None:
+            old.cancel()
+        ta = self._text_analyzer = TextAnalyzer(known.__contains__, removed.__contains__,
+                                                lemmatize=Lemmatizer(known.__contains__).lemma,
+                                                matcher=self.phrase_matcher.snapshot(),
+                                                rank=self._text_word_rank)
+        return ta
+
+    def _cancel_text_analysis(self):
+        ta = getattr(self, "_text_analyzer", None)
+        if ta is not None:
+            ta.cancel()
+
+    def _text_word_rank(self, word: str, count: int) -> float:
+        # allgemeine Häufigkeit (Zipf 0–8) plus Häufigkeit im Text (log10)
+        return self.word_freq.zipf(word) + math.log10(max(1, count))
+
+    def _open_text_check_file_chooser(self, *_):
+        self._open_file_chooser("Open text file", ["*.txt", "*.md", "*.srt", "*.csv"], "Check file",
+                                lambda path: self._start_text_analysis(Path(path).name, lambda ta, on_p, on_d: ta.analyze_file(path, on_p, on_d)))
+
+    def _open_file_chooser(self, title: str, filters, action_text: str, on_pick):
+        root = BoxLayout(orientation='vertical', spacing=8, padding=8)
+        chooser = FileChooserListView(path=str(Path.home()), filters=list(filters), size_hint=(1, 1))
+        root.add_widget(chooser)
+        bar = BoxLayout(size_hint=(1, None), height=56, spacing=8)
+        cancel_btn = Button(text="Cancel", font_size=22, background_color=self.theme["closeButton"])
+        open_btn = Button(text=action_text, font_size=22, background_color=(0.2, 0.6, 0.2, 1))
+        bar.add_widget(cancel_btn); bar.add_widget(open_btn)
+        root.add_widget(bar)
+        popup = Popup(title=title, content=root, size_hint=(0.9, 0.9), auto_dismiss=True)
+
+        def _open(*_a):
+            sel = chooser.selection
+            if not sel or os.path.isdir(sel[0]):
+                return
+            popup.dismiss()
+            on_pick(sel[0])
+        cancel_btn.bind(on_release=lambda *_a: popup.dismiss())
+        open_btn.bind(on_release=_open)
+        chooser.bind(on_submit=lambda *_a: _open())
+        popup.open()
+
     def _analyze_text_and_show_results(self, *_):
         txt = self.text_check_input.text or ""
-        uniques = self._extract_words_from_free_text(txt)
-        existing_lower = set(w.lower() for w in self.vocabulary)
-        unknown = [w for w in uniques if (w not in existing_lower and w not in self.removed_words)]
-        known_in = [w for w in uniques if w in existing_lower]
+        self._start_text_analysis("Text", lambda ta, on_p, on_d: ta.analyze_text(txt, on_p, on_d))
+
+    def _start_text_analysis(self, source: str, run):
+        # Fortschrittsansicht; Tokenisieren und Abgleich laufen im Hintergrund-Thread
+        ta = self._new_text_analyzer()
+        root = BoxLayout(orientation='vertical', spacing=10, padding=12)
+        status = Label(text=f"{source}: analyzing…", font_size=24, size_hint=(1, 0.3), color=(0.95, 0.98, 1, 1))
+        bar = ProgressBar(max=100, value=0, size_hint=(1, 0.1))
+        cancel_btn = Button(text="Cancel", font_size=24, size_hint=(1, None), height=56, background_color=self.theme["closeButton"])
+        root.add_widget(status)
+        root.add_widget(bar)
+        root.add_widget(Widget())
+        root.add_widget(cancel_btn)
+        self.text_check_popup.content = root
+        cancel_btn.bind(on_release=lambda *_: (ta.cancel(), self.text_check_popup.dismiss()))
+
+        def on_progress(done, total, unique):
+            pct = (100.0 * done / total) if total else 100.0
+            bar.value = pct
+            status.text = f"{source}: analyzing… {pct:.0f}% • {unique} unique words"
+
+        def on_done(result):
+            if result.cancelled:
+                return
+            if result.error:
+                self.text_check_popup.dismiss()
+                self.show_error_popup(f"Could not read the text: {result.error}")
+                return
+            self._show_text_check_results(result)
+        run(ta, on_progress, on_done)
+
+    def _show_text_check_results(self, result):
+        unknown = result.unknown
         self.text_unknown_words = unknown
 
         root = BoxLayout(orientation='vertical', spacing=10, padding=12)
         header = Label(
-            text=f"In text: {len(uniques)} unique • New: {len(unknown)} • Known: {len(known_in)}",
+            text=f"In text: {result.unique} unique • New: {len(unknown)} • Known: {result.known}",
             font_size=20, size_hint=(1, 0.12), color=(0.95, 0.98, 1, 1)
         )
+        if result.phrases:
+            header.text += f" • Expressions: {len(result.phrases)}"
         root.add_widget(header)
-        sv = ScrollView(size_hint=(1, 0.72))
-        gl = GridLayout(cols=1, spacing=6, size_hint_y=None, padding=(0, 6))
-        gl.bind(minimum_height=gl.setter('height'))
+        # virtualisiert: nur sichtbare Zeilen existieren als Widgets
+        rv = RecycleView(size_hint=(1, 0.72), do_scroll_x=False)
+        rv.viewclass = 'Label'
+        layout = RecycleBoxLayout(orientation='vertical', spacing=6, padding=(0, 6), size_hint_y=None,
+                                  default_size=(None, 48), default_size_hint=(1, None))
+        layout.bind(minimum_height=layout.setter('height'))
+        rv.add_widget(layout)
+        data = []
+        if result.phrases:
+            data.append({"text": "Your expressions in this text:", "font_size": 22, "color": (0.75, 0.85, 1, 1)})
+            data.extend({"text": f"{p}  ×{n}" if n > 1 else p, "font_size": 28, "color": (0.6, 0.9, 0.7, 1)}
+                        for p, n in result.phrases)
+            data.append({"text": "New words:", "font_size": 22, "color": (0.75, 0.85, 1, 1)})
         if unknown:
-            for w in unknown:
-                gl.add_widget(Label(text=w, size_hint_y=None, height=48, font_size=28, color=(0.95,0.98,1,1)))
+            data.extend({"text": w, "font_size": 28, "color": (0.95, 0.98, 1, 1)} for w in unknown)
         else:
-            gl.add_widget(Label(text="No new words found.", size_hint_y=None, height=48, font_size=24, color=(0.6,0.9,0.7,1)))
-        sv.add_widget(gl)
-        root.add_widget(sv)
+            data.append({"text": "No new words found.", "font_size": 24, "color": (0.6, 0.9, 0.7, 1)})
+        rv.data = data
+        root.add_widget(rv)
         bar = BoxLayout(size_hint=(1, 0.16), spacing=10)
         # Fix: Close-Button mit fester Optik
         close_btn = Button(
@@ -1049,24 +1448,17 @@ class VocabularyApp(DictionaryScreen, ExpressionsScreen, LearnScreen, ReviewScre
         close_btn.bind(on_release=lambda *_: self.text_check_popup.dismiss())
         add_btn.bind(on_release=self._commit_add_from_text_check)
 
-    def _extract_words_from_free_text(self, text: str):
-        # erlaubt z. B. far-out, it's, mother-in-law
-        tokens = re.findall(r"[A-Za-z]+(?:[-'][A-Za-z]+)*", text or "")
-        words = [t.lower() for t in tokens if len(t) > 2]
-        # unique + sortiert für stabile Anzeige
-        return sorted(set(words))
-
     def _commit_add_from_text_check(self, *_):
         to_add = list(dict.fromkeys(getattr(self, "text_unknown_words", []) or []))
         if not to_add:
             try: self.text_check_popup.dismiss()
             except Exception: pass
             return
-        to_add = [w for w in to_add if w.lower() not in self.removed_words]
+        to_add = [w for w in to_add if w.lower() not in self.removed_words and w not in self.prefix_index]
         if to_add:
             self.user_words.update(to_add)
-            self.vocabulary = sorted(set(self.vocabulary).union(to_add), key=lambda x: x.lower())
-            self.remaining_count += len(to_add)
+            self.vocabulary = merge_sorted(self.vocabulary, sorted(to_add, key=str.lower))
+            self._recompute_remaining()
         self.schedule_update_lists()
         self.update_display()
         self._store.save_async()
@@ -1075,6 +1467,30 @@ class VocabularyApp(DictionaryScreen, ExpressionsScreen, LearnScreen, ReviewScre
         self.show_error_popup(f"{len(to_add)} words added to the vocabulary. Use 'Next word' to classify them.", duration=3)
 
     # --- Alle gelernten Wörter ---
+    def _learned_detail_lines(self, w: str) -> list[tuple]:
+        # Detailzeilen eines Eintrags: (text, font_size, color, indent_left, font_name)
+        key = (w or "").lower()
+        lines = []
+        _ipa = (self.word_ipa.get(key, "") or "").strip()
+        if _ipa:
+            lines.append((f"[IPA] {_ipa}", 24, (0.8, 0.95, 0.9, 1), 12, self.font_ipa_name or None))
+        entries = list(self.word_details.get(key, []) or [])
+        if not entries:
+            lines.append(("– No meanings available –", 20, (0.8, 0.8, 0.8, 1), 12, None))
+        for idx, item in enumerate(entries, start=1):
+            meaning = (item.get("meaning", "") or "").strip()
+            ex_list = item.get("examples")
+            if not isinstance(ex_list, list):
+                ex_single = (item.get("example", "") or "").strip()
+                ex_list = [ex_single] if ex_single else []
+            pos = [p for p in (item.get("pos") or []) if isinstance(p, str)]
+            pos_str = f"({', '.join(pos)}) " if pos else ""
+            if meaning:
+                lines.append((f"{idx}. {pos_str}{meaning}", 35, (0.9, 0.95, 1, 1), 12, None))
+            for ex in ex_list:
+                lines.append((f"- {ex}", 30, (0.8, 0.9, 1, 1), 36, None))
+        return lines
+
     def open_all_learned_popup(self, *_, initial_only_tw: bool = False):
         if not self.learned_session and not self.expressions:
             self.show_error_popup("No learned words or expressions.")
@@ -1087,11 +1503,13 @@ class VocabularyApp(DictionaryScreen, ExpressionsScreen, LearnScreen, ReviewScre
         tt_filter_btn = ToggleButton(text="Tongue‑twister", size_hint=(None, 1), width=220, state='down' if initial_only_tw else 'normal')
         search_row.add_widget(search_input); search_row.add_widget(tt_filter_btn)
         root.add_widget(search_row)
-        sv = ScrollView(size_hint=(1, 0.76))
-        gl = GridLayout(cols=1, spacing=10, size_hint_y=None, padding=(0, 6))
-        gl.bind(minimum_height=gl.setter('height'))
-        sv.add_widget(gl)
-        root.add_widget(sv)
+        # Virtualisierte Liste: nur Einträge im/nahe dem Sichtbereich bekommen Widgets
+        rv = RecycleView(size_hint=(1, 0.76), viewclass=LearnedEntryView, do_scroll_x=False)
+        rv_layout = RecycleBoxLayout(orientation='vertical', spacing=10, padding=(0, 6), size_hint_y=None,
+                                     default_size_hint=(1, None), default_size=(None, HEADER_HEIGHT), key_size='size')
+        rv_layout.bind(minimum_height=rv_layout.setter('height'))
+        rv.add_widget(rv_layout)
+        root.add_widget(rv)
         bar = BoxLayout(size_hint=(1, 0.08))
         close_btn = Button(text="Close", font_size=24, size_hint=(1, 1), background_color=self.theme["closeButton"])
         bar.add_widget(close_btn)
@@ -1099,101 +1517,49 @@ class VocabularyApp(DictionaryScreen, ExpressionsScreen, LearnScreen, ReviewScre
         self.learned_popup = Popup(title="Learned words", content=root, size_hint=(0.95, 0.92), auto_dismiss=True)
         close_btn.bind(on_release=lambda *_: self.learned_popup.dismiss())
 
+        state = {"items": [], "lines": {}}
+
+        def _on_play(word):
+            self._speak(word)
+
+        def _on_open(word):
+            self.open_dictionary_popup(word)
+
+        def _fill(*_):
+            # Höhen aus dem Layout-Cache; nur bei Filter- oder Breitenänderung
+            width = rv.width
+            lines_for = state["lines"]
+            data = []
+            for w in state["items"]:
+                lines = lines_for.get(w)
+                if lines is None:
+                    lines = lines_for[w] = self._learned_detail_lines(w)
+                data.append({"word": w, "lines": lines, "size": (width, entry_height(lines, width)),
+                             "on_play": _on_play, "on_open": _on_open})
+            rv.data = data
+
+        refill = Clock.create_trigger(_fill, 0)
+        rv.bind(width=lambda *_: refill())
+
         def rebuild_list(query_text: str):
-            gl.clear_widgets()
             q = (query_text or "").strip().lower()
             only_tw = (tt_filter_btn.state == 'down')
             words = list(reversed(self.learned_session))
             for expr in self.expressions:
                 if expr not in words:
                     words.append(expr)
-            filtered = [w for w in words if (not q or q in w.lower()) and (not only_tw or (w.lower() in self.tongue_twisters))]
+            filtered = [w for w in self._search_words(words, q) if (not only_tw or (w.lower() in self.tongue_twisters))]
             total = len(self.learned_session) + len(self.expressions)
-            header.text = f"{total} learned words & expressions" + (" • TT" if only_tw else "")
-
-            if not filtered:
-                gl.add_widget(Label(text="No results.", size_hint_y=None, height=40, font_size=20, color=(0.8,0.8,0.8,1)))
-                return
-
-            # Performance: begrenzen + in Chunks zeichnen
-            max_items = 300
-            items = filtered[:max_items]
-            overflow = len(filtered) - max_items
-
-            # Optional: Lade-Hinweis
-            gl.add_widget(Label(text="Loading …", size_hint_y=None, height=32, font_size=18, color=(0.8,0.8,0.8,1)))
-
-            chunk = 40
-            state = {"i": 0, "added_header": False}
-
-            def add_chunk(dt=None):
-                start = state["i"]
-                end = min(start + chunk, len(items))
-                if start == 0 and gl.children:
-                    # Ersten Lade-Hinweis entfernen
-                    try:
-                        gl.remove_widget(gl.children[0])
-                    except Exception:
-                        pass
-                for w in items[start:end]:
-                    row = BoxLayout(orientation='horizontal', size_hint_y=None, height=56, spacing=6)
-                    play_btn = Button(text='Hören', size_hint=(None, 1), width=80, font_size=24,
-                                      background_normal='', background_color=(0.25,0.55,0.9,1))
-                    play_btn.bind(on_release=lambda *_w, word=w: self._speak(word))
-                    w_btn = Button(
-                        text=w, font_size=35, size_hint=(1, None), height=56,
-                        background_normal='', background_color=(0, 0, 0, 0), color=(0.95, 0.98, 1, 1),
-                        halign='left', valign='middle'
-                    )
-                    w_btn.padding = (8, 0)
-                    w_btn.bind(size=lambda inst, val: setattr(inst, 'text_size', (inst.width, inst.height)))
-                    w_btn.bind(on_release=lambda *_w, word=w: self.open_dictionary_popup(word))
-
-                    row.add_widget(play_btn)
-                    row.add_widget(w_btn)
-                    gl.add_widget(row)
-
-                    # IPA anzeigen (falls vorhanden)
-                    _ipa = (self.word_ipa.get((w or "").lower(), "") or "").strip()
-                    if _ipa:
-                        self._add_wrapped_label(
-                            gl, f"[IPA] {_ipa}", 24,
-                            color=(0.8, 0.95, 0.9, 1),
-                            indent_left=12,
-                            font_name=self.font_ipa_name or None
-                        )
-
-                    # Bedeutungen/Beispiele anzeigen
-                    entries = list(self.word_details.get((w or "").lower(), []) or [])
-                    if not entries:
-                        self._add_wrapped_label(gl, "– No meanings available –", 20, color=(0.8, 0.8, 0.8, 1), indent_left=12)
-                    else:
-                        for idx, item in enumerate(entries, start=1):
-                            meaning = (item.get("meaning", "") or "").strip()
-                            ex_list = item.get("examples")
-                            if not isinstance(ex_list, list):
-                                ex_single = (item.get("example", "") or "").strip()
-                                ex_list = [ex_single] if ex_single else []
-                            pos = [p for p in (item.get("pos") or []) if isinstance(p, str)]
-                            pos_str = f"({', '.join(pos)}) " if pos else ""
-                            if meaning:
-                                self._add_wrapped_label(gl, f"{idx}. {pos_str}{meaning}", 35, color=(0.9, 0.95, 1, 1), indent_left=12)
-                            for ex in ex_list:
-                                self._add_wrapped_label(gl, f"- {ex}", 30, color=(0.8, 0.9, 1, 1), indent_left=36)
-
-                state["i"] = end
-                if end < len(items):
-                    Clock.schedule_once(add_chunk, 0)
-                else:
-                    if overflow > 0:
-                        gl.add_widget(Label(text=f"… {overflow} more …", size_hint_y=None, height=32, font_size=18, color=(0.8,0.8,0.8,1)))
-
-            add_chunk()
+            header.text = (f"{total} learned words & expressions" if filtered else "No results.") + (" • TT" if only_tw else "")
+            state["items"] = filtered
+            state["lines"] = {}   # Details können sich geändert haben
+            refill()
 
         self._learned_list_refresh = rebuild_list
         self._learned_list_search_widget = search_input
         rebuild_list(search_input.text)
-        search_input.bind(text=lambda inst, val: rebuild_list(val))
+        _debounced = Clock.create_trigger(lambda dt: rebuild_list(search_input.text), 0.12)
+        search_input.bind(text=lambda inst, val: _debounced())
         tt_filter_btn.bind(state=lambda inst, val: rebuild_list(search_input.text))
 
         def _cleanup_refs(*_):
@@ -1202,6 +1568,8 @@ class VocabularyApp(DictionaryScreen, ExpressionsScreen, LearnScreen, ReviewScre
                 self._learned_list_search_widget = None
             except Exception:
                 pass
+            _debounced.cancel()
+            refill.cancel()
         self.learned_popup.bind(on_dismiss=_cleanup_refs)
         self.learned_popup.open()
 
@@ -1250,7 +1618,7 @@ class VocabularyApp(DictionaryScreen, ExpressionsScreen, LearnScreen, ReviewScre
         save_btn.bind(on_release=self._commit_correction)
         self.correct_popup.open()
 
-    def _commit_correction(self, *_):
+    def _commit_correction(self, *_, confirmed: bool = False):
         old = self.current_word
         new_raw = getattr(self, "correct_input", None).text if getattr(self, "correct_input", None) else ""
         new = self._sanitize_single_word(new_raw)
@@ -1266,6 +1634,14 @@ class VocabularyApp(DictionaryScreen, ExpressionsScreen, LearnScreen, ReviewScre
             wl = w.lower()
             if wl not in existing_lower_map:
                 existing_lower_map[wl] = w
+        if not confirmed and new_l != old_l and new_l not in existing_lower_map:
+            similar = self._similar_words(new, exclude=(old,))
+            if similar:
+                def _merge(cand):
+                    self.correct_input.text = cand
+                    self._commit_correction(confirmed=True)
+                self._confirm_fuzzy_merge(new, similar, _merge, lambda: self._commit_correction(confirmed=True))
+                return
         if new_l == old_l:
             self._replace_word_everywhere(old, new)
         else:
@@ -1311,6 +1687,7 @@ class VocabularyApp(DictionaryScreen, ExpressionsScreen, LearnScreen, ReviewScre
                 if nl not in self.learned_log:
                     self.learned_log[nl] = self.learned_log[ol]
                 self.learned_log.pop(ol, None)
+            self.review_schedule.rename(ol, nl)
         except Exception:
             pass
         self.learned_session = self._unique_preserve_order([new if w == old else w for w in self.learned_session])
@@ -1347,6 +1724,7 @@ class VocabularyApp(DictionaryScreen, ExpressionsScreen, LearnScreen, ReviewScre
             if ol in self.learned_log and cl not in self.learned_log:
                 self.learned_log[cl] = self.learned_log[ol]
             self.learned_log.pop(ol, None)
+            self.review_schedule.rename(ol, cl)
         except Exception:
             pass
         self.learned_session = self._unique_preserve_order([canonical if w == old else w for w in self.learned_session])
@@ -1358,6 +1736,57 @@ class VocabularyApp(DictionaryScreen, ExpressionsScreen, LearnScreen, ReviewScre
         except Exception:
             pass
 
+    def _confirm_fuzzy_merge(self, word: str, candidates, on_merge, on_keep):
+        # "Meintest du …?" vor dem Umbenennen: in ein ähnliches Wort zusammenführen oder so übernehmen
+        root = BoxLayout(orientation='vertical', spacing=8, padding=12)
+        root.add_widget(Label(text=f"'{word}' looks like an existing word:", font_size=22, size_hint=(1, None), height=40, color=(0.9, 0.95, 1, 1)))
+        popup = Popup(title="Possible duplicate", content=root, size_hint=(0.8, 0.6), auto_dismiss=True)
+        for cand in candidates:
+            btn = Button(text=f"Merge into '{cand}'", font_size=22, size_hint=(1, None), height=56, background_color=(0.25, 0.55, 0.9, 1))
+            btn.bind(on_release=lambda *_x, c=cand: (popup.dismiss(), on_merge(c)))
+            root.add_widget(btn)
+        root.add_widget(Widget())
+        keep_btn = Button(text=f"Keep '{word}'", font_size=22, size_hint=(1, None), height=56, background_color=(0.2, 0.6, 0.2, 1))
+        keep_btn.bind(on_release=lambda *_x: (popup.dismiss(), on_keep()))
+        root.add_widget(keep_btn)
+        popup.open()
+
+    def _offer_merge_suggestions(self, pairs):
+        # pairs: [(neues_wort, [ähnliche vorhandene Wörter])] – jede Zeile einzeln zusammenführbar
+        if not pairs:
+            return
+        root = BoxLayout(orientation='vertical', spacing=8, padding=12)
+        root.add_widget(Label(text="Possible duplicates of existing words:", font_size=22, size_hint=(1, None), height=40, color=(0.9, 0.95, 1, 1)))
+        sv = ScrollView(size_hint=(1, 1))
+        grid = GridLayout(cols=1, spacing=6, size_hint_y=None)
+        grid.bind(minimum_height=grid.setter('height'))
+        sv.add_widget(grid)
+        root.add_widget(sv)
+
+        def _merge(btn, word, cand):
+            if word not in self.vocabulary or cand not in self.vocabulary:
+                btn.disabled = True
+                return
+            self._merge_word_into_canonical(word, cand)
+            if self.current_word == word:
+                self.current_word = cand
+            btn.text = f"{word} → {cand} (merged)"
+            btn.disabled = True
+            self.schedule_update_lists(); self.update_display()
+            self._store.save_async()
+
+        for word, cands in pairs:
+            for cand in cands:
+                btn = Button(text=f"Merge {word} → {cand}", font_size=22, size_hint=(1, None), height=52,
+                             background_normal='', background_color=(0.25, 0.55, 0.9, 1))
+                btn.bind(on_release=lambda inst, w=word, c=cand: _merge(inst, w, c))
+                grid.add_widget(btn)
+        close_btn = Button(text="Keep all", font_size=22, size_hint=(1, None), height=56, background_color=self.theme["closeButton"])
+        root.add_widget(close_btn)
+        popup = Popup(title="Similar words", content=root, size_hint=(0.85, 0.7), auto_dismiss=True)
+        close_btn.bind(on_release=lambda *_: popup.dismiss())
+        popup.open()
+
     def _move_word_details(self, old: str, new: str):
         try:
             ol = (old or "").lower(); nl = (new or "").lower()
@@ -1376,6 +1805,7 @@ class VocabularyApp(DictionaryScreen, ExpressionsScreen, LearnScreen, ReviewScre
                     self.word_ipa[nl] = ipa
                 try: del self.word_ipa[ol]
                 except Exception: pass
+            self._reindex_entry(nl)
         except Exception:
             pass
 
@@ -1392,6 +1822,18 @@ class VocabularyApp(DictionaryScreen, ExpressionsScreen, LearnScreen, ReviewScre
         except Exception:
             pass
 
+    def _stt_options(self) -> dict:
+        # Ergebnis von "python -m services.stt_calibration" (falls vorhanden)
+        opts = {"model_size": "base", "precision": "fp32", "num_threads": None}
+        try:
+            prefs = self._get_prefs()
+            if prefs.exists("stt"):
+                saved = prefs.get("stt")
+                opts.update({k: saved[k] for k in opts if saved.get(k)})
+        except Exception:
+            pass
+        return opts
+
     def _init_stt_async(self):
         def _on_loaded(stt_obj):
             self.stt = stt_obj
@@ -1415,6 +1857,7 @@ class VocabularyApp(DictionaryScreen, ExpressionsScreen, LearnScreen, ReviewScre
             self.new_words.add(w)
         if w not in self.new_sequence:
             self.new_sequence.append(w)
+        self._log_event("mark_new", w)
         # UI und Persistenz
         self.schedule_update_lists()
         try:
@@ -1422,36 +1865,135 @@ class VocabularyApp(DictionaryScreen, ExpressionsScreen, LearnScreen, ReviewScre
         except Exception:
             pass
 
-    def _add_wrapped_label(self, parent, text, font_size, color=(1,1,1,1), indent_left=0, font_name=None):
-        # Label + Einrückung in eine eigene Zeile (BoxLayout)
-        lbl = Label(
-            text=text, font_size=font_size, color=color,
-            halign='left', valign='top', size_hint_y=None
-        )
-        if font_name:
-            lbl.font_name = font_name
+    # ---- Volltextindex ----
+    @property
+    def search_index(self) -> SearchIndex:
+        # erst bei der ersten Suche aufbauen, danach inkrementell pflegen
+        ix = getattr(self, "_search_index", None)
+        if ix is None:
+            ix = SearchIndex()
+            for w in list(self.vocabulary) + list(self.expressions):
+                key = (w or "").lower()
+                ix.set_entry(key, detail_texts(self.word_details.get(key)))
+            self._search_index = ix
+        return ix
+
+    @property
+    def prefix_index(self) -> PrefixIndex:
+        ix = getattr(self, "_prefix_index", None)
+        if ix is None:
+            ix = self._prefix_index = PrefixIndex(self.vocabulary)
+        return ix
 
-        row = BoxLayout(orientation='horizontal', size_hint_y=None, height=font_size + 8, spacing=4)
-        spacer = Widget(size_hint=(None, 1), width=indent_left)
-        row.add_widget(spacer)
-        row.add_widget(lbl)
-        parent.add_widget(row)
+    @property
+    def phrase_matcher(self) -> PhraseMatcher:
+        # Aho-Corasick über die Ausdrücke; neue Ausdrücke kommen per add() dazu
+        mt = getattr(self, "_phrase_matcher", None)
+        if mt is None:
+            mt = self._phrase_matcher = PhraseMatcher(self.expressions)
+        return mt
 
-        def _recalc(*_):
-            try:
-                avail_w = max(10, parent.width - indent_left - 4)
-                lbl.text_size = (avail_w, None)   # Wrap aktivieren
-                lbl.texture_update()
-                new_h = max(font_size + 6, lbl.texture_size[1] + 6)
-                lbl.height = new_h                 # Label-Höhe setzen
-                row.height = new_h                 # Zeilenhöhe MIT aktualisieren!
-            except Exception:
-                pass
+    @property
+    def fuzzy_index(self) -> FuzzyIndex:
+        ix = getattr(self, "_fuzzy_index", None)
+        if ix is None:
+            ix = self._fuzzy_index = FuzzyIndex(self.vocabulary)
+        return ix
+
+    def _rebuild_fuzzy_index_async(self):
+        # bis der neue Index steht, antwortet der alte (ohne die gerade importierten Wörter)
+        gen = self._fuzzy_build = getattr(self, "_fuzzy_build", 0) + 1
+        snapshot = list(self.vocabulary)
+        def install(ix):
+            if gen != self._fuzzy_build:
+                return
+            # Änderungen während des Aufbaus nachziehen (klein)
+            cur, snap = set(self.vocabulary), set(snapshot)
+            for w in snap - cur:
+                ix.remove(w)
+            for w in cur - snap:
+                ix.add(w)
+            self._fuzzy_index = ix
+        def worker():
+            ix = FuzzyIndex(snapshot)
+            Clock.schedule_once(lambda dt: install(ix), 0)
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _similar_words(self, word: str, exclude=(), limit: int = 3) -> list[str]:
+        # Tippfehler-Kandidaten aus dem Vokabular (ohne das Wort selbst); kurze Wörter nur Distanz 1
+        wl = (word or "").strip().lower()
+        if not wl:
+            return []
+        skip = {wl} | {(e or "").lower() for e in exclude}
+        max_d = 1 if len(wl) < 5 else 2
+        try:
+            hits = self.fuzzy_index.lookup(wl, max_distance=max_d, limit=limit + len(skip))
+        except Exception:
+            return []
+        return [w for w, _d in hits if w.lower() not in skip][:limit]
 
-        # Bei Breiten- und Texture-Änderung neu berechnen
-        parent.bind(width=lambda *_: _recalc())
-        lbl.bind(texture_size=lambda *_: _recalc())
-        Clock.schedule_once(lambda dt: _recalc(), 0)
+    def _search_words(self, words, query: str, allowed: set | None = None):
+        # Präfixtreffer (sortiert, per bisect) zuerst, danach übrige Volltexttreffer – als Generator
+        q = (query or "").strip()
+        if not q:
+            yield from words
+            return
+        if allowed is None:
+            allowed = {(w or "").lower() for w in words}
+        seen = set()
+        for w in self.prefix_index.iter_prefix(q):
+            wl = w.lower()
+            if wl in allowed and wl not in seen:
+                seen.add(wl)
+                yield w
+        for w in self.search_index.filter(words, q):
+            if w.lower() not in seen:
+                yield w
+
+    def _reindex_entry(self, key: str):
+        ix = getattr(self, "_search_index", None)
+        if ix is not None and key:
+            key = key.lower()
+            ix.set_entry(key, detail_texts(self.word_details.get(key)))
+
+    def _on_vocabulary_changed(self, old, new):
+        old_s, new_s = set(old), set(new)
+        for w in old_s - new_s:
+            self.decks.set_present(w, False)
+        for w in new_s - old_s:
+            self.decks.set_present(w, True)
+        removed, added = old_s - new_s, new_s - old_s
+        if len(removed) + len(added) > BULK_INDEX_CHANGE:
+            # großer Import: Präfixindex in einem Rutsch neu, Fuzzy-Index (teuer) im Hintergrund
+            if getattr(self, "_prefix_index", None) is not None:
+                self._prefix_index = PrefixIndex(new)
+            if getattr(self, "_fuzzy_index", None) is not None:
+                self._rebuild_fuzzy_index_async()
+        else:
+            for ix in (getattr(self, "_prefix_index", None), getattr(self, "_fuzzy_index", None)):
+                if ix is None:
+                    continue
+                for w in removed:
+                    ix.remove(w)
+                for w in added:
+                    ix.add(w)
+        ix = getattr(self, "_search_index", None)
+        if ix is None:
+            return
+        old_l = {(w or "").lower() for w in old}
+        new_l = {(w or "").lower() for w in new}
+        expr_l = {(e or "").lower() for e in self.expressions}
+        for key in old_l - new_l - expr_l:
+            ix.remove(key)
+        for key in new_l - old_l:
+            ix.set_entry(key, detail_texts(self.word_details.get(key)))
+
+    def _log_event(self, kind: str, word: str | None = None, value: float | None = None):
+        # Lernhistorie (append-only); Fehler dürfen die UI nie blockieren
+        try:
+            self.events.log(kind, word, value)
+        except Exception:
+            pass
 
     def _get_prefs(self) -> JsonStore:
         if not hasattr(self, "_prefs"):
@@ -6,14 +6,38 @@ from kivy.uix.label import Label
 from kivy.uix.textinput import TextInput
 from kivy.uix.anchorlayout import AnchorLayout
 from kivy.uix.togglebutton import ToggleButton
+from kivy.uix.spinner import Spinner
 from ui.widgets import RoundedButton as Button
 from kivy.clock import Clock
 import random
+import re
+import time
 import datetime as _dt
+from models.review_schedule import DueQueue, GRADES
+
+def _tokens(text: str) -> list[str]:
+    return re.findall(r"[\w'-]+", (text or "").lower())
+
+def _spoken_match(target: str, text: str) -> bool:
+    # Ziel (Wort oder Ausdruck) kommt als zusammenhängende Tokenfolge in der Transkription vor
+    want, heard = _tokens(target), _tokens(text)
+    n = len(want)
+    return bool(n) and any(heard[i:i + n] == want for i in range(len(heard) - n + 1))
+
+def _fmt_wait(seconds: float) -> str:
+    if seconds < 3600:
+        return f"{max(1, int(seconds // 60))} min"
+    if seconds < 86400:
+        return f"{int(seconds // 3600)} h"
+    return f"{int(seconds // 86400)} d"
 
 class ReviewScreen:
     def open_review_popup(self, *_):
         review_pool = []
+        queue = None        # DueQueue über den gefilterten Pool
+        by_key = {}         # lower -> Wort/Ausdruck wie angezeigt
+        ordered = []        # Pool nach Lerndatum (älteste zuerst) für Newest/Oldest
+        order_idx = 0
         root = BoxLayout(orientation='vertical', spacing=10, padding=12)
         filter_row = BoxLayout(size_hint=(1, 0.12), spacing=8, height=20)
         lbl_from = Label(text="From:", font_size=18, size_hint=(None, 1), width=60, color=(0.9,0.95,1,1))
@@ -26,6 +50,17 @@ class ReviewScreen:
         filter_row.add_widget(tt_filter_btn)
         root.add_widget(filter_row)
 
+        # Persist review order ("Due" = Spaced Repetition, fälligste Karte zuerst)
+        modes = ("Due", "Random", "Newest", "Oldest")
+        prefs = self._get_prefs()
+        saved_mode = "Due"
+        try:
+            if prefs.exists("review"): saved_mode = prefs.get("review").get("order_mode") or "Due"
+        except Exception: pass
+        self.review_order_mode = saved_mode if saved_mode in modes else "Due"
+        order_spin = Spinner(text=self.review_order_mode, values=modes, size_hint=(None, 1), width=150)
+        filter_row.add_widget(order_spin)
+
         word_btn = Button(
             text="", font_size=64, size_hint=(1, 0.28),
             background_normal='', background_color=(0, 0, 0, 0),
@@ -58,23 +93,25 @@ class ReviewScreen:
         bar = BoxLayout(size_hint=(1, 0.10), spacing=8)
         close_btn = Button(text="Close", font_size=24, background_color=self.theme["closeButton"])
         reveal_btn = Button(text="Show", font_size=24, background_color=(0.25,0.55,0.9,1))
-        next_btn = Button(text="Next", font_size=24, background_color=(0.4,0.8,0.4,1))
-        bar.add_widget(close_btn); bar.add_widget(reveal_btn); bar.add_widget(next_btn)
+        bar.add_widget(close_btn); bar.add_widget(reveal_btn)
+        # Bewertung = nächste Karte; die Farben gehen von "vergessen" bis "sehr leicht"
+        grade_colors = {"Again": self.theme["danger"], "Hard": self.theme["warning"],
+                        "Good": self.theme["success"], "Easy": self.theme["accent"]}
+        grade_btns = []
+        for name in GRADES:
+            b = Button(text=name, font_size=24, background_color=grade_colors[name])
+            bar.add_widget(b)
+            grade_btns.append(b)
         root.add_widget(bar)
         self.review_popup = Popup(title="Review", content=root, size_hint=(0.95, 0.9), auto_dismiss=True)
 
-        # Fix: Toggle für „Anzeigen“ steuern
+        # Fix: Toggle für „Anzeigen“ steuern (wieder frei bei jeder neuen Karte, siehe _show_next_word)
         reveal_btn.bind(on_release=lambda *_: setattr(reveal_btn, "disabled", True))
-        next_btn.bind(on_release=lambda *_: setattr(reveal_btn, "disabled", False))
 
-        # Persist review order
-        modes = ("Random", "Newest", "Oldest")
-        prefs = self._get_prefs()
-        saved_mode = "Random"
-        try:
-            if prefs.exists("review"): saved_mode = prefs.get("review").get("order_mode") or "Random"
-        except Exception: pass
-        self.review_order_mode = saved_mode if saved_mode in modes else "Random"
+        def _enable_card(on: bool):
+            for b in grade_btns:
+                b.disabled = not on
+            reveal_btn.disabled = not on
 
         def _parse_date(s: str):
             s = (s or "").strip()
@@ -90,18 +127,63 @@ class ReviewScreen:
                     continue
             return None
 
-        def _show_random_word(*_):
+        def _learned_ts(key: str) -> float:
+            # nie bewertete Karten: fällig ab Lerndatum (älteste zuerst), ohne Datum sofort
+            try:
+                d = _dt.date.fromisoformat((self.learned_log.get(key, "") or "").strip())
+                return _dt.datetime.combine(d, _dt.time()).timestamp()
+            except Exception:
+                return 0.0
+
+        def _show_next_word(*_):
+            nonlocal order_idx
+            self.review_popup.title = "Review"
             if not review_pool:
                 self._review_current_word = None
                 word_btn.text = ""
                 return
-            w = random.choice(review_pool)
+            mode = self.review_order_mode
+            top = queue.peek() if (queue is not None and mode == "Due") else None
+            if mode in ("Newest", "Oldest") and ordered:
+                seq = ordered if mode == "Oldest" else ordered[::-1]
+                w = seq[order_idx % len(seq)]
+                order_idx += 1
+            elif top is None:
+                w = random.choice(review_pool)
+            else:
+                key, due = top
+                wait = due - time.time()
+                if wait > 0:
+                    # nichts fällig: keine Karte vorziehen, nur sagen, wann die nächste kommt
+                    self.review_popup.title = f"Review • nothing due, next in {_fmt_wait(wait)}"
+                    self._review_current_word = None
+                    word_btn.text = "Nothing due"
+                    self.widget_pool.release_children(grid)
+                    _enable_card(False)
+                    return
+                w = by_key[key]
             self._review_current_word = w
             word_btn.text = w
-            grid.clear_widgets()
+            self.widget_pool.release_children(grid)
+            _enable_card(True)
+
+        def _grade(name: str):
+            w = getattr(self, "_review_current_word", None)
+            if w:
+                key = w.lower()
+                self.review_schedule.grade(key, GRADES[name])
+                # gezählt wird die Bewertung, nicht das Anzeigen der Karte (Wert = SM-2-Qualität)
+                self._log_event("review", w, GRADES[name])
+                if queue is not None:
+                    queue.update(key)
+                try:
+                    self._store.save_async()
+                except Exception:
+                    pass
+            _show_next_word()
 
         def _compute_pool():
-            nonlocal review_pool
+            nonlocal review_pool, queue, by_key, ordered, order_idx
             f = _parse_date(date_from_inp.text)
             t = _parse_date(date_to_inp.text)
             words = list(self.learned_session) + list(self.expressions)
@@ -126,12 +208,17 @@ class ReviewScreen:
             if tt_filter_btn.state == 'down':
                 review_pool = [w for w in review_pool if (w or "").lower() in self.tongue_twisters]
 
-            next_btn.disabled = (len(review_pool) == 0)
+            by_key = {(w or "").lower(): w for w in review_pool}
+            queue = DueQueue(self.review_schedule, by_key, default_due=_learned_ts)
+            # ohne Datum (z. B. Ausdrücke) zählt als ältestes; sonst bleibt die Lernreihenfolge
+            ordered = sorted(review_pool, key=lambda w: (self.learned_log.get((w or "").lower(), "") or ""))
+            order_idx = 0
+
+            _enable_card(bool(review_pool))
             play_btn.disabled = (len(review_pool) == 0)
-            reveal_btn.disabled = (len(review_pool) == 0)
             stt_label.text = ""
-            grid.clear_widgets()
-            Clock.schedule_once(_show_random_word, 0)
+            self.widget_pool.release_children(grid)
+            Clock.schedule_once(_show_next_word, 0)
 
         def render_details(*_):
             w = getattr(self, "_review_current_word", None)
@@ -140,26 +227,42 @@ class ReviewScreen:
             self._show_word_details_in_grid(w, word_btn, grid)
             reveal_btn.disabled = True
 
-        next_btn.bind(on_release=_show_random_word)
+        for name, b in zip(GRADES, grade_btns):
+            b.bind(on_release=lambda *_, name=name: _grade(name))
         reveal_btn.bind(on_release=render_details)
         close_btn.bind(on_release=(lambda *_: self.review_popup.dismiss()))
+        self.review_popup.bind(on_dismiss=lambda *_: self.widget_pool.release_children(grid))
         tt_filter_btn.bind(state=lambda *_: _compute_pool())
+
+        def _on_order(inst, val):
+            nonlocal order_idx
+            try: prefs.put("review", order_mode=val)
+            except Exception: pass
+            self.review_order_mode = val
+            order_idx = 0
+            _show_next_word()
+        order_spin.bind(text=_on_order)
         date_from_inp.bind(text=lambda *_: _compute_pool())
         date_to_inp.bind(text=lambda *_: _compute_pool())
         self.review_popup.open()
         Clock.schedule_once(lambda dt: _compute_pool(), 0)
 
-        play_btn.bind(on_release=lambda *_: self._speak(getattr(self, "_review_current_word", "")))
+        play_btn.bind(on_release=lambda *_: self._speak(getattr(self, "_review_current_word", None) or ""))
 
         def _on_rec(*_):
             rec_btn.disabled = True
 
             def _start_recording():
                 stt_label.text = "Speak …"
-                self.stt.record_and_transcribe(3.0, lambda text, err: (
-                    setattr(stt_label, "text", err or (text or "")),
-                    setattr(rec_btn, "disabled", False)
-                ))
+                target = getattr(self, "_review_current_word", "") or ""
+
+                def _on_result(text, err):
+                    stt_label.text = err or (text or "")
+                    rec_btn.disabled = False
+                    if not err and target:
+                        self._log_event("stt", target, 1.0 if _spoken_match(target, text) else 0.0)
+
+                self.stt.record_and_transcribe(3.0, _on_result)
 
             if getattr(self, "stt", None):
                 _start_recording()
@@ -0,0 +1,185 @@
+import os
+import threading
+import time
+import wave
+from collections import deque
+from pathlib import Path
+import numpy as np
+
+def read_wav(path) -> tuple[np.ndarray, int]:
+    with wave.open(str(path), "rb") as f:
+        frames = f.readframes(f.getnframes())
+        channels = f.getnchannels()
+        sr = f.getframerate()
+    audio = np.frombuffer(frames, dtype=np.int16).astype(np.float32) / 32768.0
+    if channels > 1:
+        audio = audio.reshape(-1, channels).mean(axis=1)
+    return audio, sr
+
+def write_wav(path, audio: np.ndarray, sr: int):
+    pcm = (np.clip(audio, -1.0, 1.0) * 32767.0).astype(np.int16)
+    with wave.open(str(path), "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(sr)
+        f.writeframes(pcm.tobytes())
+
+def resample(audio: np.ndarray, src_sr: int, dst_sr: int) -> np.ndarray:
+    if src_sr == dst_sr or len(audio) == 0:
+        return audio
+    n = int(round(len(audio) * dst_sr / src_sr))
+    return np.interp(np.linspace(0, len(audio) - 1, n), np.arange(len(audio)), audio).astype(np.float32)
+
+def as_float32(wav) -> np.ndarray:
+    wav = np.asarray(wav)
+    if wav.dtype == np.int16:
+        return wav.astype(np.float32) / 32768.0
+    return np.array(wav, dtype=np.float32, copy=True)
+
+class AudioBackend:
+    def play(self, wav: np.ndarray, sr: int):
+        raise NotImplementedError
+
+    def wait(self):
+        raise NotImplementedError
+
+    def stop(self):
+        raise NotImplementedError
+
+    def record(self, seconds: float, sr: int) -> np.ndarray:
+        raise NotImplementedError
+
+    def open_stream(self, sr: int):
+        # liefert ein Objekt mit write(chunk), close() (ausspielen) und abort(); close/abort sind
+        # mehrfach aufrufbar, abort() darf aus einem anderen Thread ein laufendes write() abbrechen
+        raise NotImplementedError
+
+class _SoundDeviceStream:
+    def __init__(self, sd, sr):
+        self._stream = sd.OutputStream(samplerate=sr, channels=1, dtype="float32")
+        self._stream.start()
+        self._lock = threading.Lock()
+        self._done = False
+
+    def write(self, chunk):
+        self._stream.write(np.ascontiguousarray(as_float32(chunk)).reshape(-1, 1))
+
+    def _finish(self, abort: bool):
+        with self._lock:
+            if self._done:
+                return
+            self._done = True
+        if abort:
+            self._stream.abort()
+        else:
+            self._stream.stop()
+        self._stream.close()
+
+    def close(self):
+        self._finish(abort=False)
+
+    def abort(self):
+        self._finish(abort=True)
+
+class _CaptureStream:
+    def __init__(self, backend, sr):
+        self._backend = backend
+        self._sr = sr
+        self._chunks = []
+        self._done = False
+        self._aborted = threading.Event()
+
+    def write(self, chunk):
+        if self._done:
+            return
+        self._chunks.append(as_float32(chunk))
+        if self._backend.realtime:
+            # wie ein echtes Gerät: abort() beendet das "Abspielen" sofort
+            self._aborted.wait(len(chunk) / float(self._sr))
+
+    def close(self):
+        if self._done:
+            return
+        self._done = True
+        wav = np.concatenate(self._chunks) if self._chunks else np.zeros(0, dtype=np.float32)
+        with self._backend._lock:
+            self._backend.captured.append((wav, self._sr))
+
+    def abort(self):
+        self._aborted.set()
+        self.close()
+
+class SoundDeviceBackend(AudioBackend):
+    def __init__(self):
+        import sounddevice as sd
+        self._sd = sd
+
+    def play(self, wav, sr):
+        self._sd.play(wav, sr, blocking=False)
+
+    def wait(self):
+        self._sd.wait()
+
+    def stop(self):
+        self._sd.stop()
+
+    def record(self, seconds, sr):
+        audio = self._sd.rec(int(seconds * sr), samplerate=sr, channels=1)
+        self._sd.wait()
+        return audio.flatten().astype(np.float32)
+
+    def open_stream(self, sr):
+        return _SoundDeviceStream(self._sd, sr)
+
+class FileAudioBackend(AudioBackend):
+    # Ersatzgerät ohne Audio-Hardware: Aufnahmen kommen aus WAV-Dateien (sonst Stille),
+    # Wiedergaben landen in self.captured. realtime=False läuft so schnell wie möglich.
+    def __init__(self, input_files=(), realtime: bool = False):
+        self.realtime = realtime
+        self.captured: list[tuple[np.ndarray, int]] = []
+        self._inputs = deque(Path(p) for p in input_files)
+        self._lock = threading.Lock()
+        self._play_until = 0.0
+
+    def queue_input(self, path):
+        with self._lock:
+            self._inputs.append(Path(path))
+
+    def play(self, wav, sr):
+        wav = as_float32(wav)
+        with self._lock:
+            self.captured.append((wav, sr))
+            self._play_until = time.perf_counter() + len(wav) / float(sr)
+
+    def wait(self):
+        if self.realtime:
+            remaining = self._play_until - time.perf_counter()
+            if remaining > 0:
+                time.sleep(remaining)
+
+    def stop(self):
+        self._play_until = 0.0
+
+    def record(self, seconds, sr):
+        n = int(seconds * sr)
+        with self._lock:
+            path = self._inputs.popleft() if self._inputs else None
+        out = np.zeros(n, dtype=np.float32)
+        if path is not None:
+            audio, file_sr = read_wav(path)
+            audio = resample(audio, file_sr, sr)[:n]
+            out[: len(audio)] = audio
+        if self.realtime:
+            time.sleep(seconds)
+        return out
+
+    def open_stream(self, sr):
+        return _CaptureStream(self, sr)
+
+def create_backend() -> AudioBackend:
+    # VOCA_AUDIO_BACKEND=file (optional VOCA_AUDIO_INPUT=<wav-Verzeichnis>, VOCA_AUDIO_REALTIME=1)
+    if os.environ.get("VOCA_AUDIO_BACKEND", "").lower() in ("file", "null"):
+        src = os.environ.get("VOCA_AUDIO_INPUT")
+        files = sorted(Path(src).glob("*.wav")) if src else []
+        return FileAudioBackend(files, realtime=os.environ.get("VOCA_AUDIO_REALTIME") == "1")
+    return SoundDeviceBackend()
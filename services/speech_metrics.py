@@ -0,0 +1,82 @@
+import json
+import threading
+import time
+from collections import deque
+from pathlib import Path
+
+LENGTH_BUCKETS = ((4, "1-4"), (8, "5-8"), (12, "9-12"), (20, "13-20"))
+
+def length_bucket(chars: int) -> str:
+    for limit, name in LENGTH_BUCKETS:
+        if chars <= limit:
+            return name
+    return ">20"
+
+def _percentile(sorted_vals: list[float], q: float) -> float:
+    if not sorted_vals:
+        return 0.0
+    idx = min(len(sorted_vals) - 1, max(0, int(round(q * (len(sorted_vals) - 1)))))
+    return sorted_vals[idx]
+
+class SpanTimer:
+    def __init__(self, start: float | None = None):
+        self.spans: dict[str, float] = {}
+        self._last = time.perf_counter() if start is None else start
+
+    def mark(self, name: str):
+        now = time.perf_counter()
+        self.spans[name] = self.spans.get(name, 0.0) + (now - self._last)
+        self._last = now
+
+class SpeechMetrics:
+    # Ringpuffer der letzten Sprach-Requests (TTS/STT) mit Zeitabschnitten in Sekunden
+    def __init__(self, capacity: int = 500):
+        self._records = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+        self._exported_ts = 0.0
+
+    def record(self, kind: str, text: str, spans: dict[str, float], ok: bool = True):
+        text = text or ""
+        rec = {
+            "ts": time.time(),
+            "kind": kind,
+            "chars": len(text),
+            "words": len(text.split()),
+            "ok": bool(ok),
+            "spans": {k: round(v, 6) for k, v in spans.items()},
+            "total": round(sum(spans.values()), 6),
+        }
+        with self._lock:
+            self._records.append(rec)
+
+    def snapshot(self) -> list[dict]:
+        with self._lock:
+            return list(self._records)
+
+    def clear(self):
+        with self._lock:
+            self._records.clear()
+
+    def summary(self, kind: str) -> dict[str, dict]:
+        totals: dict[str, list[float]] = {}
+        for rec in self.snapshot():
+            if rec["kind"] == kind and rec["ok"]:
+                totals.setdefault(length_bucket(rec["chars"]), []).append(rec["total"])
+        out = {}
+        for bucket, vals in totals.items():
+            vals.sort()
+            out[bucket] = {"count": len(vals), "p50": _percentile(vals, 0.50), "p95": _percentile(vals, 0.95)}
+        return out
+
+    def export_jsonl(self, path) -> int:
+        # hängt nur neue Einträge an, damit die Datei über mehrere Exporte eine Zeitreihe bleibt
+        recs = [r for r in self.snapshot() if r["ts"] > self._exported_ts]
+        if not recs:
+            return 0
+        p = Path(path)
+        p.parent.mkdir(parents=True, exist_ok=True)
+        with open(p, "a", encoding="utf-8") as f:
+            for rec in recs:
+                f.write(json.dumps(rec, ensure_ascii=False, separators=(",", ":")) + "\n")
+        self._exported_ts = recs[-1]["ts"]
+        return len(recs)
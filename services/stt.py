@@ -1,16 +1,47 @@
 from kivy.clock import Clock
 import threading
+import time
 import numpy as np
-import sounddevice as sd
+import torch
 import whisper
+from services.audio import AudioBackend, create_backend
+from services.speech_metrics import SpeechMetrics, SpanTimer
+
+MODEL_SIZES = ("tiny", "base", "small", "medium")
+PRECISIONS = ("fp32", "int8")
 
 class STTService:
-    def __init__(self, model_size: str = "small", sr: int = 16000):
+    def __init__(self, model_size: str = "small", sr: int = 16000, precision: str = "fp32", num_threads: int | None = None,
+                 backend: AudioBackend | None = None, metrics: SpeechMetrics | None = None):
+        self._audio = backend or create_backend()
+        self.metrics = metrics or SpeechMetrics()
         self._ready = False
         self._loading = False
         self._model = None
         self._sr = sr
-        self._model_size = model_size
+        self._model_size = model_size if model_size in MODEL_SIZES else "small"
+        self._precision = precision if precision in PRECISIONS else "fp32"
+        self._num_threads = int(num_threads) if num_threads else None
+
+    def options(self) -> dict:
+        return {"model_size": self._model_size, "precision": self._precision, "num_threads": self._num_threads}
+
+    def _load_model(self):
+        if self._num_threads:
+            torch.set_num_threads(self._num_threads)
+        if self._precision == "int8":
+            # dynamische Quantisierung läuft nur auf der CPU
+            model = whisper.load_model(self._model_size, device="cpu")
+            for m in model.modules():
+                # Whispers eigene Linear-Unterklasse wird von quantize_dynamic sonst übersprungen
+                if isinstance(m, torch.nn.Linear):
+                    m.__class__ = torch.nn.Linear
+            return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        return whisper.load_model(self._model_size)
+
+    def load_sync(self):
+        self._model = self._load_model()
+        self._ready = True
 
     def init_async(self):
         if self._ready or self._loading:
@@ -18,7 +49,7 @@ class STTService:
         self._loading = True
         def worker():
             try:
-                self._model = whisper.load_model(self._model_size)
+                self._model = self._load_model()
                 self._ready = True
             except Exception:
                 self._ready = False
@@ -26,27 +57,43 @@ class STTService:
                 self._loading = False
         threading.Thread(target=worker, daemon=True).start()
 
+    def transcribe(self, audio: np.ndarray, timer: SpanTimer | None = None) -> str:
+        audio = np.asarray(audio, dtype=np.float32).flatten()
+        m = float(np.max(np.abs(audio)) + 1e-9)
+        audio = audio / m
+        if timer:
+            timer.mark("postprocess")
+        kw = {"fp16": False} if self._precision == "int8" else {}
+        res = self._model.transcribe(audio, language="en", **kw)
+        if timer:
+            timer.mark("inference")
+        return (res.get("text") or "").strip()
+
     def record_and_transcribe(self, seconds: float, on_result):
+        requested = time.perf_counter()
         def worker():
             text, err = "", None
+            timer = SpanTimer(requested)
+            timer.mark("queue")
             try:
                 if not self._ready:
                     self.init_async()
                     err = "Model is loading. Please tap ‘Speak’ again."
+                    timer.mark("model_wait")
+                    self.metrics.record("stt", text, timer.spans, ok=False)
                     Clock.schedule_once(lambda dt: on_result(text, err), 0)
                     return
+                timer.mark("model_wait")
                 try:
-                    sd.stop()
+                    self._audio.stop()
                 except Exception:
                     pass
-                audio = sd.rec(int(seconds * self._sr), samplerate=self._sr, channels=1)
-                sd.wait()
-                audio = audio.flatten().astype(np.float32)
-                m = float(np.max(np.abs(audio)) + 1e-9)
-                audio = audio / m
-                res = self._model.transcribe(audio, language="en")
-                text = (res.get("text") or "").strip()
+                audio = self._audio.record(seconds, self._sr)
+                # beinhaltet Gerätestart und Aufnahmedauer
+                timer.mark("recording")
+                text = self.transcribe(audio, timer)
             except Exception as e:
                 err = f"STT loading failed: {e}"
+            self.metrics.record("stt", text, timer.spans, ok=err is None)
             Clock.schedule_once(lambda dt: on_result(text, err), 0)
-        threading.Thread(target=worker, daemon=True).start()
\ No newline at end of file
+        threading.Thread(target=worker, daemon=True).start()
@@ -0,0 +1,116 @@
+import argparse
+import json
+import os
+import re
+import time
+from pathlib import Path
+import numpy as np
+from services.audio import FileAudioBackend, read_wav, resample, write_wav
+from services.stt import STTService, MODEL_SIZES, PRECISIONS
+
+CLIP_DIR = Path(__file__).resolve().parent.parent / "res" / "stt_calibration"
+
+def _normalize(text: str) -> list[str]:
+    return re.findall(r"[a-z]+(?:'[a-z]+)?", (text or "").lower())
+
+def word_error_rate(reference: str, hypothesis: str) -> float:
+    ref, hyp = _normalize(reference), _normalize(hypothesis)
+    if not ref:
+        return 0.0 if not hyp else 1.0
+    prev = list(range(len(hyp) + 1))
+    for i, r in enumerate(ref, start=1):
+        cur = [i] + [0] * len(hyp)
+        for j, h in enumerate(hyp, start=1):
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (r != h))
+        prev = cur
+    return prev[-1] / len(ref)
+
+def render_missing_clips(clip_dir: Path = CLIP_DIR) -> int:
+    # fehlende Clips einmalig mit der TTS-Stimme der App erzeugen
+    manifest = json.loads((clip_dir / "clips.json").read_text(encoding="utf-8"))
+    sr = int(manifest.get("sample_rate", 16000))
+    missing = [c for c in manifest.get("clips", []) if not (clip_dir / c["file"]).exists()]
+    if not missing:
+        return 0
+    from services.tts import TTSService
+    tts = TTSService(backend=FileAudioBackend())
+    tts.load_sync()
+    for c in missing:
+        audio = resample(tts.synthesize(c["text"]), tts.sample_rate, sr)
+        write_wav(clip_dir / c["file"], audio, sr)
+    return len(missing)
+
+def load_clips(clip_dir: Path = CLIP_DIR) -> list[tuple[np.ndarray, str]]:
+    manifest = json.loads((clip_dir / "clips.json").read_text(encoding="utf-8"))
+    sr = int(manifest.get("sample_rate", 16000))
+    out = []
+    for c in manifest.get("clips", []):
+        p = clip_dir / c["file"]
+        if p.exists():
+            audio, file_sr = read_wav(p)
+            out.append((resample(audio, file_sr, sr), c["text"]))
+    return out
+
+def calibrate(clips, model_sizes=MODEL_SIZES, precisions=PRECISIONS, thread_counts=None, max_wer: float = 0.15, log=print):
+    if thread_counts is None:
+        cpus = os.cpu_count() or 1
+        thread_counts = sorted({1, max(1, cpus // 2), cpus})
+    results = []
+    for size in model_sizes:
+        for precision in precisions:
+            for threads in thread_counts:
+                stt = STTService(model_size=size, precision=precision, num_threads=threads, backend=FileAudioBackend())
+                try:
+                    stt.load_sync()
+                    stt.transcribe(clips[0][0])  # Warm-up
+                    errors, t0 = [], time.perf_counter()
+                    for audio, text in clips:
+                        errors.append(word_error_rate(text, stt.transcribe(audio)))
+                    elapsed = (time.perf_counter() - t0) / len(clips)
+                except Exception as e:
+                    log(f"{size}/{precision}/{threads}: failed ({e})")
+                    continue
+                wer = sum(errors) / len(errors)
+                results.append({"model_size": size, "precision": precision, "num_threads": threads, "seconds_per_clip": elapsed, "wer": wer})
+                log(f"{size}/{precision}/{threads}: {elapsed:.2f}s per clip, WER {wer:.2f}")
+    ok = [r for r in results if r["wer"] <= max_wer]
+    best = min(ok, key=lambda r: r["seconds_per_clip"]) if ok else None
+    return best, results
+
+def _default_prefs_path() -> Path:
+    # gleiche Datei wie VocabularyApp._get_prefs() (user_data_dir von VocaMainApp)
+    from kivy.app import App
+    class VocaMainApp(App):
+        pass
+    return Path(VocaMainApp().user_data_dir) / "prefs.json"
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Time Whisper configurations and store the fastest accurate one in the app prefs.")
+    ap.add_argument("--sizes", nargs="+", default=list(MODEL_SIZES), choices=MODEL_SIZES)
+    ap.add_argument("--precisions", nargs="+", default=list(PRECISIONS), choices=PRECISIONS)
+    ap.add_argument("--threads", nargs="+", type=int, default=None)
+    ap.add_argument("--max-wer", type=float, default=0.15)
+    ap.add_argument("--prefs", type=Path, default=None)
+    args = ap.parse_args(argv)
+
+    rendered = render_missing_clips()
+    if rendered:
+        print(f"Rendered {rendered} calibration clips.")
+    clips = load_clips()
+    if not clips:
+        print("No calibration clips found.")
+        return 1
+    best, _ = calibrate(clips, args.sizes, args.precisions, args.threads, args.max_wer)
+    if not best:
+        print(f"No configuration reached WER <= {args.max_wer}. Prefs unchanged.")
+        return 1
+    from kivy.storage.jsonstore import JsonStore
+    prefs_path = args.prefs or _default_prefs_path()
+    JsonStore(str(prefs_path)).put(
+        "stt", model_size=best["model_size"], precision=best["precision"], num_threads=best["num_threads"]
+    )
+    print(f"Selected {best['model_size']}/{best['precision']}/{best['num_threads']} threads -> {prefs_path}")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
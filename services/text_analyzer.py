@@ -0,0 +1,154 @@
+from kivy.clock import Clock
+import codecs
+import os
+import re
+import threading
+from collections import Counter
+from models.lemmatizer import candidates
+
+# erlaubt z. B. far-out, it's, mother-in-law
+WORD_RE = re.compile(r"[A-Za-z]+(?:[-'][A-Za-z]+)*")
+_BREAK_RE = re.compile(r"[^A-Za-z'\-]")
+CHUNK_SIZE = 1 << 16
+
+def iter_text_chunks(text: str, size: int = CHUNK_SIZE):
+    # (chunk, verarbeitete Zeichen, Gesamtlänge)
+    total = len(text or "")
+    for i in range(0, total, size):
+        yield text[i:i + size], min(i + size, total), total
+
+def iter_file_chunks(path, size: int = CHUNK_SIZE):
+    # (chunk, gelesene Bytes, Dateigröße); UTF-8 inkrementell, kaputte Bytes werden ersetzt
+    total = os.path.getsize(path)
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    done = 0
+    with open(path, "rb") as f:
+        while True:
+            raw = f.read(size)
+            done += len(raw)
+            text = decoder.decode(raw, final=not raw)
+            if text:
+                yield text, done, total
+            if not raw:
+                break
+
+def iter_words(chunks, min_len: int = 3):
+    # Wörter (klein geschrieben) aus Chunks; ein am Chunk-Ende abgeschnittenes Wort wird übertragen
+    carry = ""
+    for chunk in chunks:
+        buf = carry + chunk
+        cut = len(buf)
+        while cut > 0 and not _BREAK_RE.match(buf, cut - 1):
+            cut -= 1
+        if cut == 0 and len(buf) < 4 * CHUNK_SIZE:
+            carry = buf
+            continue
+        head, carry = (buf[:cut], buf[cut:]) if cut else (buf, "")
+        for m in WORD_RE.finditer(head):
+            if m.end() - m.start() >= min_len:
+                yield m.group().lower()
+    for m in WORD_RE.finditer(carry):
+        if m.end() - m.start() >= min_len:
+            yield m.group().lower()
+
+class TextAnalysis:
+    __slots__ = ("unique", "unknown", "known", "phrases", "cancelled", "error")
+
+    def __init__(self):
+        self.unique = 0
+        self.unknown: list[str] = []
+        self.phrases: list[tuple[str, int]] = []   # (gespeicherter Ausdruck, Anzahl im Text)
+        self.known = 0
+        self.cancelled = False
+        self.error: str | None = None
+
+class TextAnalyzer:
+    # Tokenisiert Text/Dateien in einem Hintergrund-Thread und prüft gegen das Vokabular.
+    # is_known/is_removed werden im Thread aufgerufen (nur lesend); Callbacks laufen über die Clock.
+    # Mit lemmatize zählen Flexionsformen bekannter Wörter als bekannt; steht die Grundform selbst
+    # im Text, wird nur sie vorgeschlagen. matcher (PhraseMatcher) findet gespeicherte Ausdrücke
+    # im selben Durchlauf über die Token. rank(wort, anzahl_im_text) sortiert die neuen Wörter
+    # absteigend (sonst alphabetisch).
+    def __init__(self, is_known, is_removed=None, lemmatize=None, matcher=None, rank=None,
+                 progress_interval: float = 0.1):
+        self._is_known = is_known
+        self._is_removed = is_removed or (lambda w: False)
+        self._lemmatize = lemmatize
+        self._matcher = matcher
+        self._rank = rank
+        self._interval = progress_interval
+        self._cancel = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def cancel(self):
+        self._cancel.set()
+
+    def analyze_text(self, text: str, on_progress, on_done):
+        self._start(lambda: iter_text_chunks(text or ""), on_progress, on_done)
+
+    def analyze_file(self, path, on_progress, on_done):
+        self._start(lambda: iter_file_chunks(path), on_progress, on_done)
+
+    def _start(self, make_chunks, on_progress, on_done):
+        self.cancel()
+        cancel = self._cancel = threading.Event()
+        def worker():
+            result = TextAnalysis()
+            seen = Counter()
+            state = {"done": 0, "total": 0}
+            pending = {"ev": None}
+            def chunks():
+                for chunk, done, total in make_chunks():
+                    if cancel.is_set():
+                        return
+                    state["done"], state["total"] = done, total
+                    if pending["ev"] is None:
+                        # höchstens eine Fortschrittsmeldung pro Intervall
+                        pending["ev"] = Clock.schedule_once(_report, self._interval)
+                    yield chunk
+            def _report(dt):
+                pending["ev"] = None
+                if not cancel.is_set():
+                    on_progress(state["done"], state["total"], len(seen))
+            def words():
+                # alle Token für die Ausdrücke, einzelne Wörter erst ab drei Buchstaben
+                for w in iter_words(chunks(), min_len=1):
+                    if len(w) >= 3:
+                        seen[w] += 1
+                    yield w
+            try:
+                matcher = self._matcher
+                if matcher is not None and len(matcher):
+                    found = Counter(matcher.find_all(words()))
+                    result.phrases = found.most_common()
+                else:
+                    for _w in words():
+                        pass
+                if not cancel.is_set():
+                    lemmatize = self._lemmatize
+                    for w in sorted(seen):
+                        if self._is_known(w) or (lemmatize is not None and lemmatize(w) != w):
+                            result.known += 1
+                        elif self._is_removed(w):
+                            continue
+                        elif lemmatize is not None and any(c in seen for c in candidates(w)):
+                            continue
+                        else:
+                            result.unknown.append(w)
+                    if self._rank is not None:
+                        rank = self._rank
+                        result.unknown.sort(key=lambda w: -rank(w, seen[w]))
+            except Exception as e:
+                result.error = str(e)
+            result.unique = len(seen)
+            result.cancelled = cancel.is_set()
+            ev = pending["ev"]
+            if ev is not None:
+                ev.cancel()
+            Clock.schedule_once(lambda dt: on_done(result), 0)
+        self._thread = threading.Thread(target=worker, daemon=True)
+        self._thread.start()
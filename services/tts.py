@@ -1,59 +1,225 @@
+import queue
+import re
 import threading
+import time
 import numpy as np
-import sounddevice as sd
 from TTS.api import TTS
+from services.audio import AudioBackend, create_backend
+from services.speech_metrics import SpeechMetrics, SpanTimer
+from persistence.audio_cache import AudioCache
+
+def split_chunks(text: str, max_chars: int = 80, min_chars: int = 12) -> list[str]:
+    # an Satz-/Teilsatzgrenzen trennen, zu lange Teile an Wortgrenzen kürzen
+    chunks = []
+    for part in re.split(r"(?<=[.!?;:,])\s+", (text or "").strip()):
+        while len(part) > max_chars:
+            cut = part.rfind(" ", 0, max_chars)
+            if cut <= 0:
+                cut = max_chars
+            chunks.append(part[:cut].strip())
+            part = part[cut:].strip()
+        if part:
+            chunks.append(part)
+    # sehr kurze Stücke an den Vorgänger hängen (klingen einzeln abgehackt)
+    merged = []
+    for c in chunks:
+        if merged and len(c) < min_chars and len(merged[-1]) + len(c) < max_chars:
+            merged[-1] = f"{merged[-1]} {c}"
+        else:
+            merged.append(c)
+    return merged
 
 class TTSService:
-    def __init__(self):
+    def __init__(self, backend: AudioBackend | None = None, metrics: SpeechMetrics | None = None, load_timeout: float = 30.0,
+                 stream_min_chars: int = 40, cache: AudioCache | None = None):
+        self._audio = backend or create_backend()
+        self._cache = cache
+        self.metrics = metrics or SpeechMetrics()
+        self._load_timeout = load_timeout
+        self._stream_min_chars = stream_min_chars
+        self._ready_event = threading.Event()
+        self._generation = 0
+        # laufender Ausgabe-Stream (gestreamte Wiedergabe); stop()/speak() brechen ihn sofort ab
+        self._stream = None
+        self._stream_lock = threading.Lock()
         self._ready = False
         self._loading = False
         self._engine = None
         self._speaker = None
         self._sr = 22050
 
+    @property
+    def sample_rate(self) -> int:
+        return self._sr
+
+    def _load_engine(self):
+        eng = TTS(model_name="tts_models/en/vctk/vits", gpu=False)
+        speakers = getattr(eng, "speakers", []) or []
+        self._engine = eng
+        self._speaker = speakers[5] if len(speakers) > 5 else (speakers[0] if speakers else None)
+        synth = getattr(eng, "synthesizer", None)
+        self._sr = getattr(synth, "output_sample_rate", 22050)
+        self._ready = True
+        self._ready_event.set()
+
+    def load_sync(self):
+        self._load_engine()
+
     def init_async(self):
         if self._ready or self._loading:
             return
         self._loading = True
         def worker():
             try:
-                eng = TTS(model_name="tts_models/en/vctk/vits", gpu=False)
-                speakers = getattr(eng, "speakers", []) or []
-                self._engine = eng
-                self._speaker = speakers[5] if len(speakers) > 5 else (speakers[0] if speakers else None)
-                synth = getattr(eng, "synthesizer", None)
-                self._sr = getattr(synth, "output_sample_rate", 22050)
-                self._ready = True
+                self._load_engine()
             except Exception:
                 self._ready = False
             finally:
                 self._loading = False
         threading.Thread(target=worker, daemon=True).start()
 
+    def synthesize(self, text: str) -> np.ndarray:
+        return np.asarray(self._engine.tts(text, speaker=self._speaker), dtype=np.float32)
+
+    def _postprocess(self, wav: np.ndarray, trim: bool = True) -> np.ndarray:
+        wav *= 2.0
+        wav = np.clip(wav, -1.0, 1.0)
+        if trim:
+            wav = wav[: int(len(wav) * 0.95)]
+        return wav
+
+    def _render(self, text: str, trim: bool = True, timer: SpanTimer | None = None) -> np.ndarray:
+        # fertig nachbearbeitetes Audio (int16-View aus dem Cache oder frisch synthetisiert)
+        key = f"{self._speaker}|{int(trim)}|{text}"
+        if self._cache is not None:
+            hit = self._cache.get(key)
+            if hit is not None and hit[1] == self._sr:
+                if timer:
+                    timer.mark("cache")
+                return hit[0]
+        wav = self.synthesize(text)
+        if timer:
+            timer.mark("synthesis")
+        wav = self._postprocess(wav, trim=trim)
+        if self._cache is not None:
+            try:
+                wav = self._cache.put(key, wav, self._sr)
+            except Exception:
+                pass
+        if timer:
+            timer.mark("postprocess")
+        return wav
+
+    def flush_cache(self):
+        if self._cache is not None:
+            self._cache.flush()
+
     def speak(self, text: str | None):
         if not text:
             return
+        requested = time.perf_counter()
         if not self._ready:
             self.init_async()
-            return
+        # neue Ausgabe bricht eine noch laufende (gestreamte) ab
+        self._generation += 1
+        gen = self._generation
+        self._abort_stream()
+        chunks = split_chunks(text) if len(text) >= self._stream_min_chars else [text]
         def worker():
+            timer = SpanTimer(requested)
+            timer.mark("queue")
             try:
-                wav = self._engine.tts(text, speaker=self._speaker)
-                wav = np.asarray(wav, dtype=np.float32)
-                wav *= 2.0
-                wav = np.clip(wav, -1.0, 1.0)
-                wav = wav[: int(len(wav) * 0.95)]
+                # Anfragen während des Ladens warten auf das Modell statt verworfen zu werden
+                if not self._ready_event.wait(self._load_timeout):
+                    timer.mark("model_wait")
+                    self.metrics.record("tts", text, timer.spans, ok=False)
+                    return
+                timer.mark("model_wait")
+                if len(chunks) > 1:
+                    self._speak_streamed(text, chunks, timer, gen)
+                    return
+                wav = self._render(text, timer=timer)
+                if gen != self._generation:
+                    return
                 try:
-                    sd.stop()
+                    self._audio.stop()
                 except Exception:
                     pass
-                sd.play(wav, self._sr, blocking=False)
+                self._audio.play(wav, self._sr)
+                timer.mark("device_start")
+                self.metrics.record("tts", text, timer.spans)
             except Exception:
-                pass
+                self.metrics.record("tts", text, timer.spans, ok=False)
         threading.Thread(target=worker, daemon=True).start()
 
+    def _speak_streamed(self, text: str, chunks: list[str], timer: SpanTimer, gen: int):
+        # erster Teil spielt schon, während die restlichen noch synthetisiert werden;
+        # die Spans messen bis zum Start des ersten Teils (time-to-first-audio)
+        pending = queue.Queue()
+        def player(stream):
+            try:
+                while True:
+                    wav = pending.get()
+                    if wav is None or gen != self._generation:
+                        break
+                    try:
+                        stream.write(wav)
+                    except Exception:
+                        break   # von _abort_stream() abgebrochen
+            finally:
+                with self._stream_lock:
+                    if self._stream is stream:
+                        self._stream = None
+                if gen != self._generation:
+                    stream.abort()
+                else:
+                    stream.close()
+
+        started = False
+        try:
+            for i, chunk in enumerate(chunks):
+                if gen != self._generation:
+                    break
+                wav = self._render(chunk, trim=(i == len(chunks) - 1), timer=None if started else timer)
+                if not started:
+                    try:
+                        self._audio.stop()
+                    except Exception:
+                        pass
+                    stream = self._audio.open_stream(self._sr)
+                    with self._stream_lock:
+                        self._stream = stream
+                    if gen != self._generation:
+                        # stop()/speak() kam zwischen Prüfung und Öffnen
+                        self._abort_stream()
+                        break
+                    threading.Thread(target=player, args=(stream,), daemon=True).start()
+                pending.put(wav)
+                if not started:
+                    timer.mark("device_start")
+                    self.metrics.record("tts", text, timer.spans)
+                    started = True
+        except Exception:
+            # Fehler nach dem Start: bereits gespielte Teile laufen aus
+            if not started:
+                raise
+        finally:
+            pending.put(None)
+
+    def _abort_stream(self):
+        # blockiert der Player gerade in stream.write(), kehrt es dadurch sofort zurück
+        with self._stream_lock:
+            stream, self._stream = self._stream, None
+        if stream is not None:
+            try:
+                stream.abort()
+            except Exception:
+                pass
+
     def stop(self):
+        self._generation += 1
+        self._abort_stream()
         try:
-            sd.stop()
+            self._audio.stop()
         except Exception:
-            pass
\ No newline at end of file
+            pass
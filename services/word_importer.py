@@ -0,0 +1,163 @@
+from kivy.clock import Clock
+import csv
+import heapq
+import io
+import os
+import re
+import threading
+
+# Spaltennamen (Kopfzeile, case-insensitiv); ohne Kopfzeile gilt diese Reihenfolge
+COLUMNS = ("word", "meaning", "examples", "pos", "ipa")
+_HEADER_NAMES = {
+    "word": "word", "words": "word", "term": "word", "headword": "word", "expression": "word", "english": "word",
+    "meaning": "meaning", "meanings": "meaning", "definition": "meaning", "translation": "meaning",
+    "example": "examples", "examples": "examples", "sentence": "examples",
+    "pos": "pos", "part of speech": "pos", "type": "pos",
+    "ipa": "ipa", "pronunciation": "ipa",
+}
+_POS_ALIASES = {
+    "noun": "n", "verb": "v", "adjective": "adj", "adverb": "adv", "preposition": "prep", "conjunction": "conj",
+}
+
+def clean_entry(raw: str) -> str:
+    # eine Zeile/Zelle zu einem Vokabel-Eintrag normalisieren ("" = ungültig)
+    s = (raw or "").strip()
+    s = re.sub(r'^[\-\*•]+\s*', '', s)
+    s = s.replace("’", "'").replace("‘", "'")
+    s = re.sub(r"[^A-Za-z'\-\s]", "", s)
+    s = re.sub(r"\s*-\s*", "-", s)
+    s = re.sub(r"-{2,}", "-", s)
+    s = re.sub(r"^-+|-+$", "", s)
+    s = re.sub(r"\s+", " ", s).strip()
+    return s.lower() if len(s) >= 2 else ""
+
+def merge_sorted(words, new_words) -> list[str]:
+    # beide Listen nach lower() sortiert -> zusammengeführt in O(n + k) statt neu sortieren
+    return list(heapq.merge(words, new_words, key=str.lower))
+
+def _split_list(cell: str, seps: str) -> list[str]:
+    return [p.strip() for p in re.split(f"[{re.escape(seps)}]", cell or "") if p.strip()]
+
+def _pos_tags(cell: str, allowed) -> list[str]:
+    out = []
+    for p in _split_list(cell, ",/;"):
+        tag = _POS_ALIASES.get(p.lower().rstrip("."), p.lower().rstrip("."))
+        if tag in allowed and tag not in out:
+            out.append(tag)
+    return out
+
+def _open_rows(path):
+    # (Zeilen-Iterator, Datei für Fortschritt); .txt = eine Zeile pro Eintrag, Tabs trennen Spalten
+    raw = open(path, "rb")
+    text = io.TextIOWrapper(raw, encoding="utf-8-sig", errors="replace", newline="")
+    ext = os.path.splitext(str(path))[1].lower()
+    if ext == ".csv":
+        head = text.read(4096)
+        text.seek(0)
+        try:
+            dialect = csv.Sniffer().sniff(head, delimiters=",;\t")
+        except csv.Error:
+            dialect = csv.excel
+        rows = csv.reader(text, dialect)
+    elif ext == ".tsv":
+        rows = csv.reader(text, delimiter="\t")
+    else:
+        rows = (line.rstrip("\r\n").split("\t") for line in text)
+    return rows, raw
+
+class ImportResult:
+    __slots__ = ("words", "details", "ipa", "rows", "duplicates", "invalid", "cancelled", "error")
+
+    def __init__(self):
+        self.words: list[str] = []              # neue Wörter, nach lower() sortiert
+        self.details: dict[str, list[dict]] = {} # key -> neue word_details-Einträge
+        self.ipa: dict[str, str] = {}
+        self.rows = 0
+        self.duplicates = 0
+        self.invalid = 0
+        self.cancelled = False
+        self.error: str | None = None
+
+class WordImporter:
+    # Liest CSV/TSV/Text-Listen zeilenweise in einem Hintergrund-Thread, prüft gegen den
+    # case-gefalteten Index (is_known) und sammelt Details/IPA. Übernommen wird erst in on_done
+    # im Hauptthread – ein Abbruch lässt das Vokabular unverändert.
+    def __init__(self, is_known, is_removed=None, pos_tags=("n", "v", "adj", "adv", "prep", "conj"),
+                 progress_interval: float = 0.1):
+        self._is_known = is_known
+        self._is_removed = is_removed or (lambda w: False)
+        self._pos_tags = tuple(pos_tags)
+        self._interval = progress_interval
+        self._cancel = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def cancel(self):
+        self._cancel.set()
+
+    def start(self, path, on_progress, on_done):
+        self.cancel()
+        cancel = self._cancel = threading.Event()
+        def worker():
+            result = ImportResult()
+            state = {"done": 0, "total": 1}
+            pending = {"ev": None}
+            def _report(dt):
+                pending["ev"] = None
+                if not cancel.is_set():
+                    on_progress(state["done"], state["total"], result.rows)
+            try:
+                state["total"] = max(1, os.path.getsize(path))
+                rows, raw = _open_rows(path)
+                with raw:
+                    self._read(rows, raw, result, state, cancel, pending, _report)
+            except Exception as e:
+                result.error = str(e)
+            result.cancelled = cancel.is_set()
+            ev = pending["ev"]
+            if ev is not None:
+                ev.cancel()
+            Clock.schedule_once(lambda dt: on_done(result), 0)
+        self._thread = threading.Thread(target=worker, daemon=True)
+        self._thread.start()
+
+    def _read(self, rows, raw, result, state, cancel, pending, report):
+        cols = COLUMNS
+        new_keys = set()
+        for i, row in enumerate(rows):
+            if cancel.is_set():
+                return
+            if i % 256 == 0:
+                state["done"] = raw.tell()
+                if pending["ev"] is None:
+                    pending["ev"] = Clock.schedule_once(report, self._interval)
+            if not row or not any(c.strip() for c in row):
+                continue
+            if i == 0:
+                names = [_HEADER_NAMES.get(c.strip().lower()) for c in row]
+                if "word" in names:
+                    cols = tuple(n or "" for n in names)
+                    continue
+            result.rows += 1
+            cells = dict(zip(cols, row))
+            key = clean_entry(cells.get("word", ""))
+            if not key or self._is_removed(key):
+                result.invalid += 1
+                continue
+            if key in new_keys or self._is_known(key):
+                result.duplicates += 1
+            else:
+                new_keys.add(key)
+            meaning = (cells.get("meaning") or "").strip()
+            examples = _split_list(cells.get("examples"), "|")
+            pos = _pos_tags(cells.get("pos"), self._pos_tags)
+            if meaning or examples:
+                result.details.setdefault(key, []).append({"meaning": meaning, "examples": examples, "pos": pos})
+            ipa = (cells.get("ipa") or "").strip().strip("/[]")
+            if ipa and key not in result.ipa:
+                result.ipa[key] = ipa
+        state["done"] = state["total"]
+        result.words = sorted(new_keys, key=str.lower)
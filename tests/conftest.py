@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Tests laufen ohne Installation direkt aus dem Repo (models/, persistence/ importierbar)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,51 @@
+import datetime as _dt
+from models.activity import DayCounts, LearnedLog
+
+D1, D2 = _dt.date(2024, 1, 1), _dt.date(2024, 1, 5)
+
+def test_day_counts_range_sum_and_growth():
+    dc = DayCounts()
+    dc.add(D2)
+    dc.add(D1, 2)
+    dc.add(_dt.date(2026, 3, 1))
+    assert dc.count(D1) == 2
+    assert dc.range_sum(D1, D2) == 3
+    assert dc.total() == 4
+    assert dc.first_day() == D1
+    assert list(dc.counts_between(D1, D1 + _dt.timedelta(days=4))) == [2, 0, 0, 0, 1]
+    assert dc.range_sum(D2, D1) == 0
+
+def test_day_counts_from_days():
+    dc = DayCounts.from_days({D1.toordinal(): 3, D2.toordinal(): 1})
+    assert dc.total() == 4 and dc.count(D2) == 1
+
+def test_learned_log_counts_follow_mutations():
+    log = LearnedLog({"a": "2024-01-01", "b": "2024-01-01", "c": "bad"})
+    assert log.day_counts.count(D1) == 2
+    log["a"] = "2024-01-05"
+    del log["b"]
+    log.pop("missing", None)
+    log.setdefault("d", "2024-01-05")
+    log.update(e="2024-01-01")
+    assert log.day_counts.count(D1) == 1
+    assert log.day_counts.count(D2) == 2
+
+def test_learned_log_ior_updates_counts_and_listeners():
+    log = LearnedLog()
+    seen = []
+    log.listeners.append(lambda d, n: seen.append((d, n)))
+    log |= {"a": "2024-01-05"}
+    assert isinstance(log, LearnedLog)
+    assert log.day_counts.count(D2) == 1
+    assert seen == [(D2.toordinal(), 1)]
+
+def test_listeners_survive_clear_and_replacement():
+    old = LearnedLog({"a": "2024-01-01"})
+    seen = []
+    old.listeners.append(lambda d, n: seen.append((d, n)))
+    old.clear()
+    assert old.day_counts.total() == 0
+    new = LearnedLog({"b": "2024-01-05"})
+    new.adopt_listeners(old)
+    new["c"] = "2024-01-05"
+    assert seen == [(None, None), (None, None), (D2.toordinal(), 2)]
@@ -0,0 +1,55 @@
+import json
+import numpy as np
+from persistence.audio_cache import AudioCache
+
+def _wav(n: int, v: float = 0.5) -> np.ndarray:
+    return np.full(n, v, dtype=np.float32)
+
+def test_put_get_round_trip_and_reopen(tmp_path):
+    path = tmp_path / "tts.bin"
+    c = AudioCache(path, flush_every=1)
+    pcm = c.put("hello", np.array([0.0, 0.5, -1.0, 2.0], dtype=np.float32), 22050)
+    assert list(pcm) == [0, 16383, -32767, 32767]
+    got, sr = c.get("hello")
+    assert sr == 22050 and list(got) == list(pcm)
+    assert c.get("missing") is None
+    c2 = AudioCache(path)
+    assert "hello" in c2 and list(c2.get("hello")[0]) == list(pcm)
+
+def test_compressed_entries(tmp_path):
+    c = AudioCache(tmp_path / "tts.bin", compress=True)
+    c.put("a", _wav(1000), 16000)
+    got, _sr = c.get("a")
+    assert len(got) == 1000 and got[0] == 16383
+
+def test_index_entries_beyond_file_are_dropped(tmp_path):
+    path = tmp_path / "tts.bin"
+    c = AudioCache(path, flush_every=1)
+    c.put("a", _wav(10), 16000)
+    idx = json.loads(c.index_path.read_text())
+    idx["ghost"] = [10_000, 20, 10, 16000, "pcm16"]
+    c.index_path.write_text(json.dumps(idx))
+    c2 = AudioCache(path)
+    assert "a" in c2 and "ghost" not in c2
+
+def test_budget_evicts_least_recently_used(tmp_path):
+    path = tmp_path / "tts.bin"
+    c = AudioCache(path, max_bytes=4000)       # je Eintrag 1000 Byte
+    for k in "abc":
+        c.put(k, _wav(500), 16000)
+    c.get("a")                                 # a zuletzt benutzt -> b ist am ältesten
+    c.put("d", _wav(500), 16000)
+    c.put("e", _wav(500), 16000)
+    assert path.stat().st_size <= 4000
+    assert "b" not in c and "a" in c and "e" in c
+    assert list(c.get("a")[0][:2]) == [16383, 16383]
+    assert set(json.loads(c.index_path.read_text())) == set(c._index)
+
+def test_rewrites_are_compacted(tmp_path):
+    path = tmp_path / "tts.bin"
+    c = AudioCache(path, max_bytes=64 << 20)
+    for _ in range(40):
+        c.put("same", _wav(300_000), 16000)    # 600 KB pro Eintrag
+    assert len(c) == 1
+    assert path.stat().st_size < 9 << 20
+    assert len(c.get("same")[0]) == 300_000
@@ -0,0 +1,54 @@
+import json
+from models.decks import DeckRegistry, TrackedSet, USER_DECK
+
+def _registry(tmp_path):
+    (tmp_path / "b1_word_from_cambridge.json").write_text(json.dumps({"words": ["apple", "Book", "cat"]}))
+    decks = tmp_path / "decks"
+    decks.mkdir()
+    (decks / "travel.json").write_text(json.dumps(["airport", "apple"]))
+    (decks / "a2.json").write_text(json.dumps(["dog"]))
+    return DeckRegistry(tmp_path)
+
+def test_tracked_set_reports_real_changes_only():
+    log = []
+    s = TrackedSet({"a"}, lambda x: log.append(("+", x)), lambda x: log.append(("-", x)))
+    s.add("a"); s.add("b"); s.discard("z")
+    s |= {"c"}
+    s -= {"a"}
+    s &= {"b", "x"}
+    assert s == {"b"}
+    assert log == [("+", "b"), ("+", "c"), ("-", "a"), ("-", "c")]
+
+def test_deck_listing_and_lazy_load(tmp_path):
+    reg = _registry(tmp_path)
+    assert [d.id for d in reg.decks()] == ["a2", "b1", "travel", USER_DECK]
+    assert not reg.is_loaded("travel")
+    assert reg.load("b1") == ["apple", "book", "cat"]
+    assert reg.is_loaded("b1") and reg.size("b1") == 3
+
+def test_remaining_counts_follow_status_changes(tmp_path):
+    reg = _registry(tmp_path)
+    reg.reset(["apple", "book", "airport"], [set(), {"book"}])
+    reg.load("b1")
+    reg.load("travel")
+    assert reg.remaining() == 2
+    assert reg.remaining("b1") == 1 and reg.remaining("travel") == 2
+    reg.mark("apple", 1)
+    assert reg.remaining("b1") == 0 and reg.remaining("travel") == 1
+    reg.mark("apple", 1)
+    reg.mark("apple", -1)          # steht noch in einer zweiten Menge
+    assert reg.remaining("travel") == 1
+    reg.mark("apple", -1)
+    reg.set_present("cat", True)
+    assert reg.remaining("b1") == 2 and reg.eligible("b1") == ["apple", "cat"]
+
+def test_user_deck_members(tmp_path):
+    reg = _registry(tmp_path)
+    reg.reset(["mine", "ours"], [])
+    reg.add_member(USER_DECK, "mine")
+    reg.add_member(USER_DECK, "mine")
+    assert reg.remaining(USER_DECK) == 1
+    reg.reset_members(USER_DECK, ["ours", "mine"])
+    assert reg.remaining(USER_DECK) == 2
+    reg.remove_member(USER_DECK, "Mine")
+    assert reg.words(USER_DECK) == ["ours"] and reg.remaining(USER_DECK) == 1
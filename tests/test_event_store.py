@@ -0,0 +1,50 @@
+import datetime as _dt
+import time
+import pytest
+from persistence.event_store import EventStore
+
+@pytest.fixture
+def store(tmp_path):
+    s = EventStore(tmp_path / "events.sqlite3", max_pending=1000)
+    yield s
+    s.close()
+
+def _ts(d: _dt.date, hour: int = 12) -> float:
+    return time.mktime(_dt.datetime(d.year, d.month, d.day, hour).timetuple())
+
+def test_events_are_buffered_and_queried_in_order(store):
+    store.log("review", "Apple", 4, ts=200)
+    store.log("learn", "apple", ts=100)
+    store.log("stt", None, 1.0, ts=300)
+    assert list(store.events(0, 1000)) == [(100, "learn", "apple", None), (200, "review", "apple", 4.0),
+                                           (300, "stt", None, 1.0)]
+    assert list(store.events(0, 1000, kind="review")) == [(200, "review", "apple", 4.0)]
+    assert list(store.events(0, 1000, limit=1)) == [(100, "learn", "apple", None)]
+
+def test_unknown_kind_is_rejected(store):
+    with pytest.raises(ValueError):
+        store.log("nope")
+
+def test_downsample_count_and_avg(store):
+    for ts, v in ((0, 1.0), (5, 0.0), (15, 1.0)):
+        store.log("stt", "w", v, ts=ts)
+    assert store.downsample("stt", 0, 20, 2) == [2, 1]
+    assert store.downsample("stt", 0, 20, 2, agg="avg") == [0.5, 1.0]
+
+def test_daily_counts_use_local_days(store):
+    d = _dt.date(2024, 3, 1)
+    store.log("learn", "a", ts=_ts(d, 0))
+    store.log("learn", "b", ts=_ts(d, 23))
+    store.log("learn", "c", ts=_ts(d + _dt.timedelta(days=2)))
+    store.log("review", "c", ts=_ts(d))
+    assert store.daily_counts("learn", d, d + _dt.timedelta(days=2)) == [2, 0, 1]
+    assert store.daily_counts("learn", d, d - _dt.timedelta(days=1)) == []
+
+def test_history_survives_reopen(tmp_path):
+    path = tmp_path / "events.sqlite3"
+    s = EventStore(path)
+    s.log("learn", "a", ts=10)
+    s.close()
+    s = EventStore(path)
+    assert list(s.events(0, 100)) == [(10, "learn", "a", None)]
+    s.close()
@@ -0,0 +1,34 @@
+import pytest
+from models.fuzzy_index import FuzzyIndex, edit_distance
+
+@pytest.mark.parametrize("a, b, d", [
+    ("house", "house", 0),
+    ("house", "hose", 1),
+    ("house", "huose", 1),      # Vertauschung zählt als ein Schritt
+    ("house", "mouse", 1),
+    ("house", "horse", 1),
+    ("kitten", "sitting", 3),
+])
+def test_edit_distance(a, b, d):
+    assert edit_distance(a, b, 3) == d
+
+def test_edit_distance_stops_above_limit():
+    assert edit_distance("abcdef", "uvwxyz", 2) == 3
+
+def test_lookup_orders_by_distance_then_word():
+    ix = FuzzyIndex(["house", "mouse", "horse", "Housing", "tree"])
+    assert ix.lookup("hous", limit=3) == [("house", 1), ("horse", 2), ("mouse", 2)]
+    assert ix.lookup("house", max_distance=1) == [("house", 0), ("horse", 1), ("mouse", 1)]
+    assert ix.lookup("housin") == [("Housing", 1), ("house", 2)]
+
+def test_long_words_match_through_prefix():
+    ix = FuzzyIndex(["information"])
+    assert ix.lookup("infromation") == [("information", 1)]
+    assert ix.lookup("informaton") == [("information", 1)]
+
+def test_remove_and_add():
+    ix = FuzzyIndex(["house"])
+    ix.remove("house")
+    assert ix.lookup("house") == [] and len(ix) == 0
+    ix.add("house")
+    assert ix.lookup("hous") == [("house", 1)]
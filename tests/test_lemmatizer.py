@@ -0,0 +1,43 @@
+import pytest
+from models.lemmatizer import Lemmatizer, candidates
+
+# Ausschnitt aus der B1-Liste: Grundformen, die mit kürzeren Wörtern kollidieren (hat/hate, safe/save)
+KNOWN = {"hat", "hate", "bit", "bite", "safe", "save", "car", "star", "tap", "win", "use",
+         "the", "thing", "stop", "arrive", "box", "visit", "open", "knife", "child", "see"}
+
+@pytest.mark.parametrize("word, lemma", [
+    ("hating", "hate"),
+    ("biting", "bite"),
+    ("saves", "save"),
+    ("caring", "caring"),     # "care" ist nicht bekannt, "car" ist keine Grundform davon
+    ("staring", "staring"),
+    ("stared", "stared"),
+    ("taping", "taping"),
+    ("wining", "wining"),
+    ("using", "use"),
+    ("hats", "hat"),
+    ("stopping", "stop"),
+    ("stopped", "stop"),
+    ("arrived", "arrive"),
+    ("boxes", "box"),
+    ("visited", "visit"),
+    ("opened", "open"),
+    ("knives", "knife"),
+    ("children", "child"),
+    ("saw", "see"),
+    ("thing", "thing"),
+])
+def test_lemma(word, lemma):
+    assert Lemmatizer(KNOWN.__contains__).lemma(word) == lemma
+
+def test_candidates_skip_no_stem_words():
+    assert candidates("thing") == ()
+    assert candidates("news") == ()
+
+def test_clear_drops_cached_results():
+    known = set(KNOWN)
+    lm = Lemmatizer(known.__contains__)
+    assert lm.lemma("walked") == "walked"
+    known.add("walk")
+    lm.clear()
+    assert lm.lemma("walked") == "walk"
@@ -0,0 +1,32 @@
+from models.phrase_matcher import PhraseMatcher, phrase_tokens
+
+def test_phrase_tokens_normalise_apostrophes():
+    assert phrase_tokens("Don’t Give-Up") == ("don't", "give-up")
+
+def test_finds_overlapping_and_nested_phrases():
+    m = PhraseMatcher(["look after", "after all", "all"])
+    assert sorted(m.find_in_text("Look after all of them")) == ["after all", "all", "look after"]
+
+def test_repeated_hits_and_no_partial_matches():
+    m = PhraseMatcher(["give up"])
+    assert list(m.find_in_text("give up, give in, give up")) == ["give up", "give up"]
+    assert list(m.find_in_text("give")) == []
+
+def test_add_and_remove_recompile_lazily():
+    m = PhraseMatcher(["give up"])
+    assert list(m.find_in_text("take off")) == []
+    m.add("take off")
+    m.add("Take Off")       # gleiche Token -> ignoriert
+    assert list(m.find_in_text("take off")) == ["take off"]
+    m.remove("give up")
+    assert list(m.find_in_text("give up")) == []
+    assert len(m) == 1
+
+def test_snapshot_is_independent():
+    m = PhraseMatcher(["give up", "look after"])
+    snap = m.snapshot()
+    m.add("give in")
+    m.remove("look after")
+    text = "give in and look after"
+    assert list(snap.find_in_text(text)) == ["look after"]
+    assert list(m.find_in_text(text)) == ["give in"]
@@ -0,0 +1,19 @@
+from models.prefix_index import PrefixIndex
+
+def test_prefix_lookup_is_case_insensitive_and_sorted():
+    ix = PrefixIndex(["Apple", "apply", "banana", "app", ""])
+    assert list(ix.iter_prefix("AP")) == ["app", "Apple", "apply"]
+    assert ix.count("app") == 3
+    assert ix.count("z") == 0
+    assert "APPLE" in ix and "appl" not in ix
+
+def test_add_and_remove_keep_order():
+    ix = PrefixIndex(["b", "d"])
+    ix.add("c")
+    ix.add("c")
+    ix.add("A")
+    assert list(ix.iter_prefix("")) == ["A", "b", "c", "d"]
+    ix.remove("c")
+    ix.remove("missing")
+    assert list(ix.iter_prefix("")) == ["A", "b", "d"]
+    assert len(ix) == 3
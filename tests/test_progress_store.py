@@ -0,0 +1,39 @@
+from types import SimpleNamespace
+from models.activity import LearnedLog
+from models.review_schedule import ReviewSchedule
+from persistence.progress_store import ProgressStore
+
+def _app(vocabulary):
+    return SimpleNamespace(
+        vocabulary=list(vocabulary), displayed_words=set(), word_history=[], current_word=None,
+        known_words=set(), new_words=set(), known_sequence=[], new_sequence=[], user_words=set(),
+        removed_words=set(), learned_session=[], learned_log=LearnedLog(), review_schedule=ReviewSchedule(),
+        word_details={}, word_ipa={}, learn_order_mode="Zufällig", tongue_twisters=set(), expressions=[],
+        history_index=-1, _recompute_remaining=lambda: None,
+    )
+
+def test_user_words_are_merged_into_sorted_vocabulary(tmp_path):
+    app = _app(["apple", "cat", "dog"])
+    ProgressStore(app, tmp_path / "p.json").apply_snapshot({"user_words": ["Banana", "cat", "zebra", ""]})
+    assert app.vocabulary == ["apple", "banana", "cat", "dog", "zebra"]
+    assert app.user_words == {"banana", "cat", "zebra"}
+
+def test_snapshot_round_trip(tmp_path):
+    src = _app(["apple", "cat", "dog"])
+    src.known_words = {"cat"}
+    src.known_sequence = ["cat"]
+    src.new_words = {"dog"}
+    src.new_sequence = ["dog"]
+    src.removed_words = {"apple"}
+    src.learned_log = LearnedLog({"cat": "2024-01-01"})
+    src.review_schedule.grade("cat", 4, now=1_700_000_000)
+    src.expressions = ["give up"]
+    snap = ProgressStore(src, tmp_path / "p.json").build_snapshot()
+
+    dst = _app(["apple", "cat", "dog"])
+    ProgressStore(dst, tmp_path / "p.json").apply_snapshot(snap)
+    assert dst.known_words == {"cat"} and dst.new_sequence == ["dog"]
+    assert dst.removed_words == {"apple"} and dst.expressions == ["give up"]
+    assert dict(dst.learned_log) == {"cat": "2024-01-01"} and dst.learned_log.day_counts.total() == 1
+    assert dst.review_schedule.get("cat") == src.review_schedule.get("cat")
+    assert ProgressStore(dst, tmp_path / "p.json").build_snapshot() == snap
@@ -0,0 +1,71 @@
+import random
+from models.review_schedule import DAY, RELEARN, MIN_EASE, DueQueue, ReviewSchedule
+
+NOW = 1_700_000_000.0
+
+def test_sm2_intervals():
+    s = ReviewSchedule()
+    assert s.grade("w", 4, NOW) == NOW + DAY
+    assert s.grade("w", 4, NOW) == NOW + 6 * DAY
+    s.grade("w", 4, NOW)
+    assert s.get("w")["interval"] == 15.0
+    assert s.grade("w", 1, NOW) == NOW + RELEARN
+    st = s.get("w")
+    assert st["reps"] == 0 and st["lapses"] == 1 and st["interval"] == 0.0
+
+def test_ease_never_drops_below_minimum():
+    s = ReviewSchedule()
+    for _ in range(20):
+        s.grade("w", 0, NOW)
+    assert abs(s.get("w")["ease"] - MIN_EASE) < 1e-6
+
+def test_forget_reuses_slots_and_rename_keeps_state():
+    s = ReviewSchedule()
+    s.grade("a", 5, NOW)
+    s.grade("b", 4, NOW)
+    s.forget("a")
+    assert "a" not in s and len(s) == 1
+    s.grade("c", 3, NOW)
+    assert s.get("c")["reps"] == 1 and s.get("c")["ease"] < 2.5
+    s.rename("b", "bee")
+    assert "b" not in s and s.due("bee") == NOW + DAY
+    s.rename("c", "bee")     # Ziel hat schon einen Zustand -> bleibt
+    assert "c" not in s and s.due("bee") == NOW + DAY
+
+def test_json_round_trip_and_bad_input():
+    s = ReviewSchedule()
+    s.grade("b", 4, NOW)
+    s.grade("a", 1, NOW)
+    s.forget("b")
+    s.grade("c", 5, NOW)
+    obj = s.to_json()
+    assert obj["words"] == ["a", "c"]
+    t = ReviewSchedule.from_json(obj)
+    assert t.get("a")["lapses"] == 1 and int(t.due("c")) == int(NOW + DAY)
+    assert len(ReviewSchedule.from_json({"words": ["x"], "due": []})) == 0
+    assert len(ReviewSchedule.from_json(None)) == 0
+    assert ReviewSchedule().to_json() == {}
+
+def test_due_queue_matches_brute_force():
+    rng = random.Random(7)
+    s = ReviewSchedule()
+    keys = [f"w{i}" for i in range(200)]
+    learned = {k: rng.uniform(0, 1e6) for k in keys}
+    q = DueQueue(s, keys, default_due=learned.get)
+    live = set(keys)
+    for step in range(500):
+        top = q.peek()
+        want = min(((s.due(k) if k in s else learned[k]), k) for k in live)
+        assert top == (want[1], want[0])
+        if step % 7 == 0:
+            q.discard(top[0])
+            live.discard(top[0])
+        else:
+            s.grade(top[0], rng.choice((1, 3, 4, 5)), NOW + step)
+            q.update(top[0])
+    assert len(q) == len(live)
+
+def test_due_queue_empty():
+    q = DueQueue(ReviewSchedule(), ["a"])
+    q.discard("a")
+    assert q.peek() is None
@@ -0,0 +1,39 @@
+from models.search_index import SearchIndex, detail_texts, tokenize
+
+def _index():
+    ix = SearchIndex()
+    ix.set_entry("apple", ["a round fruit", "She ate an apple."])
+    ix.set_entry("give up", ["stop trying"])
+    ix.set_entry("pineapple", ["tropical fruit"])
+    return ix
+
+def test_tokenize_lowercases_and_keeps_hyphens():
+    assert tokenize("Mother-in-law's CAR") == ["mother-in-law's", "car"]
+
+def test_search_head_and_body_substrings():
+    hits = _index().search("appl")
+    assert hits["head"] == {"apple", "pineapple"}
+    assert hits["body"] == {"apple"}
+    assert _index().search("fruit")["body"] == {"apple", "pineapple"}
+
+def test_all_query_tokens_must_match():
+    assert _index().search("round fruit")["body"] == {"apple"}
+
+def test_filter_keeps_order_head_hits_first():
+    assert _index().filter(["pineapple", "give up", "apple"], "fruit") == ["pineapple", "apple"]
+    assert _index().filter(["pineapple", "apple"], "apple") == ["pineapple", "apple"]
+    assert _index().filter(["b", "a"], "  ") == ["b", "a"]
+
+def test_set_entry_replaces_and_remove_frees_tokens():
+    ix = _index()
+    ix.set_entry("apple", ["a company"])
+    assert "apple" not in ix.search("fruit")["body"]
+    ix.remove("pineapple")
+    assert ix.search("tropical")["body"] == set()
+    assert len(ix) == 2 and "pineapple" not in ix
+    ix.set_entry("banana", ["yellow"])
+    assert ix.search("yell")["body"] == {"banana"}
+
+def test_detail_texts_accepts_old_single_example():
+    details = [{"meaning": " fruit ", "examples": ["one", 2]}, {"example": "old style"}]
+    assert detail_texts(details) == ["fruit", "one", "old style"]
@@ -0,0 +1,57 @@
+import json
+import struct
+import pytest
+from models.mmap_table import MappedTable
+from models.vocab_cache import VocabCache, cache_path, load_words, main, parse_words
+
+def test_parse_words_normalises():
+    data = json.dumps({"words": [" Apple", "apple", "b", 3, "Zoo", "a\nb"]}).encode()
+    assert parse_words(data) == ["apple", "zoo"]
+    assert parse_words(b'["x1", "y2"]') == ["x1", "y2"]
+
+def test_load_words_builds_and_reuses_cache(tmp_path):
+    src = tmp_path / "list.json"
+    src.write_text(json.dumps({"words": ["Cat", "äpfel", "dog"]}), encoding="utf-8")
+    assert load_words(src) == ["cat", "dog", "äpfel"]
+    vc = VocabCache(cache_path(src))
+    try:
+        assert len(vc) == 3
+        assert "CAT" in vc and "äpfel" in vc and "cow" not in vc
+    finally:
+        vc.close()
+    stamp = cache_path(src).stat().st_mtime_ns
+    assert load_words(src) == ["cat", "dog", "äpfel"]
+    assert cache_path(src).stat().st_mtime_ns == stamp
+    src.write_text(json.dumps(["cow"]), encoding="utf-8")
+    assert load_words(src) == ["cow"]
+
+def test_broken_cache_is_empty_and_gets_rebuilt(tmp_path):
+    src = tmp_path / "list.json"
+    src.write_text('["cat"]', encoding="utf-8")
+    cache_path(src).write_bytes(b"VVC1" + b"\0" * 10)
+    vc = VocabCache(cache_path(src))
+    assert vc.digest is None and len(vc) == 0 and "cat" not in vc
+    assert load_words(src) == ["cat"]
+
+def test_cli_reports_up_to_date(tmp_path, capsys):
+    src = tmp_path / "list.json"
+    src.write_text('["cat"]', encoding="utf-8")
+    assert main([str(src)]) == 0
+    assert main([str(src)]) == 0
+    assert capsys.readouterr().out.splitlines()[-1].endswith("up to date")
+
+def test_mapped_table_columns_and_truncation(tmp_path):
+    header = struct.Struct("<4sI")
+    path = tmp_path / "t.bin"
+    path.write_bytes(header.pack(b"TST1", 2) + struct.pack("<2I", 7, 9) + struct.pack("<H", 5))
+    t = MappedTable(path, header, b"TST1")
+    try:
+        assert t.header == (b"TST1", 2)
+        assert list(t.column("I", 2)) == [7, 9]
+        assert list(t.column("H", 1)) == [5]
+        with pytest.raises(ValueError):
+            t.column("H", 1)
+    finally:
+        t.close()
+    with pytest.raises(ValueError):
+        MappedTable(path, header, b"XXXX").close()
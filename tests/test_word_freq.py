@@ -0,0 +1,21 @@
+from models.word_freq import WordFrequency, write_table
+
+def test_lookup_and_duplicates(tmp_path):
+    path = tmp_path / "freq.bin"
+    n = write_table([("the", 7.73), ("Cat", 4.5), ("cat", 4.9), ("x y", 3), ("naïve", 2)], path)
+    assert n == 2
+    wf = WordFrequency(path)
+    try:
+        assert len(wf) == 2
+        assert wf.zipf("THE") == 7.73 and wf.zipf("cat") == 4.9
+        assert wf.zipf("dog") == 0.0 and "dog" not in wf
+    finally:
+        wf.close()
+
+def test_missing_or_truncated_table_is_empty(tmp_path):
+    assert WordFrequency(tmp_path / "none.bin").zipf("the") == 0.0
+    path = tmp_path / "freq.bin"
+    write_table([("the", 7.0), ("cat", 4.0)], path)
+    path.write_bytes(path.read_bytes()[:-2])
+    wf = WordFrequency(path)
+    assert len(wf) == 0 and wf.zipf("the") == 0.0
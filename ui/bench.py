@@ -0,0 +1,131 @@
+import argparse
+import time
+
+def _timed(fn, runs: int) -> float:
+    t0 = time.perf_counter()
+    for i in range(runs):
+        fn(i)
+    return (time.perf_counter() - t0) * 1000.0 / runs
+
+def bench_charts(runs: int = 200):
+    # Kosten eines Diagramm-Redraws: Neuaufbau ohne/mit Textur-Cache und reines Verschieben bei Resize
+    from kivy.core.window import Window  # noqa: F401  (GL-Kontext für Texturen)
+    from ui.widgets import BarChart, GroupedBarChart, label_textures
+
+    labels = [f"{d:02d}.10" for d in range(1, 11)]
+    values = [(i * 7) % 23 for i in range(10)]
+    bar = BarChart(labels=labels, values=values, show_values=True, size=(800, 300))
+    grouped = GroupedBarChart(labels=labels, series_a=values, series_b=values[::-1], size=(800, 260))
+
+    results = []
+    for name, chart in (("BarChart", bar), ("GroupedBarChart", grouped)):
+        def cold(i, chart=chart):
+            label_textures.clear()
+            chart._redraw()
+        results.append((name, "rebuild, cold cache", _timed(cold, runs)))
+        results.append((name, "rebuild, warm cache", _timed(lambda i, chart=chart: chart._redraw(), runs)))
+        def resize(i, chart=chart):
+            chart.size = (800 + i % 50, 300)
+            chart._layout()
+        results.append((name, "resize", _timed(resize, runs)))
+        def navigate(i, chart=chart):
+            # wie die Dashboard-Navigation: alle Daten auf einmal, ein Neuaufbau
+            shifted = values[i % 10:] + values[:i % 10]
+            if isinstance(chart, BarChart):
+                chart.set_data(labels=labels, values=shifted, max_value=max(shifted))
+            else:
+                chart.set_data(labels=labels, series_a=shifted, series_b=shifted[::-1], max_value=max(shifted))
+        results.append((name, "set_data", _timed(navigate, runs)))
+    for name, case, ms in results:
+        print(f"{name:16s} {case:20s} {ms:8.3f} ms")
+
+def bench_heatmap(runs: int = 50, years: int = 10):
+    # volle Befüllung eines Jahrzehnts vs. Änderung eines einzelnen Tages
+    import datetime as _dt
+    import numpy as np
+    from kivy.core.window import Window  # noqa: F401
+    from ui.widgets import CalendarHeatmap
+
+    start = _dt.date(_dt.date.today().year - years + 1, 1, 1)
+    counts = np.random.default_rng(0).poisson(3, size=366 * years).astype(np.int32)
+    heatmap = CalendarHeatmap(size=(760, 110 * years))
+    full = _timed(lambda i: heatmap.set_counts(start, counts), runs)
+    one = _timed(lambda i: heatmap.set_count(start + _dt.timedelta(days=i % 300), 1), runs)
+    print(f"CalendarHeatmap  set_counts ({years} years) {full:8.3f} ms")
+    print(f"CalendarHeatmap  set_count (one day)   {one:8.3f} ms")
+
+def bench_buttons(frames: int = 120, count: int = 2000):
+    # Frame-Zeit mit <count> sichtbaren RoundedButtons, Stencil-Maske vs. direktes RoundedRectangle
+    from kivy.base import EventLoop
+    from kivy.core.window import Window
+    from kivy.uix.gridlayout import GridLayout
+    from ui.widgets import RoundedButton
+
+    EventLoop.ensure_window()
+    cols = 50
+    for stencil_free in (False, True):
+        RoundedButton.stencil_free = stencil_free
+        grid = GridLayout(cols=cols, spacing=1, size=Window.size)
+        for i in range(count):
+            grid.add_widget(RoundedButton(text=str(i), font_size=8, background_normal="",
+                                          background_color=(0.18, 0.18, 0.18, 1)))
+        Window.add_widget(grid)
+        for _ in range(10):
+            EventLoop.idle()
+        t0 = time.perf_counter()
+        for _ in range(frames):
+            grid.canvas.ask_update()
+            EventLoop.idle()
+        ms = (time.perf_counter() - t0) * 1000.0 / frames
+        Window.remove_widget(grid)
+        print(f"RoundedButton x{count}  {'rounded rect' if stencil_free else 'stencil':12s} {ms:8.3f} ms/frame")
+    RoundedButton.stencil_free = True
+
+def bench_scheduler(runs: int = 200, items: int = 100_000):
+    # Review-Planung mit <items> Karten: Heap aufbauen, nächste Karte + Bewertung, Speichern/Laden
+    import json
+    import random
+    from models.review_schedule import DueQueue, ReviewSchedule
+
+    rng = random.Random(0)
+    now = time.time()
+    schedule = ReviewSchedule()
+    keys = [f"word{i:06d}" for i in range(items)]
+    for k in keys:
+        schedule.grade(k, rng.choice((3, 4, 5)), now=now - rng.random() * 30 * 86400)
+    t0 = time.perf_counter()
+    queue = DueQueue(schedule, keys)
+    build = (time.perf_counter() - t0) * 1000.0
+    def step(i):
+        key, _due = queue.peek()
+        schedule.grade(key, rng.choice((1, 3, 4, 5)), now=now)
+        queue.update(key)
+    per_card = _timed(step, runs * 50)
+    t0 = time.perf_counter()
+    data = json.dumps(schedule.to_json(), separators=(",", ":"))
+    save = (time.perf_counter() - t0) * 1000.0
+    t0 = time.perf_counter()
+    ReviewSchedule.from_json(json.loads(data))
+    load = (time.perf_counter() - t0) * 1000.0
+    print(f"ReviewSchedule x{items}  build queue        {build:8.3f} ms")
+    print(f"ReviewSchedule x{items}  next + grade       {per_card:8.3f} ms")
+    print(f"ReviewSchedule x{items}  save ({len(data) // 1024} KiB)      {save:8.3f} ms")
+    print(f"ReviewSchedule x{items}  load               {load:8.3f} ms")
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Micro-benchmarks for the custom widgets.")
+    ap.add_argument("what", choices=("charts", "heatmap", "buttons", "scheduler"))
+    ap.add_argument("--runs", type=int, default=200)
+    args = ap.parse_args(argv)
+    if args.what == "charts":
+        bench_charts(args.runs)
+    elif args.what == "heatmap":
+        bench_heatmap(args.runs)
+    elif args.what == "buttons":
+        bench_buttons(args.runs)
+    elif args.what == "scheduler":
+        bench_scheduler(args.runs)
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,75 @@
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.label import Label
+from kivy.uix.widget import Widget
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
+from ui.widgets import RoundedButton
+from ui.text_metrics import text_metrics
+
+HEADER_HEIGHT = 56
+
+def entry_height(lines, width) -> int:
+    # lines: [(text, font_size, color, indent_left, font_name)]
+    return HEADER_HEIGHT + sum(
+        text_metrics.wrapped_height(text, fs, max(10, width - indent - 4), font_name)
+        for text, fs, _color, indent, font_name in lines
+    )
+
+class LearnedEntryView(RecycleDataViewBehavior, BoxLayout):
+    # Eine Zeile der "Learned words"-Liste: Kopf (Hören + Wort) und die Detailzeilen.
+    # Nur sichtbare Einträge haben eine View; Höhen kommen vorberechnet aus den Daten.
+    def __init__(self, **kwargs):
+        super().__init__(orientation='vertical', **kwargs)
+        self._data = {}
+        header = BoxLayout(orientation='horizontal', size_hint_y=None, height=HEADER_HEIGHT, spacing=6)
+        play_btn = RoundedButton(text='Hören', size_hint=(None, 1), width=80, font_size=24,
+                                 background_normal='', background_color=(0.25, 0.55, 0.9, 1))
+        self._word_btn = RoundedButton(
+            text="", font_size=35, size_hint=(1, None), height=HEADER_HEIGHT,
+            background_normal='', background_color=(0, 0, 0, 0), color=(0.95, 0.98, 1, 1),
+            halign='left', valign='middle'
+        )
+        self._word_btn.padding = (8, 0)
+        self._word_btn.bind(size=lambda inst, val: setattr(inst, 'text_size', (inst.width, inst.height)))
+        play_btn.bind(on_release=lambda *_: self._data.get("on_play", lambda w: None)(self._data.get("word")))
+        self._word_btn.bind(on_release=lambda *_: self._data.get("on_open", lambda w: None)(self._data.get("word")))
+        header.add_widget(play_btn)
+        header.add_widget(self._word_btn)
+        self.add_widget(header)
+        self._rows = []    # wiederverwendete Detailzeilen (row, spacer, label)
+        self._shown = 0
+        self.bind(width=lambda *_: self._fit())
+
+    def refresh_view_attrs(self, rv, index, data):
+        # Größe setzt der Layout-Manager; hier nur Inhalt übernehmen
+        self._data = data
+        self._word_btn.state = 'normal'
+        self._word_btn.text = data.get("word", "")
+        lines = data.get("lines", ())
+        while len(self._rows) < len(lines):
+            row = BoxLayout(orientation='horizontal', size_hint_y=None, spacing=0)
+            spacer = Widget(size_hint=(None, 1), width=0)
+            lbl = Label(halign='left', valign='top', size_hint_y=None)
+            row.add_widget(spacer)
+            row.add_widget(lbl)
+            self._rows.append((row, spacer, lbl, lbl.font_name))
+        for row, *_ in self._rows[len(lines):self._shown]:
+            self.remove_widget(row)
+        for i, (text, fs, color, indent, font_name) in enumerate(lines):
+            row, spacer, lbl, default_font = self._rows[i]
+            spacer.width = indent
+            lbl.text = text
+            lbl.font_size = fs
+            lbl.color = color
+            lbl.font_name = font_name or default_font
+            if i >= self._shown:
+                self.add_widget(row)
+        self._shown = len(lines)
+        self._fit()
+
+    def _fit(self):
+        lines = self._data.get("lines", ())
+        for i, (text, fs, _color, indent, font_name) in enumerate(lines[:self._shown]):
+            row, _spacer, lbl, _df = self._rows[i]
+            avail = max(10, self.width - indent - 4)
+            lbl.text_size = (avail, None)
+            row.height = lbl.height = text_metrics.wrapped_height(text, fs, avail, font_name)
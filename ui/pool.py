@@ -0,0 +1,113 @@
+from collections import defaultdict
+from kivy.clock import Clock
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.label import Label
+from kivy.uix.widget import Widget
+from ui.widgets import RoundedButton
+from ui.text_metrics import text_metrics
+
+class WidgetPool:
+    # Zeilen/Labels der Popup-Listen werden beim Neuaufbau zurückgegeben und wiederverwendet.
+    # Pro Eltern-Grid gibt es genau eine Breiten-Bindung; sie passt alle Pool-Zeilen in einem Durchlauf an.
+    def __init__(self, limit: int = 400):
+        self.limit = limit
+        self._free = defaultdict(list)
+
+    def acquire(self, kind: str, factory):
+        free = self._free[kind]
+        w = free.pop() if free else factory()
+        w._pool_kind = kind
+        return w
+
+    def release(self, widget):
+        if widget.parent is not None:
+            widget.parent.remove_widget(widget)
+        kind = getattr(widget, "_pool_kind", None)
+        if kind is None:
+            return
+        unbind = getattr(widget, "_pool_unbind", None)
+        if unbind is not None:
+            unbind()
+            widget._pool_unbind = None
+        if len(self._free[kind]) < self.limit:
+            self._free[kind].append(widget)
+
+    def release_children(self, parent):
+        for child in list(parent.children):
+            self.release(child)
+
+    def _watch(self, parent, fitted: bool = False):
+        # eine gesammelte Neuberechnung pro Frame statt einer pro Label
+        trig = getattr(parent, "_pool_relayout", None)
+        if trig is None:
+            trig = Clock.create_trigger(lambda dt: self.relayout(parent), 0)
+            parent._pool_relayout = trig
+            parent.bind(width=lambda *_: trig())
+        if not fitted:
+            trig()
+
+    def relayout(self, parent):
+        width = parent.width
+        for child in parent.children:
+            fit = getattr(child, "_pool_fit", None)
+            if fit is not None:
+                fit(width)
+
+    # ---- Zeilentypen ----
+    def wrapped_label(self, parent, text, font_size, color=(0.95, 0.98, 1, 1), indent_left=0,
+                      font_name=None, extra_pad=6):
+        row = self.acquire("wrapped_label", self._new_wrapped_row)
+        lbl = row._label
+        row._indent = indent_left
+        row._extra_pad = extra_pad
+        row._spacer.width = indent_left
+        lbl.text = text
+        lbl.font_size = font_size
+        lbl.color = color
+        lbl.font_name = font_name or row._default_font
+        fitted = parent.width > 1
+        if fitted:
+            row._pool_fit(parent.width)
+        else:
+            row.height = lbl.height = font_size + 8
+        parent.add_widget(row)
+        self._watch(parent, fitted)
+        return lbl
+
+    def _new_wrapped_row(self):
+        row = BoxLayout(orientation='horizontal', size_hint_y=None, height=0, spacing=0)
+        row._spacer = Widget(size_hint=(None, 1), width=0)
+        row._label = Label(halign='left', valign='top', size_hint_y=None)
+        row._default_font = row._label.font_name
+        row.add_widget(row._spacer)
+        row.add_widget(row._label)
+
+        def fit(width):
+            # Höhe aus dem Layout-Cache; die Textur rendert Kivy danach einmal selbst
+            lbl = row._label
+            avail = max(10, width - row._indent - 4)
+            lbl.text_size = (avail, None)
+            h = text_metrics.wrapped_height(lbl.text, lbl.font_size, avail, lbl.font_name, row._extra_pad)
+            lbl.height = h
+            row.height = h
+        row._pool_fit = fit
+        return row
+
+    def list_button(self, parent, text, on_release, height=56, font_size=32, color=(0.95, 0.98, 1, 1)):
+        btn = self.acquire("list_button", self._new_list_button)
+        btn.state = 'normal'
+        btn.text = text
+        btn.height = height
+        btn.font_size = font_size
+        btn.color = color
+        btn.bind(on_release=on_release)
+        btn._pool_unbind = lambda: btn.unbind(on_release=on_release)
+        parent.add_widget(btn)
+        self._watch(parent)
+        return btn
+
+    def _new_list_button(self):
+        btn = RoundedButton(size_hint_y=None, background_normal='', background_color=(0, 0, 0, 0),
+                            halign='left', valign='middle')
+        btn._pool_fit = lambda width: setattr(btn, 'text_size', (width, None))
+        return btn
@@ -0,0 +1,39 @@
+from collections import OrderedDict
+from kivy.core.text import Label as CoreLabel
+
+class TextMetrics:
+    # Größe umbrochener Texte, ohne eine Textur zu rendern: CoreLabel.render() berechnet nur das Layout.
+    # Schlüssel: (text, font_size, wrap_width, font_name)
+    def __init__(self, capacity: int = 20000):
+        self.capacity = capacity
+        self._items = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def size(self, text, font_size, wrap_width, font_name=None) -> tuple[int, int]:
+        key = (str(text), float(font_size), int(wrap_width), font_name or "")
+        sz = self._items.get(key)
+        if sz is not None:
+            self._items.move_to_end(key)
+            self.hits += 1
+            return sz
+        self.misses += 1
+        opts = {"font_name": font_name} if font_name else {}
+        lbl = CoreLabel(text=key[0], font_size=font_size, text_size=(max(1, key[2]), None), **opts)
+        lbl.resolve_font_name()
+        w, h = lbl.render()
+        sz = (int(w), int(h))
+        self._items[key] = sz
+        if len(self._items) > self.capacity:
+            self._items.popitem(last=False)
+        return sz
+
+    def wrapped_height(self, text, font_size, avail_width, font_name=None, extra_pad=6) -> int:
+        # gleiche Formel wie die umbrochenen Detail-Labels
+        return max(font_size + 6, self.size(text, font_size, avail_width, font_name)[1] + extra_pad)
+
+    def clear(self):
+        self._items.clear()
+        self.hits = self.misses = 0
+
+text_metrics = TextMetrics()
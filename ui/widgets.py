@@ -1,12 +1,26 @@
 from kivy.uix.button import Button
 from kivy.uix.widget import Widget
 from kivy.properties import NumericProperty, ListProperty, StringProperty, BooleanProperty
-from kivy.graphics import Color, Rectangle, RoundedRectangle, StencilPush, StencilUse, StencilUnUse, StencilPop, BorderImage, Line, PushMatrix, PopMatrix, Rotate, Translate
+from kivy.graphics import Color, Rectangle, RoundedRectangle, StencilPush, StencilUse, StencilUnUse, StencilPop, BorderImage, Line, PushMatrix, PopMatrix, Rotate, Translate, Mesh
+from kivy.graphics.texture import Texture
 from kivy.core.text import Label as CoreLabel
 from kivy.metrics import sp
+from kivy.clock import Clock
+from collections import OrderedDict
+import datetime as _dt
+import numpy as np
+
+_DEFAULT_THEME = "atlas://data/images/defaulttheme/"
+
+def _custom_image(src) -> bool:
+    return bool(src) and not str(src).startswith(_DEFAULT_THEME)
 
 class RoundedButton(Button):
     corner_radius = NumericProperty(12)
+    # mit background_normal='' reicht ein RoundedRectangle; die Stencil-Maske bleibt für Bilder,
+    # auch für das Standard-Theme (sonst sähe jeder Theme-Button anders aus). Das gedrückte
+    # Theme-Bild wird bei diesen Buttons durch die abgedunkelte Farbe ersetzt.
+    stencil_free = True
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -69,6 +83,13 @@ class RoundedButton(Button):
         self.canvas.before.clear()
         self.canvas.after.clear()
         r = float(self.corner_radius)
+        self._use_stencil = not self.stencil_free or bool(self._orig_background_normal) or _custom_image(self._orig_background_down)
+        if not self._use_stencil:
+            with self.canvas.before:
+                self._bg_color_instr = Color(*self._flat_color())
+                self._bg_rect = RoundedRectangle(pos=self.pos, size=self.size, radius=[(r, r)] * 4)
+            self._bg_img = None
+            return
         with self.canvas.before:
             StencilPush()
             Color(1, 1, 1, 1)
@@ -87,6 +108,13 @@ class RoundedButton(Button):
             self._mask_after = RoundedRectangle(pos=self.pos, size=self.size, radius=[(r, r)] * 4)
             StencilPop()
 
+    def _flat_color(self):
+        # Ersatz für das gedrückte Theme-Bild: etwas dunkler
+        c = list(self.background_color)
+        if self.state == "down":
+            c[:3] = [v * 0.75 for v in c[:3]]
+        return c
+
     def on_corner_radius(self, *_):
         self._update_canvas()
 
@@ -97,15 +125,17 @@ class RoundedButton(Button):
         radius = [(r, r)] * 4
         pos = self.pos
         size = self.size
-        if hasattr(self, "_mask"):
+        if self._use_stencil and hasattr(self, "_mask"):
             self._mask.pos = pos
             self._mask.size = size
             self._mask.radius = radius
         if hasattr(self, "_bg_color_instr"):
-            self._bg_color_instr.rgba = self.background_color
+            self._bg_color_instr.rgba = self.background_color if self._use_stencil else self._flat_color()
         if hasattr(self, "_bg_rect"):
             self._bg_rect.pos = pos
             self._bg_rect.size = size
+            if not self._use_stencil:
+                self._bg_rect.radius = radius
         if getattr(self, "_bg_img", None) is not None:
             self._bg_img.pos = pos
             self._bg_img.size = size
@@ -114,12 +144,54 @@ class RoundedButton(Button):
             except Exception:
                 pass
             self._bg_img.source = self._current_source() or ""
-        if hasattr(self, "_mask_after"):
+        if self._use_stencil and hasattr(self, "_mask_after"):
             self._mask_after.pos = pos
             self._mask_after.size = size
             self._mask_after.radius = radius
 
-class BarChart(Widget):
+class TextureCache:
+    # LRU über gerenderte Beschriftungen (text, font_size, color) -> Texture, von allen Diagrammen geteilt
+    def __init__(self, capacity: int = 512):
+        self.capacity = capacity
+        self._items = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, text, font_size, color=(1, 1, 1, 1)):
+        key = (str(text), float(font_size), tuple(color))
+        tex = self._items.get(key)
+        if tex is not None:
+            self._items.move_to_end(key)
+            self.hits += 1
+            return tex
+        self.misses += 1
+        lbl = CoreLabel(text=key[0], font_size=font_size, color=key[2])
+        lbl.refresh()
+        tex = lbl.texture
+        self._items[key] = tex
+        if len(self._items) > self.capacity:
+            self._items.popitem(last=False)
+        return tex
+
+    def clear(self):
+        self._items.clear()
+        self.hits = self.misses = 0
+
+label_textures = TextureCache()
+
+class _BatchedChart:
+    # Property-Änderungen sammeln sich zu höchstens einem Neuaufbau bzw. Layout pro Frame
+    def _init_triggers(self):
+        self._trigger_redraw = Clock.create_trigger(lambda dt: self._redraw(), -1)
+        self._trigger_layout = Clock.create_trigger(lambda dt: self._layout(), -1)
+
+    def set_data(self, **props):
+        # mehrere Properties setzen und genau einmal neu aufbauen
+        for name, value in props.items():
+            setattr(self, name, value)
+        self._redraw()
+
+class BarChart(_BatchedChart, Widget):
     labels = ListProperty([])
     values = ListProperty([])
     max_value = NumericProperty(0)
@@ -140,68 +212,104 @@ class BarChart(Widget):
     value_offset = NumericProperty(4)
 
     def __init__(self, **kwargs):
+        self._built = False
+        self._init_triggers()
         super().__init__(**kwargs)
-        cb = self._redraw
-        self.bind(pos=cb, size=cb, labels=cb, values=cb, max_value=cb,
-                  label_sp=cb, x_label_angle=cb, padding=cb,
-                  show_values=cb, value_sp=cb, value_color=cb, value_format=cb, value_offset=cb,
-                  bar_colors=cb)  
+        cb = self._trigger_redraw
+        # Inhalt ändert die Instruktionen; Position/Größe/Skalierung verschieben sie nur
+        self.bind(labels=cb, values=cb, label_sp=cb, x_label_angle=cb,
+                  show_values=cb, value_sp=cb, value_color=cb, value_format=cb,
+                  bar_colors=cb)
+        lay = self._trigger_layout
+        self.bind(pos=self._move, size=lay, max_value=lay, padding=lay, value_offset=lay)
 
     def _redraw(self, *args):
+        self._trigger_redraw.cancel()
+        self._trigger_layout.cancel()
         self.canvas.clear()
+        tex_for = label_textures.get
         with self.canvas:
-            PushMatrix(); Translate(self.x, self.y)
-            Color(*self.bg_color); Rectangle(pos=(0, 0), size=(self.width, self.height))
-
-            l, b, r, t = self.padding
-            x0, y0 = l, b
-            x1, y1 = self.width - r, self.height - t
-            w = max(1, x1 - x0); h = max(1, y1 - y0)
+            PushMatrix(); self._origin = Translate(self.x, self.y)
+            Color(*self.bg_color); self._bg_rect = Rectangle(pos=(0, 0))
 
             Color(*self.axis_color)
-            Line(points=[x0, y0, x1, y0], width=1)
-            Line(points=[x0, y0, x0, y1], width=1)
-
-            n = len(self.values)
-            slot = w / n if n else w
-            bar_w = slot * 0.6 if n else 0
-
-            tops = []
-            if n > 0:
-                mv = float(self.max_value or 0) or float(max(self.values) or 1.0)
-                for i, v in enumerate(self.values):
-                    cx = x0 + i * slot + slot / 2.0
-                    left = cx - bar_w / 2.0
-                    bh = (v / mv) * (h - 2)
-                    # Farbe pro Balken (falls vorhanden), sonst fallback
-                    col = (self.bar_colors[i] if i < len(self.bar_colors) and self.bar_colors else self.bar_color)
-                    Color(*col)
-                    Rectangle(pos=(left, y0), size=(bar_w, bh))
-                    tops.append((cx, y0 + bh, v))
-
-            if self.show_values and tops:
+            self._x_axis = Line(width=1)
+            self._y_axis = Line(width=1)
+
+            self._bars = []
+            for i in range(len(self.values)):
+                # Farbe pro Balken (falls vorhanden), sonst fallback
+                col = (self.bar_colors[i] if i < len(self.bar_colors) and self.bar_colors else self.bar_color)
+                Color(*col)
+                self._bars.append(Rectangle())
+
+            self._value_rects = []
+            if self.show_values and self.values:
                 Color(*self.value_color)
-                for cx, ty, v in tops:
-                    lbl = CoreLabel(text=self.value_format.format(v), font_size=self.value_sp); lbl.refresh()
-                    tw, th = lbl.texture.size
-                    Rectangle(texture=lbl.texture, pos=(cx - tw / 2.0, ty + self.value_offset), size=(tw, th))
+                for v in self.values:
+                    tex = tex_for(self.value_format.format(v), self.value_sp)
+                    self._value_rects.append(Rectangle(texture=tex, size=tex.size))
 
+            self._label_rects = []
             if self.labels:
                 Color(*self.label_color)
                 ang = float(self.x_label_angle or 0)
-                slot = w / max(1, len(self.labels))
-                for i, txt in enumerate(self.labels):
-                    lbl = CoreLabel(text=str(txt), font_size=self.label_sp); lbl.refresh()
-                    tw, th = lbl.texture.size
-                    cx = x0 + i * slot + slot / 2.0
+                for txt in self.labels:
+                    tex = tex_for(txt, self.label_sp)
+                    tw, th = tex.size
                     if abs(ang) > 0.1:
-                        PushMatrix(); Translate(cx, y0 - 6); Rotate(angle=-ang, origin=(0, 0))
-                        Rectangle(texture=lbl.texture, pos=(-tw / 2.0, -th), size=(tw, th)); PopMatrix()
+                        PushMatrix(); t = Translate(0, 0); Rotate(angle=-ang, origin=(0, 0))
+                        Rectangle(texture=tex, pos=(-tw / 2.0, -th), size=(tw, th)); PopMatrix()
+                        self._label_rects.append((t, None))
                     else:
-                        Rectangle(texture=lbl.texture, pos=(cx - tw / 2.0, y0 - th - 6), size=(tw, th))
+                        self._label_rects.append((None, Rectangle(texture=tex, size=(tw, th))))
             PopMatrix()
+        self._built = True
+        self._layout()
+
+    def _move(self, *args):
+        if not self._built:
+            return self._trigger_redraw()
+        self._origin.xy = (self.x, self.y)
+
+    def _layout(self, *args):
+        if not self._built:
+            return self._redraw()
+        self._trigger_layout.cancel()
+        self._origin.xy = (self.x, self.y)
+        self._bg_rect.size = (self.width, self.height)
+
+        l, b, r, t = self.padding
+        x0, y0 = l, b
+        x1, y1 = self.width - r, self.height - t
+        w = max(1, x1 - x0); h = max(1, y1 - y0)
+        self._x_axis.points = [x0, y0, x1, y0]
+        self._y_axis.points = [x0, y0, x0, y1]
+
+        n = len(self._bars)
+        slot = w / n if n else w
+        bar_w = slot * 0.6 if n else 0
+        if n > 0:
+            mv = float(self.max_value or 0) or float(max(self.values) or 1.0)
+            for i, (rect, v) in enumerate(zip(self._bars, self.values)):
+                cx = x0 + i * slot + slot / 2.0
+                bh = (v / mv) * (h - 2)
+                rect.pos = (cx - bar_w / 2.0, y0)
+                rect.size = (bar_w, bh)
+                if i < len(self._value_rects):
+                    vr = self._value_rects[i]
+                    vr.pos = (cx - vr.size[0] / 2.0, y0 + bh + self.value_offset)
 
-class GroupedBarChart(Widget):
+        slot = w / max(1, len(self._label_rects))
+        for i, (tr, rect) in enumerate(self._label_rects):
+            cx = x0 + i * slot + slot / 2.0
+            if tr is not None:
+                tr.xy = (cx, y0 - 6)
+            else:
+                tw, th = rect.size
+                rect.pos = (cx - tw / 2.0, y0 - th - 6)
+
+class GroupedBarChart(_BatchedChart, Widget):
     labels = ListProperty([])
     series_a = ListProperty([])
     series_b = ListProperty([])
@@ -216,68 +324,255 @@ class GroupedBarChart(Widget):
     label_sp = NumericProperty(16)
     legend_sp = NumericProperty(14)
     def __init__(self, **kwargs):
+        self._built = False
+        self._init_triggers()
         super().__init__(**kwargs)
+        redraw, lay = self._trigger_redraw, self._trigger_layout
         self.bind(
-            size=lambda *_: self._redraw(),
-            pos=lambda *_: self._redraw(),
-            labels=lambda *_: self._redraw(),
-            series_a=lambda *_: self._redraw(),
-            series_b=lambda *_: self._redraw(),
-            color_a=lambda *_: self._redraw(),
-            color_b=lambda *_: self._redraw(),
-            max_value=lambda *_: self._redraw(),
+            pos=self._move,
+            size=lay,
+            labels=redraw,
+            series_a=lay,
+            series_b=lay,
+            color_a=redraw,
+            color_b=redraw,
+            max_value=lay,
         )
     def _draw_text(self, text, x, y, font_size=12, color=(1,1,1,1)):
-        if not text: return
-        lbl = CoreLabel(text=str(text), font_size=font_size, color=color)
-        lbl.refresh()
-        tex = lbl.texture
-        Rectangle(texture=tex, pos=(x, y), size=tex.size)
-    def _redraw(self):
+        if not text: return None
+        tex = label_textures.get(text, font_size, color)
+        return Rectangle(texture=tex, pos=(x, y), size=tex.size)
+    def _redraw(self, *_):
+        self._trigger_redraw.cancel()
+        self._trigger_layout.cancel()
         self.canvas.clear()
+        self._empty = None
+        self._bars_a, self._bars_b, self._label_rects = [], [], []
         with self.canvas:
+            PushMatrix(); self._origin = Translate(self.x, self.y)
             Color(*self.bg_color)
-            Rectangle(pos=self.pos, size=self.size)
+            self._bg_rect = Rectangle(pos=(0, 0))
             n = len(self.labels)
             if n == 0:
-                self._draw_text("Keine Daten", self.x + 10, self.y + self.height/2 - 10, sp(self.label_sp), self.label_color)
-                return
-            pad_l, pad_r, pad_b, pad_t = 28, 12, 28, 24
-            w, h = self.width, self.height
-            plot_w = max(1, w - pad_l - pad_r)
-            plot_h = max(1, h - pad_b - pad_t)
-            vals = []
-            if self.series_a: vals += self.series_a
-            if self.series_b: vals += self.series_b
-            max_v = float(self.max_value or 0) or max(1.0, float(max(vals) if vals else 1))
-            Color(*self.axis_color)
-            Rectangle(pos=(self.x + pad_l, self.y + pad_b - 1), size=(plot_w, 1))
-            Rectangle(pos=(self.x + pad_l, self.y + pad_b), size=(1, plot_h))
-            slot = plot_w / n
-            gap = min(10, slot * 0.1)
-            bw = max(3, (slot - gap) / 2 - gap * 0.5)
-            Color(*self.color_a)
-            for i in range(n):
-                v = float(self.series_a[i]) if i < len(self.series_a) else 0.0
-                bh = 0 if v <= 0 else (plot_h * (v / max_v))
-                x = self.x + pad_l + i * slot + gap
-                Rectangle(pos=(x, self.y + pad_b), size=(bw, bh))
-            Color(*self.color_b)
-            for i in range(n):
-                v = float(self.series_b[i]) if i < len(self.series_b) else 0.0
+                self._empty = self._draw_text("Keine Daten", 10, 0, sp(self.label_sp), self.label_color)
+            else:
+                Color(*self.axis_color)
+                self._x_axis = Rectangle()
+                self._y_axis = Rectangle()
+                Color(*self.color_a)
+                self._bars_a = [Rectangle() for _ in range(n)]
+                Color(*self.color_b)
+                self._bars_b = [Rectangle() for _ in range(n)]
+                for lab in self.labels:
+                    self._label_rects.append(self._draw_text(str(lab), 0, 0, sp(self.label_sp), self.label_color))
+                Color(*self.color_a)
+                self._leg_a = Rectangle(size=(10, 10))
+                self._leg_a_text = self._draw_text(self.title_a, 0, 0, sp(self.legend_sp), self.label_color)
+                Color(*self.color_b)
+                self._leg_b = Rectangle(size=(10, 10))
+                self._leg_b_text = self._draw_text(self.title_b, 0, 0, sp(self.legend_sp), self.label_color)
+            PopMatrix()
+        self._built = True
+        self._layout()
+    def _move(self, *_):
+        if not self._built:
+            return self._trigger_redraw()
+        self._origin.xy = (self.x, self.y)
+    def _layout(self, *_):
+        if not self._built:
+            return self._redraw()
+        self._trigger_layout.cancel()
+        self._origin.xy = (self.x, self.y)
+        w, h = self.width, self.height
+        self._bg_rect.size = (w, h)
+        if self._empty is not None:
+            self._empty.pos = (10, h/2 - 10)
+        n = len(self._bars_a)
+        if n == 0:
+            return
+        pad_l, pad_r, pad_b, pad_t = 28, 12, 28, 24
+        plot_w = max(1, w - pad_l - pad_r)
+        plot_h = max(1, h - pad_b - pad_t)
+        vals = []
+        if self.series_a: vals += self.series_a
+        if self.series_b: vals += self.series_b
+        max_v = float(self.max_value or 0) or max(1.0, float(max(vals) if vals else 1))
+        self._x_axis.pos = (pad_l, pad_b - 1); self._x_axis.size = (plot_w, 1)
+        self._y_axis.pos = (pad_l, pad_b); self._y_axis.size = (1, plot_h)
+        slot = plot_w / n
+        gap = min(10, slot * 0.1)
+        bw = max(3, (slot - gap) / 2 - gap * 0.5)
+        for i in range(n):
+            x = pad_l + i * slot + gap
+            for rect, series, dx in ((self._bars_a[i], self.series_a, 0), (self._bars_b[i], self.series_b, bw + gap)):
+                v = float(series[i]) if i < len(series) else 0.0
                 bh = 0 if v <= 0 else (plot_h * (v / max_v))
-                x = self.x + pad_l + i * slot + gap + bw + gap
-                Rectangle(pos=(x, self.y + pad_b), size=(bw, bh))
-            for i, lab in enumerate(self.labels):
-                x_center = self.x + pad_l + i * slot + slot / 2
-                lbl = CoreLabel(text=str(lab), font_size=sp(self.label_sp), color=self.label_color)
-                lbl.refresh()
-                Rectangle(texture=lbl.texture, pos=(x_center - lbl.texture.width/2, self.y + 6), size=lbl.texture.size)
-            leg_x = self.x + pad_l + 6
-            leg_y = self.y + self.height - 18
-            Color(*self.color_a)
-            Rectangle(pos=(leg_x, leg_y), size=(10, 10))
-            self._draw_text(self.title_a, leg_x + 14, leg_y - 2, sp(self.legend_sp), self.label_color)
-            Color(*self.color_b)
-            Rectangle(pos=(leg_x + 100, leg_y), size=(10, 10))
-            self._draw_text(self.title_b, leg_x + 114, leg_y - 2, sp(self.legend_sp), self.label_color)
\ No newline at end of file
+                rect.pos = (x + dx, pad_b)
+                rect.size = (bw, bh)
+            lbl = self._label_rects[i]
+            if lbl is not None:
+                lbl.pos = (pad_l + i * slot + slot / 2 - lbl.size[0] / 2, 6)
+        leg_x = pad_l + 6
+        leg_y = h - 18
+        self._leg_a.pos = (leg_x, leg_y)
+        if self._leg_a_text is not None:
+            self._leg_a_text.pos = (leg_x + 14, leg_y - 2)
+        self._leg_b.pos = (leg_x + 100, leg_y)
+        if self._leg_b_text is not None:
+            self._leg_b_text.pos = (leg_x + 114, leg_y - 2)
+
+class CalendarHeatmap(Widget):
+    # Tagesaktivität über mehrere Jahre: ein Jahr je Block (53 Wochen x 7 Tage, Montag oben).
+    # Alle Zellen sind ein einziges Mesh; die Farben stehen in einer kleinen Textur
+    # (ein Texel pro Tag), sodass ein geänderter Tag nur ein Pixel neu schreibt.
+    color = ListProperty([0.30, 0.60, 1.00, 1.0])
+    empty_color = ListProperty([1, 1, 1, 0.08])
+    label_color = ListProperty([0.95, 0.98, 1.00, 1.0])
+    label_sp = NumericProperty(14)
+    levels = NumericProperty(4)
+    gap = NumericProperty(2)
+    year_gap = NumericProperty(14)
+    label_width = NumericProperty(48)
+
+    COLS = 54
+
+    def __init__(self, **kwargs):
+        self._years = []
+        self._first = None
+        self._counts = np.zeros(0, dtype=np.int32)
+        self._max = 0
+        self._built = False
+        self._trigger_layout = Clock.create_trigger(lambda dt: self._layout(), -1)
+        super().__init__(**kwargs)
+        lay = self._trigger_layout
+        self.bind(pos=self._move, size=lay, gap=lay, year_gap=lay, label_width=lay)
+        self.bind(color=self._recolor, empty_color=self._recolor, levels=self._recolor)
+
+    # ---- Daten ----
+    def set_counts(self, first_day: _dt.date, counts):
+        # counts[i] = Wert am Tag first_day + i (z. B. DayCounts.counts_between); es werden ganze Jahre gezeigt
+        counts = np.asarray(counts, dtype=np.int32)
+        last_day = first_day + _dt.timedelta(days=max(len(counts) - 1, 0))
+        y0, y1 = first_day.year, last_day.year
+        self._years = list(range(y0, y1 + 1))
+        self._first = _dt.date(y0, 1, 1).toordinal()
+        n = _dt.date(y1, 12, 31).toordinal() - self._first + 1
+        self._counts = np.zeros(n, dtype=np.int32)
+        off = first_day.toordinal() - self._first
+        self._counts[off:off + len(counts)] = counts
+        self._index_cells()
+        self._rebuild()
+
+    def set_count(self, day: _dt.date, count: int):
+        i = day.toordinal() - self._first if self._first is not None else -1
+        if not (0 <= i < len(self._counts)):
+            start = min(day, _dt.date.fromordinal(self._first)) if self._first is not None else day
+            end = max(day, _dt.date.fromordinal(self._first + len(self._counts) - 1)) if self._first is not None else day
+            counts = np.zeros(end.toordinal() - start.toordinal() + 1, dtype=np.int32)
+            if self._first is not None:
+                o = self._first - start.toordinal()
+                counts[o:o + len(self._counts)] = self._counts
+            counts[day.toordinal() - start.toordinal()] = count
+            return self.set_counts(start, counts)
+        old = int(self._counts[i])
+        self._counts[i] = count
+        if count > self._max or (old == self._max and count < old):
+            # Skala ändert sich -> alle Stufen neu
+            return self._recolor()
+        if self._built:
+            pix = self._palette()[self._levels_of(np.array([count]))]
+            self._tex.blit_buffer(pix.tobytes(), pos=(int(self._col[i]), int(self._texy[i])), size=(1, 1),
+                                  colorfmt="rgba", bufferfmt="ubyte")
+            self.canvas.ask_update()
+
+    def _index_cells(self):
+        days = np.arange(len(self._counts)) + (self._first - _dt.date(1970, 1, 1).toordinal())
+        d64 = days.astype("datetime64[D]")
+        jan1 = d64.astype("datetime64[Y]").astype("datetime64[D]")
+        doy = (d64 - jan1).astype(np.int64)
+        jan1_wd = (jan1.astype(np.int64) + 3) % 7  # 1970-01-01 war ein Donnerstag
+        self._yi = d64.astype("datetime64[Y]").astype(np.int64) + 1970 - self._years[0]
+        self._row = (days + 3) % 7
+        self._col = (doy + jan1_wd) // 7
+        self._texy = self._yi * 7 + self._row
+        h = 7 * len(self._years)
+        self._u = ((self._col + 0.5) / self.COLS).astype(np.float32)
+        self._v = ((self._texy + 0.5) / h).astype(np.float32)
+        base = np.arange(len(self._counts), dtype=np.int64)[:, None] * 4
+        self._indices = (base + np.array([0, 1, 2, 2, 3, 0])).ravel().tolist()
+
+    def _palette(self) -> np.ndarray:
+        n = max(1, int(self.levels))
+        empty = np.array(self.empty_color, dtype=np.float64)
+        full = np.array(self.color, dtype=np.float64)
+        t = np.linspace(0.35, 1.0, n)[:, None]
+        rgba = np.vstack([empty, empty * (1 - t) + full * t])
+        return (np.clip(rgba, 0, 1) * 255).astype(np.uint8)
+
+    def _levels_of(self, counts: np.ndarray) -> np.ndarray:
+        n = max(1, int(self.levels))
+        if self._max <= 0:
+            return np.zeros(len(counts), dtype=np.int64)
+        lv = np.ceil(n * np.clip(counts, 0, None) / float(self._max)).astype(np.int64)
+        return np.clip(lv, 0, n)
+
+    # ---- Zeichnen ----
+    def _rebuild(self):
+        self.canvas.clear()
+        self._built = False
+        if not len(self._counts):
+            return
+        self._tex = Texture.create(size=(self.COLS, 7 * len(self._years)), colorfmt="rgba")
+        self._tex.mag_filter = "nearest"
+        self._tex.min_filter = "nearest"
+        self._tex.add_reload_observer(lambda *_: self._recolor())
+        with self.canvas:
+            PushMatrix(); self._origin = Translate(self.x, self.y)
+            Color(1, 1, 1, 1)
+            self._mesh = Mesh(mode="triangles", texture=self._tex, vertices=[], indices=[])
+            Color(*self.label_color)
+            self._year_rects = []
+            for y in self._years:
+                tex = label_textures.get(y, sp(self.label_sp))
+                self._year_rects.append(Rectangle(texture=tex, size=tex.size))
+            PopMatrix()
+        self._built = True
+        self._recolor()
+        self._layout()
+
+    def _recolor(self, *_):
+        if not self._built:
+            return
+        self._max = int(self._counts.max()) if len(self._counts) else 0
+        buf = np.zeros((7 * len(self._years), self.COLS, 4), dtype=np.uint8)
+        buf[self._texy, self._col] = self._palette()[self._levels_of(self._counts)]
+        self._tex.blit_buffer(buf.tobytes(), colorfmt="rgba", bufferfmt="ubyte")
+        self.canvas.ask_update()
+
+    def _move(self, *_):
+        if self._built:
+            self._origin.xy = (self.x, self.y)
+
+    def _layout(self, *_):
+        if not self._built:
+            return
+        self._trigger_layout.cancel()
+        self._origin.xy = (self.x, self.y)
+        ny = len(self._years)
+        w, h = self.width, self.height
+        step = max(1.0, min((w - self.label_width) / float(self.COLS),
+                            (h - self.year_gap * (ny - 1)) / (7.0 * ny)))
+        cs = max(1.0, step - self.gap)
+        block = 7 * step + self.year_gap
+        x = self.label_width + self._col * step
+        y = h - self._yi * block - (self._row + 1) * step
+        verts = np.empty((len(self._counts), 4, 4), dtype=np.float32)
+        verts[:, :, 0] = x[:, None] + np.array([0, cs, cs, 0])
+        verts[:, :, 1] = y[:, None] + np.array([0, 0, cs, cs])
+        verts[:, :, 2] = self._u[:, None]
+        verts[:, :, 3] = self._v[:, None]
+        self._mesh.vertices = verts.ravel().tolist()
+        if len(self._mesh.indices) != len(self._indices):
+            self._mesh.indices = self._indices
+        for yi, rect in enumerate(self._year_rects):
+            rect.pos = (0, h - yi * block - rect.size[1])